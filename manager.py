@@ -5,26 +5,21 @@ and Album Completeness Auditing.
 
 import logging
 import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, Protocol
+from typing import TYPE_CHECKING, Callable, Optional, Protocol
 
-# Internal imports
+# Internal imports. Only what every menu choice needs lives at module scope;
+# the scanner, Spotify, downloader, sync and album pipelines pull in heavy
+# third-party packages, so each handler imports its own on demand.
 from src.logger_setup import setup_logging
 from src.config_manager import get_config
 from src.db_manager import DatabaseManager
-from src.library_scanner import main_scan_library, LibraryScanner
-from src.spotify_client import SpotifyClient
-from src.downloader import main_run_downloader, Downloader
-from src.sync_dap import (
-    SyncMode,
-    SyncRequest,
-    main_run_sync,
-    run_sync_request,
-)
-from src.utils import EnvironmentManager
-from src.album_completer import audit_library, complete_albums
 
-# from src.clear_dupes import find_and_resolve_duplicates # Imported dynamically in main
+if TYPE_CHECKING:
+    from src.sync_dap import SyncMode
 
 # Setup logging first
 setup_logging()
@@ -47,28 +42,61 @@ class CliContext:
 
 CommandHandler = Callable[[CliContext], bool]
 
+# DAP storage is usually FAT/exFAT over USB, where each unlink is a slow
+# metadata round-trip; overlapping them hides most of that latency.
+_UNLINK_WORKERS = 8
+
+
+_RULE = "=" * 60
+
+# Built once and written in a single call: each print() is its own write,
+# which is noticeable over SSH and on low-power hosts.
+_MENU = "\n".join(
+    [
+        "",
+        _RULE,
+        "DAP (Digital Audio Player) Manager",
+        _RULE,
+        " 1. [Setup] Scan local music library",
+        " 2. [Add]   Add new Spotify playlist",
+        " 3. [Fetch] Run download queue manually",
+        " 4. [SYNC]  Sync PLAYLISTS to DAP",
+        " 5. [SYNC]  Sync ENTIRE LIBRARY to DAP",
+        " 6. [SYNC]  Selective sync (by artist)",
+        " 7. [Utils] Clean DAP music directory (resets sync flags)",
+        " 8. [Utils] RECONCILE DAP files to DB (Match existing files by MBID)",
+        " 9. [Utils] CLEAR DUPLICATES (Resolve file conflicts)",
+        " 10. [Batch] Run Batch Sync (Scan -> Queue -> Download -> Sync)",
+        " 11. [Audit] Find Incomplete Albums",
+        " 12. [Auto]  COMPLETE ALBUMS (find gaps -> queue -> download)",
+        " 13. [PULL]  Pull from Jellyfin",
+        " 14. Exit",
+        _RULE,
+        "NOTE: Set SPOTIPY_CLIENT_ID and SPOTIPY_CLIENT_SECRET in your environment.",
+        "",
+    ]
+)
+_MENU_PROMPT = "\nEnter your choice (1-14): "
+
 
 def print_menu():
     """Displays the enhanced main menu."""
-    print("\n" + "=" * 60)
-    print("DAP (Digital Audio Player) Manager")
-    print("=" * 60)
-    print(" 1. [Setup] Scan local music library")
-    print(" 2. [Add]   Add new Spotify playlist")
-    print(" 3. [Fetch] Run download queue manually")
-    print(" 4. [SYNC]  Sync PLAYLISTS to DAP")
-    print(" 5. [SYNC]  Sync ENTIRE LIBRARY to DAP")
-    print(" 6. [SYNC]  Selective sync (by artist)")
-    print(" 7. [Utils] Clean DAP music directory (resets sync flags)")
-    print(" 8. [Utils] RECONCILE DAP files to DB (Match existing files by MBID)")
-    print(" 9. [Utils] CLEAR DUPLICATES (Resolve file conflicts)")
-    print(" 10. [Batch] Run Batch Sync (Scan -> Queue -> Download -> Sync)")
-    print(" 11. [Audit] Find Incomplete Albums")
-    print(" 12. [Auto]  COMPLETE ALBUMS (find gaps -> queue -> download)")
-    print(" 13. [PULL]  Pull from Jellyfin")
-    print(" 14. Exit")
-    print("=" * 60)
-    print("NOTE: Set SPOTIPY_CLIENT_ID and SPOTIPY_CLIENT_SECRET in your environment.")
+    sys.stdout.write(_MENU)
+    sys.stdout.flush()
+
+
+def read_menu_choice() -> Optional[str]:
+    """Prompt for a menu choice; ``None`` means stdin reached EOF."""
+    sys.stdout.write(_MENU_PROMPT)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        return None
+    return line.strip()
+
+
+_FORMAT_FROM_DIGIT = ("flac", "mp3", "opus", "aac")
+_FORMATS = frozenset(_FORMAT_FROM_DIGIT)
 
 
 def get_conversion_format() -> str:
@@ -83,19 +111,9 @@ def get_conversion_format() -> str:
         input("\nEnter choice (1-4) or format name [default: flac]: ").strip().lower()
     )
 
-    format_map = {
-        "1": "flac",
-        "2": "mp3",
-        "3": "opus",
-        "4": "aac",
-        "flac": "flac",
-        "mp3": "mp3",
-        "opus": "opus",
-        "aac": "aac",
-        "": "flac",
-    }
-
-    return format_map.get(choice, "flac")
+    if choice.isdecimal() and 1 <= int(choice) <= len(_FORMAT_FROM_DIGIT):
+        return _FORMAT_FROM_DIGIT[int(choice) - 1]
+    return choice if choice in _FORMATS else "flac"
 
 
 def confirm_large_sync(_track_count: int) -> bool:
@@ -103,15 +121,25 @@ def confirm_large_sync(_track_count: int) -> bool:
     return input("This may take a while. Continue? (y/n): ").strip().lower() == "y"
 
 
+def confirm_tracklist_refresh() -> bool:
+    """Ask whether cached MusicBrainz tracklists should be fetched again."""
+    return (
+        input("Refresh cached MusicBrainz tracklists? (y/n) [n]: ").strip().lower()
+        == "y"
+    )
+
+
 def run_cli_sync(
     db: DatabaseManager,
     config: dict,
-    mode: SyncMode,
+    mode: "SyncMode",
     conversion_format: str,
     *,
     artist_filter: str | None = None,
     reconcile: bool = False,
 ) -> None:
+    from src.sync_dap import SyncRequest, run_sync_request
+
     run_sync_request(
         db,
         config,
@@ -125,53 +153,36 @@ def run_cli_sync(
     )
 
 
-def show_sync_stats(db: DatabaseManager, config):
-    """Display detailed sync statistics."""
-    try:
-        # We need to import here to avoid circular imports
-        from src.sync_dap import EnhancedDapSyncer, ConversionOptions
-
-        # Create a minimal syncer just for stats
-        conversion_opts = ConversionOptions(
-            sample_rate=config.get("conversion_sample_rate", 44100),
-            bit_depth=config.get("conversion_bit_depth", 16),
-            format="flac",
-        )
+# Rough per-track size of a typical album track in each output format.
+_SIZE_ESTIMATES_MB = (("FLAC", 35), ("MP3", 10), ("Opus", 5))
 
-        syncer = EnhancedDapSyncer(
-            db=db,
-            downloader=None,
-            ffmpeg_path=config.get("ffmpeg_path", "ffmpeg"),
-            dap_mount=config.get("dap_mount_point", ""),
-            dap_music_dir=config.get("dap_music_dir_name", "Music"),
-            dap_playlist_dir=config.get("dap_playlist_dir_name", "Playlists"),
-            conversion_options=conversion_opts,
-        )
 
-        stats = syncer.get_sync_stats()
+def show_sync_stats(db: DatabaseManager):
+    """Display detailed sync statistics."""
+    try:
+        stats = db.get_sync_stats()
 
-        print("\n" + "=" * 60)
+        print("\n" + _RULE)
         print("   Library Statistics ")
-        print("=" * 60)
+        print(_RULE)
         print(f" Total tracks in library:  {stats['total_tracks']:,}")
         print(f" Already synced to DAP:   {stats['synced_tracks']:,}")
         print(f" Pending sync:             {stats['pending_tracks']:,}")
         print(f" Sync progress:            {stats['sync_percentage']:.1f}%")
         print(f" Total playlists:          {stats['total_playlists']}")
-        print("=" * 60)
+        print(_RULE)
 
         if stats["pending_tracks"] > 0:
             print(f"\n {stats['pending_tracks']} tracks ready to sync!")
 
-            # Calculate approximate sizes
-            flac_size = stats["pending_tracks"] * 35  # ~35MB per track
-            mp3_size = stats["pending_tracks"] * 10  # ~10MB per track
-            opus_size = stats["pending_tracks"] * 5  # ~5MB per track
-
-            print(f"\nEstimated space needed:")
-            print(f"  FLAC:  ~{flac_size:,} MB ({flac_size/1024:.1f} GB)")
-            print(f"  MP3:   ~{mp3_size:,} MB ({mp3_size/1024:.1f} GB)")
-            print(f"  Opus:  ~{opus_size:,} MB ({opus_size/1024:.1f} GB)")
+            pending = stats["pending_tracks"]
+            lines = ["\nEstimated space needed:"]
+            for label, mb_per_track in _SIZE_ESTIMATES_MB:
+                size_mb = pending * mb_per_track
+                lines.append(
+                    f"  {label + ':':<6} ~{size_mb:,} MB ({size_mb / 1024:.1f} GB)"
+                )
+            print("\n".join(lines))
         else:
             print("\n All tracks are synced!")
 
@@ -182,7 +193,8 @@ def show_sync_stats(db: DatabaseManager, config):
 
 def reconcile_dap(db: DatabaseManager, config: dict):
     """Reconcile tracks already on the DAP with the database."""
-    # Ensure EnhancedDapSyncer is imported or available in the global scope
+    from src.downloader import Downloader
+    from src.library_scanner import LibraryScanner
     from src.sync_dap import EnhancedDapSyncer
 
     # We must instantiate the Syncer using configuration
@@ -221,6 +233,10 @@ def batch_sync():
     except SystemExit:
         return
 
+    from src.downloader import main_run_downloader
+    from src.library_scanner import main_scan_library
+    from src.sync_dap import main_run_sync
+
     db_path = config.db_path
 
     try:
@@ -259,13 +275,11 @@ def run_queue_playlists(db_path, config, playlist_urls):
     :param config: ConfigManager instance
     :param playlist_urls: List of Spotify playlist URLs
     """
+    from src.spotify_client import SpotifyClient
+
     try:
         with DatabaseManager(db_path) as db:
-            spot_client = SpotifyClient(db)
-            for url in playlist_urls:
-                if url.strip():
-                    logger.info(f"Processing playlist: {url}")
-                    spot_client.process_playlist(url)
+            SpotifyClient(db).process_playlists(playlist_urls)
 
         logger.info(f"Queued {len(playlist_urls)} playlists successfully")
         print(f"Successfully queued {len(playlist_urls)} playlists")
@@ -276,10 +290,46 @@ def run_queue_playlists(db_path, config, playlist_urls):
         raise
 
 
+def _scan_tree(path: str):
+    """Return ``(files, directories)`` under ``path`` using one scandir per
+    directory. DAP layouts are shallow (``Music/F00..F49/<file>``), so this
+    plain loop beats os.walk's per-directory generator and list building."""
+    files = []
+    directories = []
+    pending = [path]
+    while pending:
+        directory = pending.pop()
+        directories.append(directory)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    files.append(entry.path)
+    return files, directories
+
+
+def _fast_rmtree(path: str) -> int:
+    """Delete ``path`` recursively and return the number of files removed."""
+    files, directories = _scan_tree(path)
+
+    if os.name == "posix":
+        with ThreadPoolExecutor(max_workers=_UNLINK_WORKERS) as pool:
+            for _ in pool.map(os.unlink, files):
+                pass
+    else:
+        for file_path in files:
+            os.unlink(file_path)
+
+    # Parents are discovered before their children, so reverse order is
+    # post-order: every directory is empty by the time it is removed.
+    for directory in reversed(directories):
+        os.rmdir(directory)
+    return len(files)
+
+
 def clean_dap_music(db, config):
     """Remove all music from DAP (useful for format changes)."""
-    import shutil
-
     dap_mount = config.get("dap_mount_point")
     dap_music_dir = config.get("dap_music_dir_name", "Music")
     dap_music_path = os.path.join(dap_mount, dap_music_dir)
@@ -288,11 +338,14 @@ def clean_dap_music(db, config):
         print(f"\n DAP music path not found: {dap_music_path}")
         return
 
-    # Count files
-    file_count = sum(len(files) for _, _, files in os.walk(dap_music_path))
+    # Walking the whole tree just to count would double the metadata reads
+    # on slow DAP storage; the device's used space is a cheap stand-in and
+    # the exact file count is reported once deletion is done.
+    used_gb = shutil.disk_usage(dap_music_path).used / 1024**3
 
-    print(f"\n WARNING: This will delete {file_count} files from:")
+    print("\n WARNING: This will delete ALL music files from:")
     print(f"    {dap_music_path}")
+    print(f"    (device currently has ~{used_gb:.1f} GB in use)")
     print("\nThis action CANNOT be undone!")
 
     confirm = input("\nType 'DELETE' to confirm: ").strip()
@@ -302,20 +355,25 @@ def clean_dap_music(db, config):
         return
 
     try:
-        shutil.rmtree(dap_music_path)
+        deleted = _fast_rmtree(dap_music_path)
         os.makedirs(dap_music_path)
         logger.info(f"Cleaned DAP music directory: {dap_music_path}")
-        print(f"Deleted {file_count} files from DAP")
+        print(f"Deleted {deleted} files from DAP")
         print("Run a sync to repopulate with your desired format")
     except Exception as e:
         logger.error(f"Failed to clean DAP: {e}")
         print(f"Error: {e}")
 
 
+def _log_section(title: str, level: int = logging.INFO) -> None:
+    """Log a banner for a menu action as one record instead of three."""
+    logger.log(level, "%s\n%s\n%s", _RULE, title, _RULE)
+
+
 def handle_scan_library(context: CliContext) -> bool:
-    logger.info("=" * 60)
-    logger.info("Scanning Local Library")
-    logger.info("=" * 60)
+    from src.library_scanner import main_scan_library
+
+    _log_section("Scanning Local Library")
     print("\n Scanning music library...")
     print("This may take a while on first run (Picard tagging)...\n")
     with DatabaseManager(context.db_path) as db:
@@ -326,17 +384,20 @@ def handle_scan_library(context: CliContext) -> bool:
 
 
 def handle_add_spotify_playlist(context: CliContext) -> bool:
-    logger.info("=" * 60)
-    logger.info("Adding Spotify Playlist")
-    logger.info("=" * 60)
+    _log_section("Adding Spotify Playlist")
+    # src.utils loads acoustid and mediafile; only this handler needs it.
+    from src.utils import EnvironmentManager
+
     if not EnvironmentManager.validate_environment():
         return False
 
+    from src.spotify_client import SpotifyClient, parse_playlist_id
+
     print("\n Enter Spotify playlist URL")
     print("Example: https://open.spotify.com/playlist/37i9dQZF1DXcBWIGoYBM5M")
     playlist_url = input("\nURL: ").strip()
-    if not playlist_url.startswith("http"):
-        print(" Invalid URL. Must be a full Spotify playlist URL.")
+    if parse_playlist_id(playlist_url) is None:
+        print(" Invalid URL. Must be a Spotify playlist URL or playlist ID.")
         return False
 
     print("\nProcessing playlist...")
@@ -348,9 +409,9 @@ def handle_add_spotify_playlist(context: CliContext) -> bool:
 
 
 def handle_download_queue(context: CliContext) -> bool:
-    logger.info("=" * 60)
-    logger.info("Running Download Queue")
-    logger.info("=" * 60)
+    from src.downloader import main_run_downloader
+
+    _log_section("Running Download Queue")
     print("\nProcessing download queue...")
     print("This will download any tracks not found locally.\n")
     with DatabaseManager(context.db_path) as db:
@@ -361,9 +422,9 @@ def handle_download_queue(context: CliContext) -> bool:
 
 
 def handle_playlist_sync(context: CliContext) -> bool:
-    logger.info("=" * 60)
-    logger.info("Syncing Playlists to DAP")
-    logger.info("=" * 60)
+    from src.sync_dap import SyncMode
+
+    _log_section("Syncing Playlists to DAP")
     print("\n Syncing playlist tracks to DAP...")
     conversion_format = get_conversion_format()
     print(f"\n Converting to {conversion_format.upper()}...")
@@ -380,15 +441,15 @@ def handle_playlist_sync(context: CliContext) -> bool:
 
 
 def handle_library_sync(context: CliContext) -> bool:
-    logger.info("=" * 60)
-    logger.info("Syncing Full Library to DAP")
-    logger.info("=" * 60)
+    from src.sync_dap import SyncMode
+
+    _log_section("Syncing Full Library to DAP")
     print("\n  FULL LIBRARY SYNC")
     print("This will sync ALL tracks in your library to the DAP.")
     with DatabaseManager(context.db_path) as db:
-        show_sync_stats(db, context.config._config)
+        show_sync_stats(db)
 
-    print("\n" + "=" * 60)
+    print("\n" + _RULE)
     if input("Continue with full library sync? (y/n): ").strip().lower() != "y":
         print(" Sync cancelled.")
         return False
@@ -409,9 +470,9 @@ def handle_library_sync(context: CliContext) -> bool:
 
 
 def handle_selective_sync(context: CliContext) -> bool:
-    logger.info("=" * 60)
-    logger.info("Selective Sync")
-    logger.info("=" * 60)
+    from src.sync_dap import SyncMode
+
+    _log_section("Selective Sync")
     print("\nSelective Sync")
     print("Enter an artist name to sync only their tracks.")
     print("Leave blank to see all pending tracks.\n")
@@ -433,6 +494,7 @@ def handle_selective_sync(context: CliContext) -> bool:
 
 
 def handle_clean_dap(context: CliContext) -> bool:
+    _log_section("Cleaning DAP Music Directory")
     print("\n> CLEAN: Deleting all files from DAP Music folder...")
     with DatabaseManager(context.db_path) as db:
         clean_dap_music(db, context.config._config)
@@ -441,6 +503,7 @@ def handle_clean_dap(context: CliContext) -> bool:
 
 
 def handle_reconcile_dap(context: CliContext) -> bool:
+    _log_section("Reconciling DAP Files")
     print("\n> RECONCILE: Matching DAP files to local database...")
     with DatabaseManager(context.db_path) as db:
         reconcile_dap(db, context.config._config)
@@ -451,6 +514,7 @@ def handle_reconcile_dap(context: CliContext) -> bool:
 def handle_clear_duplicates(context: CliContext) -> bool:
     from src.clear_dupes import find_and_resolve_duplicates
 
+    _log_section("Clearing Duplicates")
     print("\n> DUPES: Analyzing library for duplicate tracks...")
     with DatabaseManager(context.db_path) as db:
         find_and_resolve_duplicates(db)
@@ -460,7 +524,7 @@ def handle_clear_duplicates(context: CliContext) -> bool:
 
 def handle_batch_sync(_context: CliContext) -> bool:
     print("\n> BATCH: Starting full automation cycle...")
-    logger.info("Starting Batch Sync")
+    _log_section("Batch Sync")
     try:
         batch_sync()
     except Exception as error:
@@ -471,7 +535,10 @@ def handle_batch_sync(_context: CliContext) -> bool:
 
 
 def handle_album_audit(context: CliContext) -> bool:
-    logger.info("Starting Album Completeness Audit")
+    from src.album_completer import audit_library, complete_albums
+    from src.downloader import main_run_downloader
+
+    _log_section("Album Completeness Audit")
     print("\n> AUDIT: Finding incomplete albums...")
     with DatabaseManager(context.db_path) as db:
         incomplete = audit_library(db)
@@ -493,9 +560,10 @@ def handle_album_audit(context: CliContext) -> bool:
         logger.info("Audit finished.")
         return False
 
+    refresh = confirm_tracklist_refresh()
     print("\nQueueing missing tracks (this may take a while)...\n")
     with DatabaseManager(context.db_path) as db:
-        summary = complete_albums(db)
+        summary = complete_albums(db, refresh_tracklists=refresh)
     print(f"\nDone! Queued {summary['tracks_queued']} downloads.")
     print(f"  Albums discovered: {summary['albums_discovered']}")
     print(f"  Errors: {summary['errors']}")
@@ -510,31 +578,36 @@ def handle_album_audit(context: CliContext) -> bool:
 
 
 def handle_complete_albums(context: CliContext) -> bool:
-    logger.info("Starting Album Completion")
-    print("\n" + "=" * 60)
-    print("  ALBUM COMPLETION")
-    print("=" * 60)
-    print("This will:")
-    print("  1. Discover album info for tracks missing it")
-    print("  2. Identify all incomplete albums")
-    print("  3. Queue missing tracks for download")
-    print("  4. Run the downloader")
-    print("=" * 60)
+    from src.album_completer import complete_albums
+    from src.downloader import main_run_downloader
+    from src.library_scanner import main_scan_library
+
+    _log_section("Album Completion")
+    print(
+        f"\n{_RULE}\n  ALBUM COMPLETION\n{_RULE}\n"
+        "This will:\n"
+        "  1. Discover album info for tracks missing it\n"
+        "  2. Identify all incomplete albums\n"
+        "  3. Queue missing tracks for download\n"
+        f"  4. Run the downloader\n{_RULE}"
+    )
     if input("\nProceed? (y/n): ").strip().lower() != "y":
         print("Cancelled.")
         return False
+    refresh = confirm_tracklist_refresh()
 
     print("\n[Step 1-3] Analysing library and queueing missing tracks...\n")
     with DatabaseManager(context.db_path) as db:
-        summary = complete_albums(db)
+        summary = complete_albums(db, refresh_tracklists=refresh)
 
-    print(f"\n{'=' * 60}")
-    print(f"  Albums discovered:    {summary['albums_discovered']}")
-    print(f"  Incomplete albums:    {summary['incomplete_albums']}")
-    print(f"  Tracks queued:        {summary['tracks_queued']}")
-    print(f"  Already queued:       {summary['albums_skipped_existing']}")
-    print(f"  Errors:               {summary['errors']}")
-    print(f"{'=' * 60}")
+    print(
+        f"\n{_RULE}\n"
+        f"  Albums discovered:    {summary['albums_discovered']}\n"
+        f"  Incomplete albums:    {summary['incomplete_albums']}\n"
+        f"  Tracks queued:        {summary['tracks_queued']}\n"
+        f"  Already queued:       {summary['albums_skipped_existing']}\n"
+        f"  Errors:               {summary['errors']}\n{_RULE}"
+    )
 
     if summary["tracks_queued"] <= 0:
         print("\nNo new tracks to download. Library looks good!")
@@ -554,7 +627,7 @@ def handle_complete_albums(context: CliContext) -> bool:
 
 
 def handle_jellyfin_pull(context: CliContext) -> bool:
-    logger.info("Starting Jellyfin Pull")
+    _log_section("Jellyfin Pull")
     if not context.config.jellyfin_enabled:
         print(
             "\nJellyfin not configured. Set jellyfin_url, "
@@ -576,10 +649,8 @@ def handle_jellyfin_pull(context: CliContext) -> bool:
 
 
 def handle_exit(_context: CliContext) -> bool:
-    print("\n" + "=" * 60)
-    print("  Thanks for using DAP Manager!")
-    print("=" * 60)
-    logger.info("Exiting DAP Manager")
+    print(f"\n{_RULE}\n  Thanks for using DAP Manager!\n{_RULE}")
+    _log_section("Exiting DAP Manager")
     return True
 
 
@@ -613,16 +684,18 @@ def main():
     musicbrainz_client.configure(config.contact_email)
     context = CliContext(db_path=config.db_path, config=config)
 
-    print("\n" + "=" * 60)
-    print("  Welcome to DAP Manager!")
-    print("=" * 60)
-    print(f"  Database: {context.db_path}")
-    print(f"  Library:  {config.music_library}")
-    print("=" * 60)
+    print(
+        f"\n{_RULE}\n  Welcome to DAP Manager!\n{_RULE}\n"
+        f"  Database: {context.db_path}\n"
+        f"  Library:  {config.music_library}\n{_RULE}"
+    )
 
     while True:
         print_menu()
-        choice = input("\nEnter your choice (1-14): ").strip()
+        choice = read_menu_choice()
+        if choice is None:
+            handle_exit(context)
+            break
         handler = COMMAND_HANDLERS.get(choice)
         if handler is None:
             print(f"\n Invalid choice '{choice}'. Please enter 1-14.")
@@ -636,20 +709,17 @@ def main():
             logger.info("Operation cancelled by user")
             print("Returning to menu...\n")
         except Exception as error:
-            logger.error("=" * 60)
-            logger.error("AN ERROR OCCURRED")
-            logger.error("=" * 60)
+            _log_section("AN ERROR OCCURRED", logging.ERROR)
             logger.error(f"Error: {error}", exc_info=True)
-            print("\n" + "=" * 60)
-            print("  AN ERROR OCCURRED")
-            print("=" * 60)
-            print(f"Error: {error}")
-            print("\nTroubleshooting:")
-            print("  1. Check 'dap_manager.log' for detailed error info")
-            print("  2. Verify all paths in 'config.json' are correct")
-            print("  3. Ensure DAP is connected (for sync operations)")
-            print("  4. Check environment variables (for Spotify features)")
-            print("=" * 60)
+            print(
+                f"\n{_RULE}\n  AN ERROR OCCURRED\n{_RULE}\n"
+                f"Error: {error}\n"
+                "\nTroubleshooting:\n"
+                "  1. Check 'dap_manager.log' for detailed error info\n"
+                "  2. Verify all paths in 'config.json' are correct\n"
+                "  3. Ensure DAP is connected (for sync operations)\n"
+                f"  4. Check environment variables (for Spotify features)\n{_RULE}"
+            )
             input("\nPress Enter to continue...")
 
 
@@ -40,21 +40,20 @@ def print_playlist_tracks(db: DatabaseManager, playlist_id: str):
     """Fetches and prints all tracks for a specific playlist ID."""
     logger.info(f"Fetching tracks for playlist: {playlist_id}")
 
-    # We use the existing function which already sorts by track_order
-    tracks = db.get_playlist_tracks(playlist_id)
-
-    if not tracks:
+    # Tracks stream in track_order, so the first line prints immediately
+    # and memory stays flat however long the playlist is.
+    total = 0
+    for total, track in enumerate(db.iter_playlist_tracks(playlist_id), start=1):
+        if total == 1:
+            print(f"\n--- Tracks for Playlist ({playlist_id}) ---")
+        print(f"  {total:03d}: [MBID: {track.mbid}] {track}")
+
+    if not total:
         print(f"No tracks found for playlist ID '{playlist_id}'.")
         print("Please check the ID and try again.")
         return
 
-    print(f"\n--- Tracks for Playlist ({playlist_id}) ---")
-
-    # Loop and print in order. The __str__ method on Track is used.
-    for i, track in enumerate(tracks):
-        print(f"  {i+1:03d}: [MBID: {track.mbid}] {track}")
-
-    print(f"\nTotal: {len(tracks)} tracks")
+    print(f"\nTotal: {total} tracks")
 
 
 def main():
@@ -3,13 +3,18 @@ Album completion: discovers album metadata for orphan tracks, identifies
 incomplete albums, and queues missing songs for download.
 """
 
+import json
 import logging
 import unicodedata
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -21,11 +26,18 @@ from typing import (
 )
 
 from . import musicbrainz_client as mb
-from .db_manager import DatabaseManager, DownloadItem
-from .download_request import queue_or_forward
+from .db_manager import DatabaseManager, DownloadItem, LocalAlbumSnapshot
 
 logger = logging.getLogger(__name__)
 
+# Release tracklists are effectively immutable; re-check them monthly so
+# repeat audits skip MusicBrainz (and its rate limit) entirely.
+TRACKLIST_CACHE_DAYS = 30
+# Tracklists fetched ahead of the album currently being queued. Enough to
+# keep the rate-limited fetcher busy without running far past a caller that
+# stops early.
+TRACKLIST_LOOKAHEAD = 4
+
 TrackPosition = Tuple[int, int]
 LocalTrackPosition = Tuple[Optional[int], Optional[int]]
 AlbumTracklist = Dict[TrackPosition, str]
@@ -93,22 +105,40 @@ class TrackReleaseAssignment:
 
 def _parse_album_tracklist(result: Mapping[str, Any]) -> AlbumTracklist:
     """Build a track-position map from a MusicBrainz release response."""
+    media = (result.get("release") or {}).get("medium-list")
+    if not media:
+        return {}
+    try:
+        # Well-formed responses (the norm) parse in a single comprehension.
+        return {
+            (int(medium["position"]), int(track["number"])): (
+                track["recording"]["title"]
+            )
+            for medium in media
+            for track in medium.get("track-list", ())
+        }
+    except (KeyError, TypeError, ValueError):
+        return _parse_album_tracklist_leniently(media)
+
+
+def _parse_album_tracklist_leniently(
+    media: Iterable[Mapping[str, Any]],
+) -> AlbumTracklist:
+    """Per-track parse that skips malformed entries instead of failing."""
     track_map: AlbumTracklist = {}
-    if "release" in result and "medium-list" in result["release"]:
-        for medium in result["release"]["medium-list"]:
+    for medium in media:
+        try:
+            disc_num = int(medium["position"])
+        except (KeyError, TypeError, ValueError):
+            disc_num = 1
+
+        for track in medium.get("track-list", ()):
             try:
-                disc_num = int(medium["position"])
-            except ValueError:
-                disc_num = 1
-
-            if "track-list" in medium:
-                for track in medium["track-list"]:
-                    try:
-                        track_num = int(track["number"])
-                        title = track["recording"]["title"]
-                        track_map[(disc_num, track_num)] = title
-                    except (ValueError, KeyError):
-                        continue
+                track_num = int(track["number"])
+                title = track["recording"]["title"]
+                track_map[(disc_num, track_num)] = title
+            except (ValueError, KeyError):
+                continue
     return track_map
 
 
@@ -129,6 +159,86 @@ def fetch_album_tracklist(release_mbid: str) -> AlbumTracklist:
         return {}
 
 
+def _encode_tracklist(track_map: AlbumTracklist) -> str:
+    return json.dumps(
+        [[disc, track, title] for (disc, track), title in sorted(track_map.items())]
+    )
+
+
+def _decode_tracklist(payload: str) -> AlbumTracklist:
+    return {(disc, track): title for disc, track, title in json.loads(payload)}
+
+
+def _cached_tracklists(
+    db: DatabaseManager, release_mbids: List[str], refresh: bool
+) -> Dict[str, AlbumTracklist]:
+    if refresh:
+        return {}
+    cached = db.get_cached_tracklists(release_mbids, TRACKLIST_CACHE_DAYS)
+    return {mbid: _decode_tracklist(payload) for mbid, payload in cached.items()}
+
+
+def _store_tracklist(
+    db: DatabaseManager, release_mbid: str, track_map: AlbumTracklist
+) -> None:
+    # Failed lookups come back empty; leave them uncached so they retry.
+    if track_map:
+        db.cache_tracklist(release_mbid, _encode_tracklist(track_map))
+
+
+def cached_album_tracklist(
+    db: DatabaseManager, release_mbid: str, refresh: bool = False
+) -> AlbumTracklist:
+    """``fetch_album_tracklist`` backed by the local tracklist cache."""
+    cached = _cached_tracklists(db, [release_mbid], refresh)
+    if release_mbid in cached:
+        return cached[release_mbid]
+    track_map = fetch_album_tracklist(release_mbid)
+    _store_tracklist(db, release_mbid, track_map)
+    return track_map
+
+
+def _prefetch_album_tracklists(
+    db: DatabaseManager,
+    release_mbids: Iterable[str],
+    refresh: bool = False,
+) -> Iterator[AlbumTracklist]:
+    """Yield tracklists in order while later ones are fetched in the background.
+
+    Cached releases are answered from the database up front. A single worker
+    keeps the remaining requests sequential (the shared MusicBrainz limiter
+    still spaces them), but the next request is already waiting on its slot
+    while the caller does database and queue work for the current album.
+    At most ``TRACKLIST_LOOKAHEAD`` releases are fetched ahead of the caller.
+    Cache writes stay on the caller's thread with its connection.
+    """
+    release_mbids = list(release_mbids)
+    cached = _cached_tracklists(db, release_mbids, refresh)
+    to_fetch = iter(dict.fromkeys(m for m in release_mbids if m not in cached))
+    futures: Dict[str, Future] = {}
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mb-tracklist")
+
+    def _submit_next() -> None:
+        release_mbid = next(to_fetch, None)
+        if release_mbid is not None:
+            futures[release_mbid] = pool.submit(
+                fetch_album_tracklist, release_mbid
+            )
+
+    try:
+        for _ in range(TRACKLIST_LOOKAHEAD):
+            _submit_next()
+        for release_mbid in release_mbids:
+            if release_mbid not in cached:
+                track_map = futures.pop(release_mbid).result()
+                _store_tracklist(db, release_mbid, track_map)
+                cached[release_mbid] = track_map
+                _submit_next()
+            yield cached[release_mbid]
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 def _normalize_album_title(value: Any) -> str:
     """Normalize title presentation without broadening semantic identity."""
     normalized = unicodedata.normalize("NFKC", str(value or "")).casefold()
@@ -238,9 +348,17 @@ def discover_album_for_track(
         if target is None:
             return None
 
-        details = mb.get_release_by_id(target["id"], includes=["media"])
+        # Ask for recordings too: the same response is the tracklist that
+        # the completion pass would otherwise fetch again for this release.
+        details = mb.get_release_by_id(
+            target["id"], includes=["media", "recordings"]
+        )
         plan = _build_album_discovery_plan(target, details, album_hint)
         _execute_album_discovery_plan(db, plan)
+        if plan.total_tracks > 0:
+            _store_tracklist(
+                db, plan.release_mbid, _parse_album_tracklist(details)
+            )
         return plan.release_mbid
 
     except Exception as e:
@@ -256,11 +374,19 @@ def _build_missing_album_details(
     local_tracks: Set[LocalTrackPosition],
     official_tracks: AlbumTracklist,
 ) -> MissingAlbumDetails:
-    """Create a completion snapshot without database or network access."""
-    missing_items: List[MissingTrack] = []
-    for (disc, track), title in sorted(official_tracks.items()):
-        if (disc, track) not in local_tracks:
-            missing_items.append({"disc": disc, "track": track, "title": title})
+    """Create a completion snapshot without database or network access.
+
+    The diff is a hash probe per official track against the local position
+    set, so it stays in Python rather than round-tripping through SQL.
+    """
+    missing_items: List[MissingTrack] = [
+        {"disc": disc, "track": track, "title": title}
+        for (disc, track), title in official_tracks.items()
+        if (disc, track) not in local_tracks
+    ]
+    # Tracklists usually arrive in disc/track order already; sorting only
+    # the (short) missing list keeps the output deterministic regardless.
+    missing_items.sort(key=itemgetter("disc", "track"))
 
     return {
         "artist": artist,
@@ -273,17 +399,41 @@ def _build_missing_album_details(
     }
 
 
+def _recorded_complete(snapshot: LocalAlbumSnapshot) -> bool:
+    total = snapshot["total_tracks"]
+    return bool(total) and len(snapshot["positions"]) >= total
+
+
 def get_missing_tracks_for_album(
-    db: DatabaseManager, release_mbid: str
+    db: DatabaseManager,
+    release_mbid: str,
+    official_tracks: Optional[AlbumTracklist] = None,
+    refresh: bool = False,
 ) -> MissingAlbumResult:
     """
     Returns details about missing tracks for a specific album.
+    ``official_tracks`` may be supplied when the tracklist was already fetched;
+    otherwise it is only fetched when the stored track total shows a gap.
+    ``refresh`` always re-fetches the tracklist, bypassing the cache.
     """
     snapshot = db.get_local_album_snapshot(release_mbid)
     if snapshot is None:
         return {"error": f"No local tracks found for release {release_mbid}"}
 
-    official_tracks = fetch_album_tracklist(release_mbid)
+    if official_tracks is None and not refresh and _recorded_complete(snapshot):
+        # The stored track total already accounts for every position, so
+        # the MusicBrainz tracklist could not reveal a gap.
+        return {
+            "artist": snapshot["artist"],
+            "album": snapshot["album"],
+            "mbid": release_mbid,
+            "total_tracks": snapshot["total_tracks"],
+            "have": len(snapshot["positions"]),
+            "missing_count": 0,
+            "missing_tracks": [],
+        }
+    if official_tracks is None:
+        official_tracks = cached_album_tracklist(db, release_mbid, refresh=refresh)
     if not official_tracks:
         return {"error": "Failed to fetch official tracklist from MusicBrainz"}
     return _build_missing_album_details(
@@ -347,26 +497,41 @@ def _execute_album_queue_plan(
     plan: AlbumQueuePlan,
     report: Callable[[str], None],
 ) -> Tuple[int, int]:
-    """Apply a queue plan sequentially, preserving duplicate checks."""
-    queued = 0
+    """Apply a queue plan in one batch, preserving duplicate checks."""
     skipped = 0
+    if not plan.items:
+        return 0, skipped
+    # One queue scan per album; keys are added as items are planned so
+    # repeats within the plan are still caught.
+    queued_keys = db.get_queued_query_keys()
+    batch: List[DownloadItem] = []
+    messages: List[str] = []
     for item in plan.items:
-        if db.is_download_queued(item.search_query):
+        key = db.normalize_search_query(item.search_query)
+        if key and key in queued_keys:
             skipped += 1
             if item.duplicate_message:
                 report(item.duplicate_message)
             continue
-        queue_or_forward(
-            db,
+        queued_keys.add(key)
+        batch.append(
             DownloadItem(
                 search_query=item.search_query,
                 playlist_id="COMPLETER",
                 mbid_guess=item.mbid_guess,
                 status="pending",
-            ),
+            )
         )
-        report(item.queued_message)
-        queued += 1
+        messages.append(item.queued_message)
+
+    # Imported here: it pulls in requests for forwarding to a master node,
+    # which the audit and discovery paths never need.
+    from .download_request import queue_or_forward_many
+
+    # The whole album lands in one transaction rather than one commit each.
+    queued = queue_or_forward_many(db, batch)
+    for message in messages:
+        report(message)
     return queued, skipped
 
 
@@ -374,12 +539,13 @@ def queue_missing_tracks_for_album(
     db: DatabaseManager,
     release_mbid: str,
     progress_callback: Optional[CompletionProgressCallback] = None,
+    official_tracks: Optional[AlbumTracklist] = None,
 ) -> dict:
     """
     Identifies missing tracks for an album and queues them for download.
     Returns a summary dict: {album, artist, queued, skipped_existing}.
     """
-    data = get_missing_tracks_for_album(db, release_mbid)
+    data = get_missing_tracks_for_album(db, release_mbid, official_tracks)
 
     if "error" in data:
         logger.warning(f"Skipping album {release_mbid}: {data['error']}")
@@ -412,6 +578,7 @@ def queue_missing_tracks_for_album(
 def complete_albums(
     db: DatabaseManager,
     progress_callback: Optional[CompletionProgressCallback] = None,
+    refresh_tracklists: bool = False,
 ) -> dict:
     """
     Full album completion pipeline:
@@ -419,6 +586,7 @@ def complete_albums(
       2. Identify all incomplete albums
       3. Queue missing tracks for download
 
+    ``refresh_tracklists`` ignores cached MusicBrainz tracklists.
     Returns a summary of what was done.
     """
     def _report(msg):
@@ -484,13 +652,23 @@ def complete_albums(
     _report(f"Found {len(incomplete)} incomplete albums. Queueing missing tracks...")
     _report("(This may take time due to MusicBrainz API rate limits)")
 
-    for idx, album_info in enumerate(incomplete, 1):
+    tracklists = _prefetch_album_tracklists(
+        db,
+        (album_info["mbid"] for album_info in incomplete),
+        refresh=refresh_tracklists,
+    )
+    for idx, (album_info, official_tracks) in enumerate(
+        zip(incomplete, tracklists), 1
+    ):
         label = f"{album_info['artist']} - {album_info['album']}"
         status_str = f"{album_info['have']}/{album_info['total']}"
         _report(f"[{idx}/{len(incomplete)}] {label} ({status_str})")
 
         result = queue_missing_tracks_for_album(
-            db, album_info["mbid"], progress_callback=progress_callback
+            db,
+            album_info["mbid"],
+            progress_callback=progress_callback,
+            official_tracks=official_tracks,
         )
 
         if "error" in result:
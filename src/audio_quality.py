@@ -13,6 +13,8 @@ import logging
 import os
 from typing import Optional, Tuple
 
+from .path_chars import UNSAFE_PATH_CHARS
+
 logger = logging.getLogger(__name__)
 
 # Containers/codecs we treat as lossless. ``alac`` is the codec name mutagen
@@ -198,17 +200,15 @@ def library_path_for_track(music_library_dir: str, track) -> str:
     Extracted from the downloader so the upload-ingest path foldering stays
     identical. Returns a forward-slash path.
     """
-    import re
-
     album = getattr(track, "album", None) or "Unknown Album"
     safe_artist = (
-        re.sub(r'[\\/*?:"<>|]', "_", track.artist)
+        track.artist.translate(UNSAFE_PATH_CHARS)
         if getattr(track, "artist", None)
         else "Unknown Artist"
     )
-    safe_album = re.sub(r'[\\/*?:"<>|]', "_", album)
+    safe_album = album.translate(UNSAFE_PATH_CHARS)
     safe_title = (
-        re.sub(r'[\\/*?:"<>|]', "_", track.title)
+        track.title.translate(UNSAFE_PATH_CHARS)
         if getattr(track, "title", None)
         else "Unknown Title"
     )
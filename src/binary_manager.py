@@ -1,4 +1,5 @@
 
+import functools
 import os
 import platform
 import shutil
@@ -8,14 +9,21 @@ import stat
 
 logger = logging.getLogger(__name__)
 
+_COPY_BUFSIZE = 1 << 20
+
 def detect_platform():
     """
     Returns (os_name, arch_name) compatible with sldl release naming.
     OS: 'linux', 'osx' (macos), 'win' (windows)
     Arch: 'x64', 'arm64', 'x86'
     """
-    system = platform.system().lower()
-    machine = platform.machine().lower()
+    # platform caches uname() itself; the mapping is cached per host below.
+    return _release_platform(platform.system(), platform.machine())
+
+@functools.lru_cache(maxsize=None)
+def _release_platform(system: str, machine: str):
+    system = system.lower()
+    machine = machine.lower()
     
     os_name = ""
     if system == "linux":
@@ -87,42 +95,34 @@ def install_from_local(releases_dir: str, target_bin_dir: str):
         
     logger.info(f"Found release archive: {zip_path}")
     
-    # Prepare extraction
-    temp_dir = os.path.join(target_bin_dir, "temp_extract")
-    if os.path.exists(temp_dir): shutil.rmtree(temp_dir)
-    os.makedirs(temp_dir, exist_ok=True)
-    
-    # Unzip
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(temp_dir)
-        
-    # Find binary
     binary_name = "sldl.exe" if os_name == "win" else "sldl"
-    source_bin = None
-    
-    for root, dirs, files in os.walk(temp_dir):
-        if binary_name in files:
-            source_bin = os.path.join(root, binary_name)
-            break
-            
-    if not source_bin:
-        raise Exception(f"Could not find '{binary_name}' inside the zip file.")
-        
-    # Move to final location
     final_bin_name = "slsk-batchdl"
     if os_name == "win": final_bin_name += ".exe"
     
     os.makedirs(target_bin_dir, exist_ok=True)
     final_path = os.path.join(target_bin_dir, final_bin_name)
+    partial_path = final_path + ".partial"
     
-    # Remove existing
-    if os.path.exists(final_path):
-        os.remove(final_path)
-        
-    shutil.move(source_bin, final_path)
+    # Stream just the binary out of the archive (shallowest match, as a
+    # top-down walk would find it) instead of unpacking every member.
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        members = [
+            info for info in zip_ref.infolist()
+            if not info.is_dir()
+            and info.filename.split("/")[-1] == binary_name
+        ]
+        if not members:
+            raise Exception(f"Could not find '{binary_name}' inside the zip file.")
+        member = min(members, key=lambda info: info.filename.count("/"))
+        try:
+            with zip_ref.open(member) as src, open(partial_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+        except BaseException:
+            if os.path.exists(partial_path): os.remove(partial_path)
+            raise
     
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    # Replace any existing install in one step
+    os.replace(partial_path, final_path)
     
     # Make executable (Unix)
     if os_name != "win":
@@ -1,48 +1,60 @@
 import logging
+import ntpath
 import os
 import re
 import stat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Sequence
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 from .db_manager import DatabaseManager
 from .logger_setup import setup_logging
 from .config_manager import get_config
-from .utils import get_mbid_from_tags, get_release_mbid_from_tags
+from .utils import get_mbid_from_tags, get_mbids_from_tags, get_release_mbid_from_tags
 
 logger = logging.getLogger(__name__)
 
+# Tag reads are file I/O that releases the GIL; overlap them when building
+# the duplicate review list.
+_TAG_READ_WORKERS = 8
+_UNLINK_WORKERS = 32
+
 # --- Pattern Definitions ---
-track_num_regex = re.compile(r"^\s*\d+\s*[-–—]\s*.+")
-windows_copy_regex = re.compile(r".+\s\(\d+\)\.[^.]+$", re.IGNORECASE)
-feat_regex = re.compile(r".+\s\(feat\..+\)\.[^.]+$", re.IGNORECASE)
+# One alternation in priority order, applied with fullmatch so no branch
+# needs its own anchors. The first group that matches is the penalty applied.
+filename_penalty_regex = re.compile(
+    r"(?P<copy>.+\s\(\d+\)\.[^.]+)"  # e.g., "Song (1).flac"
+    r"|(?P<tracknum>\s*\d+\s*[-–—]\s*.+)"  # e.g., "01 - Song.flac"
+    r"|(?P<feat>.+\s\(feat\..+\)\.[^.]+)",  # e.g., "Song (feat. Artist).flac"
+    re.IGNORECASE,
+)
+_FILENAME_PENALTIES: Mapping[str, int] = MappingProxyType(
+    {"copy": 20, "tracknum": 10, "feat": 5}
+)
+_EXT_BONUS: Mapping[str, int] = MappingProxyType(
+    {".flac": 10, ".m4a": 5, ".mp3": 1}
+)
 
 
 def get_file_score(path: str) -> int:
     """
     Calculates a score for a file path. Higher is better.
     """
-    # Normalize path just in case
-    path = path.replace("\\", "/")
-    base = os.path.basename(path).strip('"')
+    # ntpath splits on both "/" and "\\", so Windows-style paths score the
+    # same on every host OS.
+    base = ntpath.basename(path.strip('"'))
     ext = os.path.splitext(base)[1].lower()
 
     score = 100  # Base score
 
     # --- Filename Penalties (lower is worse) ---
-    if windows_copy_regex.search(base):
-        score -= 20  # e.g., "Song (1).flac"
-    elif track_num_regex.match(base):
-        score -= 10  # e.g., "01 - Song.flac"
-    elif feat_regex.search(base):
-        score -= 5  # e.g., "Song (feat. Artist).flac"
+    match = filename_penalty_regex.fullmatch(base)
+    if match:
+        score -= _FILENAME_PENALTIES[match.lastgroup]
 
     # --- File Type Bonuses (higher is better) ---
-    if ext == ".flac":
-        score += 10
-    elif ext == ".m4a":
-        score += 5
-    elif ext == ".mp3":
-        score += 1
+    score += _EXT_BONUS.get(ext, 0)
 
     return score
 
@@ -60,10 +72,24 @@ def get_duplicates_for_ui(db: DatabaseManager):
         return []
 
     results = []
-    
+    tracks = db.get_tracks_by_mbids(duplicates_map)
+    safe_paths = [
+        clean_path
+        for clean_path in dict.fromkeys(
+            _clean_path(path)
+            for paths in duplicates_map.values()
+            for path in paths
+        )
+        if _regular_non_symlink_file(clean_path)
+    ]
+    with ThreadPoolExecutor(max_workers=_TAG_READ_WORKERS) as pool:
+        embedded_ids = dict(
+            zip(safe_paths, pool.map(get_mbids_from_tags, safe_paths))
+        )
+
     for mbid, paths in duplicates_map.items():
         # Get basic metadata for display
-        track = db.get_track_by_mbid(mbid)
+        track = tracks.get(mbid)
         artist = track.artist if track else "Unknown Artist"
         title = track.title if track else "Unknown Title"
 
@@ -71,10 +97,9 @@ def get_duplicates_for_ui(db: DatabaseManager):
         for path in paths:
             clean_path = _clean_path(path)
             score = get_file_score(clean_path)
-            safe_file = _regular_non_symlink_file(clean_path)
-            embedded_mbid = get_mbid_from_tags(clean_path) if safe_file else None
-            release_mbid = (
-                get_release_mbid_from_tags(clean_path) if safe_file else None
+            safe_file = clean_path in embedded_ids
+            embedded_mbid, release_mbid = embedded_ids.get(
+                clean_path, (None, None)
             )
             identity_status = (
                 "match"
@@ -99,18 +124,21 @@ def get_duplicates_for_ui(db: DatabaseManager):
         }
         release_conflict = len(release_ids) > 1
 
-        # Sort by score descending
-        candidates.sort(key=lambda x: x["score"], reverse=True)
-
-        # Mark recommendation
-        recommendable = [
-            candidate
-            for candidate in candidates
-            if candidate["is_safe_file"]
-            and candidate["identity_status"] == "match"
-            and not release_conflict
-        ]
-        recommended = recommendable[0] if recommendable else None
+        # Sort by score descending; the UI lists candidates best-first.
+        candidates.sort(key=itemgetter("score"), reverse=True)
+
+        # Mark recommendation: the best-scoring candidate that is safe to keep.
+        recommended = None
+        if not release_conflict:
+            recommended = next(
+                (
+                    candidate
+                    for candidate in candidates
+                    if candidate["is_safe_file"]
+                    and candidate["identity_status"] == "match"
+                ),
+                None,
+            )
         for candidate in candidates:
             candidate["is_recommended"] = candidate is recommended
 
@@ -252,6 +280,26 @@ def build_duplicate_resolution_plan(
     )
 
 
+def _safe_unlink(path: str) -> Tuple[str, Optional[OSError]]:
+    try:
+        os.remove(path)
+    except OSError as exc:
+        return path, exc
+    return path, None
+
+
+def _unlink_all(paths: Sequence[str]) -> List[Tuple[str, Optional[OSError]]]:
+    """Unlink paths concurrently; results keep the input order."""
+    if len(paths) <= 1:
+        return [_safe_unlink(path) for path in paths]
+    # Each unlink is one blocking syscall; on network shares the round trips
+    # dominate, so overlap them.
+    with ThreadPoolExecutor(
+        max_workers=min(_UNLINK_WORKERS, len(paths))
+    ) as executor:
+        return list(executor.map(_safe_unlink, paths))
+
+
 def resolve_duplicates(
     db: DatabaseManager,
     mbid: str,
@@ -268,11 +316,14 @@ def resolve_duplicates(
     deleted: List[str] = []
     errors: List[str] = []
     failed_paths: List[str] = []
-    for path in plan.delete_paths:
-        try:
-            os.remove(path)
+    missing: List[str] = list(plan.missing_paths)
+    for path, exc in _unlink_all(plan.delete_paths):
+        if exc is None:
             deleted.append(path)
-        except OSError as exc:
+        elif isinstance(exc, FileNotFoundError):
+            # Removed by something else since the plan was validated.
+            missing.append(path)
+        else:
             failed_paths.append(path)
             errors.append(f"Error deleting {path}: {exc}")
 
@@ -291,7 +342,7 @@ def resolve_duplicates(
     return {
         "deleted": deleted,
         "errors": errors,
-        "missing": list(plan.missing_paths),
+        "missing": missing,
         "remaining": remaining if not resolved else [],
         "resolved": resolved,
     }
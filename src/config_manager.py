@@ -150,6 +150,7 @@ class ConfigManager:
 
     _instance: Optional["ConfigManager"] = None
     _config: ConfigData
+    _ffmpeg_on_path: Optional[str] = None
 
     CONFIG_FILE: str = resolve_config_path()
     REQUIRED_KEYS: List[str] = [
@@ -196,6 +197,18 @@ class ConfigManager:
             print(f"ERROR: Invalid JSON in '{self.CONFIG_FILE}': {e}")
             sys.exit(1)
 
+        self._apply_loaded_config()
+
+    def load_values(self, values: Mapping[str, Any]) -> None:
+        """Adopt config values already in memory, e.g. ones just written.
+
+        Runs the same migration and validation as :meth:`_load_config`
+        without reading config.json back from disk.
+        """
+        self._config = cast(ConfigData, dict(values))
+        self._apply_loaded_config()
+
+    def _apply_loaded_config(self) -> None:
         self._migrate_legacy_keys()
         self._ensure_device_identity()
 
@@ -272,13 +285,24 @@ class ConfigManager:
             json.dump(self._config, config_file, indent=4)
 
     def _validate_paths(self) -> None:
-        """Validate that critical paths exist."""
+        """Validate that critical paths exist.
+
+        A bare ffmpeg command found on PATH is remembered, so reloads that
+        keep the same setting skip the PATH walk; everything else is checked
+        on every reload.
+        """
         ffmpeg_path = cast(str, self._config["ffmpeg_path"])
         music_library_path = cast(str, self._config["music_library_path"])
 
         # Check ffmpeg
-        if not os.path.exists(ffmpeg_path) and not which(ffmpeg_path):
-            logger.warning("ffmpeg not found at: %s", ffmpeg_path)
+        if (
+            ffmpeg_path != self._ffmpeg_on_path
+            and not os.path.exists(ffmpeg_path)
+        ):
+            if which(ffmpeg_path):
+                self._ffmpeg_on_path = ffmpeg_path
+            else:
+                logger.warning("ffmpeg not found at: %s", ffmpeg_path)
 
         # Check music library
         if not os.path.exists(music_library_path):
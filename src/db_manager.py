@@ -8,7 +8,7 @@ import os
 import uuid
 import logging
 from dataclasses import dataclass
-from typing import Any, Collection, List, Mapping, Optional, Set, Tuple, TypedDict
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, TypedDict
 from datetime import datetime
 
 from src.db_schema import create_tables, migrate_schema
@@ -24,9 +24,37 @@ from src.db_repositories import (
     PlaylistRepository,
     SyncRepository,
 )
+from src.path_chars import UNSAFE_PATH_CHARS
 
 logger = logging.getLogger(__name__)
 
+# Repositories keep their hot SQL in module constants so the text is
+# identical on every call; a larger statement cache than the default 128
+# keeps those prepared across a full sync or completion pass. The cache is
+# per connection and shared by every cursor. It is sized above the ~260
+# execute sites because chunked IN-lists add one entry per distinct
+# placeholder count.
+_CACHED_STATEMENTS = 512
+
+# Page cache per connection, in KiB (negative values are KiB for SQLite).
+_CACHE_SIZE_KIB = -32000
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    """Parse a stored ISO-8601 timestamp, returning None when absent or bad."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except (ValueError, TypeError):
+        return None
+
+
+def _normalize_path(path: str) -> str:
+    """Collapse ``..``/duplicate separators and store forward slashes."""
+    return os.path.normpath(path).replace("\\", "/")
+
+
 # The default sqlite3 datetime adapter is deprecated in Python 3.12 and
 # scheduled for removal. Register an explicit ISO-format adapter so writes
 # from `datetime.now()` keep working on 3.13+.
@@ -39,6 +67,7 @@ class LocalAlbumSnapshot(TypedDict):
     artist: str
     album: Optional[str]
     positions: Set[Tuple[Optional[int], Optional[int]]]
+    total_tracks: Optional[int]
 
 
 class AlbumGroupTrackRow(TypedDict):
@@ -99,19 +128,15 @@ class Track:
 
     @property
     def safe_artist(self):
-        import re
-
         if not self.artist or self.artist == "Unknown Artist":
             return "Unknown Artist"
-        return re.sub(r'[\\/*?:"<>|]', "_", self.artist)
+        return self.artist.translate(UNSAFE_PATH_CHARS)
 
     @property
     def safe_title(self):
-        import re
-
         if not self.title or self.title == "Unknown Title":
             return "Unknown Title"
-        return re.sub(r'[\\/*?:"<>|]', "_", self.title)
+        return self.title.translate(UNSAFE_PATH_CHARS)
 
 
 @dataclass
@@ -153,7 +178,9 @@ class DatabaseManager:
 
     def _connect(self):
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = sqlite3.connect(
+                self.db_path, cached_statements=_CACHED_STATEMENTS
+            )
             self.conn.row_factory = sqlite3.Row
             self.conn.execute("PRAGMA foreign_keys = ON;")
             # Wait up to 5s for a write lock instead of failing immediately with
@@ -163,6 +190,13 @@ class DatabaseManager:
             # avoided deliberately — it misbehaves on the Windows Docker
             # bind-mount that backs /data.
             self.conn.execute("PRAGMA busy_timeout = 5000;")
+            # Memory-only tuning that is safe on any filesystem: sorts and
+            # temp B-trees stay in RAM, and a larger page cache keeps the
+            # tracks table hot across a full scan or sync. Durability
+            # settings (journal_mode, synchronous) stay at their defaults
+            # for the same bind-mount reason as above.
+            self.conn.execute("PRAGMA temp_store = MEMORY;")
+            self.conn.execute(f"PRAGMA cache_size = {_CACHE_SIZE_KIB};")
             self._initialize_repositories()
             logger.info(f"Connected to database at {self.db_path}")
         except sqlite3.Error as e:
@@ -187,8 +221,6 @@ class DatabaseManager:
         )
 
     def _create_tables(self):
-        if not self.conn:
-            self._connect()
         create_tables(self.conn, logger)
 
     def _migrate_schema(self):
@@ -198,9 +230,17 @@ class DatabaseManager:
     def add_or_update_track(self, track: Track):
         # Normalize path to ensure consistency (force forward slashes)
         if track.local_path:
-            track.local_path = os.path.normpath(track.local_path).replace("\\", "/")
+            track.local_path = _normalize_path(track.local_path)
         self._library_repository.add_or_update_track(track, logger)
 
+    def add_or_update_tracks(self, tracks: Iterable[Track]) -> None:
+        """Upsert several tracks with one executemany and one commit."""
+        batch = list(tracks)
+        for track in batch:
+            if track.local_path:
+                track.local_path = _normalize_path(track.local_path)
+        self._library_repository.add_or_update_tracks(batch, logger)
+
     def set_track_tag_tier(
         self, mbid: str, tier: Optional[str], score: Optional[float]
     ) -> bool:
@@ -248,6 +288,23 @@ class DatabaseManager:
         except sqlite3.Error:
             return None
 
+    def get_tracks_by_mbids(self, mbids: Iterable[str]) -> Dict[str, Track]:
+        """Tracks keyed by MBID, fetched in a few IN queries; misses omitted."""
+        mbids = list(dict.fromkeys(mbids))
+        tracks: Dict[str, Track] = {}
+        try:
+            # SQLite caps bound parameters; chunk large groups.
+            for start in range(0, len(mbids), 500):
+                for row in self._library_repository.fetch_tracks_by_mbids(
+                    mbids[start:start + 500]
+                ):
+                    track = self._row_to_track(row)
+                    if track is not None:
+                        tracks[track.mbid] = track
+        except sqlite3.Error:
+            return {}
+        return tracks
+
     def get_track_by_path(self, local_path: str) -> Optional[Track]:
         try:
             return self._row_to_track(
@@ -323,10 +380,10 @@ class DatabaseManager:
     def get_local_album_snapshot(
         self, release_mbid: str
     ) -> Optional[LocalAlbumSnapshot]:
-        """Return album identity and occupied positions for local tracks.
+        """Return album identity, occupied positions and stored track total.
 
-        This deliberately mirrors the album completer's historic two-query
-        read, including its treatment of soft-deleted rows.
+        This deliberately mirrors the album completer's historic read,
+        including its treatment of soft-deleted rows.
         """
         return self._library_repository.get_local_album_snapshot(release_mbid)
 
@@ -349,6 +406,11 @@ class DatabaseManager:
             return ""
         return " ".join(s.lower().split())
 
+    @staticmethod
+    def normalize_search_query(search_query: str) -> str:
+        """Public form of the queue's duplicate-detection key."""
+        return DatabaseManager._normalize_query(search_query)
+
     def list_albums(self) -> List[dict]:
         """Distinct albums implied by the tracks table.
 
@@ -533,6 +595,15 @@ class DatabaseManager:
             self._normalize_query,
         )
 
+    def get_queued_query_keys(self) -> Set[str]:
+        """Normalized search queries of every pending or failed queue item.
+
+        Lets callers that check many queries pay for one queue scan instead
+        of one :meth:`is_download_queued` scan per query. Compare against
+        :meth:`normalize_search_query` of the candidate.
+        """
+        return self._download_repository.queued_query_keys(self._normalize_query)
+
     # --- Contributions (master side) ---
     def create_contribution(
         self,
@@ -722,11 +793,25 @@ class DatabaseManager:
             item.status,
         )
 
+    def queue_downloads(self, items: List[DownloadItem]) -> int:
+        """Queue several items in one transaction; returns rows inserted."""
+        if not items:
+            return 0
+        return self._download_repository.queue_many(
+            [
+                (item.search_query, item.playlist_id, item.mbid_guess, item.status)
+                for item in items
+            ]
+        )
+
     def get_downloads(self, status: str) -> List[DownloadItem]:
-        return [
-            self._row_to_download_item(row)
-            for row in self._download_repository.fetch_by_status(status)
-        ]
+        return self._rows_to_download_items(
+            self._download_repository.fetch_by_status(status)
+        )
+
+    def get_download_ids(self, statuses: Collection[str]) -> List[int]:
+        """Return queue row ids in any of ``statuses`` in one query."""
+        return self._download_repository.fetch_ids_by_status(statuses)
 
     def get_download_status(self, download_id: int) -> Optional[str]:
         """Return the queue row's status, or ``None`` if the row is gone
@@ -1148,6 +1233,16 @@ class DatabaseManager:
     def mark_track_synced(self, mbid: str, dap_path: str):
         self._sync_repository.mark_track_synced(mbid, dap_path)
 
+    def get_sync_stats(self) -> dict:
+        """Count local tracks by DAP sync state, plus live playlists."""
+        stats = self._sync_repository.get_sync_stats()
+        stats["sync_percentage"] = (
+            stats["synced_tracks"] / stats["total_tracks"] * 100
+            if stats["total_tracks"] > 0
+            else 0
+        )
+        return stats
+
     def get_all_tracks(self, local_only: bool = False, include_orphans: bool = False):
         return self._library_repository.get_all_tracks(
             local_only,
@@ -1155,6 +1250,16 @@ class DatabaseManager:
             lambda row: self._row_to_track(row),
         )
 
+    def iter_all_tracks(
+        self, local_only: bool = False, include_orphans: bool = False
+    ) -> Iterator[Track]:
+        """Like ``get_all_tracks`` but yields tracks as rows arrive."""
+        for row in self._library_repository.iter_all_tracks(
+            local_only,
+            include_orphans,
+        ):
+            yield self._row_to_track(row)
+
     def soft_delete_track(self, mbid: str) -> bool:
         """Mark a track as deleted without removing the row.
 
@@ -1481,6 +1586,29 @@ class DatabaseManager:
             source,
         )
 
+    # --- MusicBrainz tracklist cache ---------------------------------------
+
+    def get_cached_tracklists(
+        self, release_mbids: List[str], max_age_days: int = 30
+    ) -> dict:
+        """Return ``{release_mbid: payload}`` for cache rows younger than
+        ``max_age_days``. Payloads are opaque JSON owned by the caller."""
+        if max_age_days <= 0:
+            return {}
+        # SQLite caps bound parameters; chunk very large audits.
+        cached = {}
+        for start in range(0, len(release_mbids), 500):
+            cached.update(
+                self._metadata_repository.get_cached_tracklists(
+                    release_mbids[start:start + 500], max_age_days
+                )
+            )
+        return cached
+
+    def cache_tracklist(self, release_mbid: str, payload: str) -> None:
+        """Insert or refresh one release's cached tracklist payload."""
+        self._metadata_repository.store_tracklist(release_mbid, payload)
+
     # --- Artist tags (Stage 14a) ------------------------------------------
 
     # Genre-discovery noise on MusicBrainz — tags that appear on too
@@ -1796,6 +1924,25 @@ class DatabaseManager:
             )
         ]
 
+    def get_playlist_links(self, playlist_id: str) -> List[dict]:
+        """Return ``{track_mbid, track_order, isrc, local_path, queued}`` for
+        every link; ``queued`` is true when the track has a queue row."""
+        return self._playlist_repository.fetch_links(playlist_id)
+
+    def iter_playlist_tracks(
+        self,
+        playlist_id: str,
+        local_only: bool = False,
+        include_orphans: bool = False,
+    ) -> Iterator[Track]:
+        """Like ``get_playlist_tracks`` but yields tracks as rows arrive."""
+        for row in self._playlist_repository.iter_playlist_tracks(
+            playlist_id,
+            local_only,
+            include_orphans,
+        ):
+            yield self._row_to_track(row)
+
     def get_tracks_for_playlist(
         self,
         playlist_id: str,
@@ -1814,14 +1961,46 @@ class DatabaseManager:
             lambda value: self._bump_playlist_updated_at(value),
         )
 
+    def save_playlist_tracks(
+        self, playlist_id: str, entries: List[Tuple[Track, int]]
+    ) -> int:
+        """Upsert ``(track, order)`` pairs and link them to a playlist.
+
+        All rows share one write transaction, so a large import pays for a
+        single commit instead of two per track. Returns new links created.
+        """
+        if not entries:
+            return 0
+        for track, _order in entries:
+            if track.local_path:
+                track.local_path = _normalize_path(track.local_path)
+        return self._playlist_repository.save_linked_tracks(playlist_id, entries)
+
     def get_mbid_to_track_path_map(self):
         return self._library_repository.get_mbid_to_track_path_map()
 
     def log_duplicate(self, mbid: str, file_path: str):
         if file_path:
-            file_path = os.path.normpath(file_path).replace("\\", "/")
+            file_path = _normalize_path(file_path)
         self._album_maintenance_repository.log_duplicate(mbid, file_path)
 
+    def log_duplicates(self, mbid: str, file_paths: List[str]):
+        """Log several paths for one MBID in one transaction."""
+        self._album_maintenance_repository.log_duplicates(
+            mbid,
+            [
+                _normalize_path(path) if path else path
+                for path in file_paths
+            ],
+        )
+
+    def log_duplicate_rows(self, rows: Iterable[Tuple[str, str]]):
+        """Log ``(mbid, file_path)`` rows across groups in one transaction."""
+        self._album_maintenance_repository.log_duplicate_rows(
+            (mbid, _normalize_path(path) if path else path)
+            for mbid, path in rows
+        )
+
     def get_all_duplicates(self):
         return self._album_maintenance_repository.get_all_duplicates()
 
@@ -1906,7 +2085,7 @@ class DatabaseManager:
 
     def update_track_local_path(self, mbid: str, path: str):
         if path:
-            path = os.path.normpath(path).replace("\\", "/")
+            path = _normalize_path(path)
         self._library_repository.update_track_local_path(mbid, path)
 
     def _row_to_track(self, row):
@@ -1955,10 +2134,9 @@ class DatabaseManager:
         )
 
     def get_all_downloads(self) -> List[DownloadItem]:
-        return [
-            self._row_to_download_item(row)
-            for row in self._download_repository.fetch_all()
-        ]
+        return self._rows_to_download_items(
+            self._download_repository.fetch_all()
+        )
 
     def get_download(self, item_id: int) -> Optional[DownloadItem]:
         row = self._download_repository.fetch_one(item_id)
@@ -2006,18 +2184,22 @@ class DatabaseManager:
         # drift.
         return self._download_repository.delete_succeeded()
 
-    def _row_to_download_item(self, row):
+    def _rows_to_download_items(self, rows) -> List[DownloadItem]:
+        # Every row of one result shares its columns, so the optional-column
+        # set is built once per query rather than once per row.
+        keys = frozenset(rows[0].keys()) if rows else frozenset()
+        return [self._row_to_download_item(row, keys) for row in rows]
+
+    def _row_to_download_item(
+        self, row, keys: Optional[Collection[str]] = None
+    ):
         if not row:
             return None
-        keys = row.keys() if hasattr(row, "keys") else ()
+        if keys is None:
+            keys = row.keys() if hasattr(row, "keys") else ()
 
         def parse_timestamp(column: str) -> Optional[datetime]:
-            if column not in keys or not row[column]:
-                return None
-            try:
-                return datetime.fromisoformat(str(row[column]))
-            except (ValueError, TypeError):
-                return None
+            return _parse_timestamp(row[column]) if column in keys else None
 
         return DownloadItem(
             id=row["id"],
@@ -2054,6 +2236,12 @@ class DatabaseManager:
 
     def close(self):
         if self.conn:
+            try:
+                # Refresh planner statistics for tables this connection
+                # queried heavily; a no-op when nothing needs it.
+                self.conn.execute("PRAGMA optimize;")
+            except sqlite3.Error as e:
+                logger.debug(f"PRAGMA optimize skipped: {e}")
             self.conn.close()
 
     def __enter__(self):
@@ -1,10 +1,32 @@
 """Duplicate and album-group maintenance persistence."""
 
-from collections import defaultdict
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from .base import SQLiteRepository
 
+# ASCII unit/record separators; unlike "," they do not occur in real paths.
+_PATH_SEPARATOR = "\x1f"
+_ID_SEPARATOR = "\x1e"
+
+# Groups are built in SQLite and come back in first-logged order. SQLite
+# does not promise group_concat order (ORDER BY inside aggregates needs
+# 3.44), so each path carries its row id and is sorted after splitting.
+ALL_DUPLICATES_SQL = """
+    SELECT mbid, group_concat(id || char(30) || file_path, char(31))
+    FROM duplicates
+    GROUP BY mbid
+    ORDER BY MIN(id)
+    """
+
+
+def _paths_in_logging_order(grouped: str) -> List[str]:
+    entries = [
+        entry.split(_ID_SEPARATOR, 1)
+        for entry in grouped.split(_PATH_SEPARATOR)
+    ]
+    entries.sort(key=lambda entry: int(entry[0]))
+    return [path for _row_id, path in entries]
+
 
 class AlbumMaintenanceRepository(SQLiteRepository):
     def log_duplicate(self, mbid: str, file_path: str) -> None:
@@ -16,14 +38,34 @@ class AlbumMaintenanceRepository(SQLiteRepository):
         self.conn.commit()
         cursor.close()
 
+    def log_duplicates(self, mbid: str, file_paths: List[str]) -> None:
+        """Record every path of one duplicate group in a single commit."""
+        self.log_duplicate_rows((mbid, path) for path in file_paths)
+
+    def log_duplicate_rows(self, rows: Iterable[Tuple[str, str]]) -> None:
+        """Record ``(mbid, file_path)`` rows from many groups in one commit."""
+        cursor = self.conn.cursor()
+        try:
+            cursor.executemany(
+                "INSERT OR IGNORE INTO duplicates (mbid, file_path) "
+                "VALUES (?, ?)",
+                rows,
+            )
+            self.conn.commit()
+        finally:
+            cursor.close()
+
     def get_all_duplicates(self) -> Dict[str, List[str]]:
         cursor = self.conn.cursor()
-        cursor.execute("SELECT mbid, file_path FROM duplicates")
-        duplicates = defaultdict(list)
-        for row in cursor.fetchall():
-            duplicates[row["mbid"]].append(row["file_path"])
-        cursor.close()
-        return dict(duplicates)
+        cursor.row_factory = None
+        try:
+            cursor.execute(ALL_DUPLICATES_SQL)
+            return {
+                mbid: _paths_in_logging_order(paths)
+                for mbid, paths in cursor
+            }
+        finally:
+            cursor.close()
 
     def clear_duplicate(self, mbid: str) -> None:
         cursor = self.conn.cursor()
@@ -7,6 +7,17 @@ from typing import Callable, Collection, List, Optional, Set, Tuple
 from .base import SQLiteRepository
 
 
+QUEUED_QUERY_EXISTS_SQL = (
+    "SELECT 1 FROM download_queue "
+    "WHERE status IN ('pending', 'failed') "
+    "AND query_key(search_query) = ? LIMIT 1"
+)
+QUEUED_QUERIES_SQL = (
+    "SELECT search_query FROM download_queue "
+    "WHERE status IN ('pending', 'failed')"
+)
+
+
 def _utc_naive(value: Optional[datetime] = None) -> datetime:
     """Return a naive UTC datetime suitable for SQLite text comparison."""
     resolved = value or datetime.now(timezone.utc)
@@ -151,20 +162,38 @@ class DownloadRepository(SQLiteRepository):
         if not target:
             return False
         try:
+            # Let SQLite apply the normalizer and stop at the first match
+            # instead of materialising every open row in Python.
+            # Registering a function expires every prepared statement on
+            # the connection, so only do it when the normalizer changes.
+            if getattr(self, "_query_key_fn", None) is not normalize_query:
+                self.conn.create_function(
+                    "query_key", 1, normalize_query, deterministic=True
+                )
+                self._query_key_fn = normalize_query
             cursor = self.conn.cursor()
-            cursor.execute(
-                "SELECT search_query FROM download_queue "
-                "WHERE status IN ('pending', 'failed')"
-            )
-            for row in cursor.fetchall():
-                if normalize_query(row["search_query"]) == target:
-                    cursor.close()
-                    return True
-            cursor.close()
-            return False
+            try:
+                cursor.execute(QUEUED_QUERY_EXISTS_SQL, (target,))
+                return cursor.fetchone() is not None
+            finally:
+                cursor.close()
         except sqlite3.Error:
             return False
 
+    def queued_query_keys(
+        self,
+        normalize_query: Callable[[str], str],
+    ) -> Set[str]:
+        try:
+            cursor = self.conn.cursor()
+            try:
+                cursor.execute(QUEUED_QUERIES_SQL)
+                return {normalize_query(row["search_query"]) for row in cursor}
+            finally:
+                cursor.close()
+        except sqlite3.Error:
+            return set()
+
     def queue(
         self,
         search_query: str,
@@ -185,6 +214,33 @@ class DownloadRepository(SQLiteRepository):
         finally:
             cursor.close()
 
+    def queue_many(
+        self,
+        rows: List[Tuple[str, str, str, str]],
+    ) -> int:
+        """Insert ``(search_query, playlist_id, mbid_guess, status)`` rows."""
+        cursor = self.conn.cursor()
+        try:
+            began = not self.conn.in_transaction
+            if began:
+                cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(
+                "INSERT OR IGNORE INTO download_queue "
+                "(search_query, playlist_id, mbid_guess, status) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            queued = max(cursor.rowcount, 0)
+            if began:
+                self.conn.commit()
+            return queued
+        except Exception:
+            if began:
+                self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
     def fetch_by_status(self, status: str) -> List[sqlite3.Row]:
         cursor = self.conn.cursor()
         try:
@@ -195,6 +251,20 @@ class DownloadRepository(SQLiteRepository):
         finally:
             cursor.close()
 
+    def fetch_ids_by_status(self, statuses: Collection[str]) -> List[int]:
+        placeholders = ", ".join("?" for _ in statuses)
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        try:
+            cursor.execute(
+                "SELECT id FROM download_queue "
+                f"WHERE status IN ({placeholders})",
+                tuple(statuses),
+            )
+            return [item_id for item_id, in cursor]
+        finally:
+            cursor.close()
+
     def get_status(self, download_id: int) -> Optional[str]:
         cursor = self.conn.cursor()
         try:
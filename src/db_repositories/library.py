@@ -2,7 +2,7 @@
 
 import logging
 import sqlite3
-from typing import Callable, Dict, List, Optional, Protocol, TypeVar
+from typing import Callable, Dict, Iterator, List, Optional, Protocol, Sequence, TypeVar
 
 from .base import SQLiteRepository
 
@@ -43,55 +43,108 @@ class TrackRecord(Protocol):
     album_artist: Optional[str]
 
 
+TRACK_UPSERT_SQL = """
+    INSERT INTO tracks
+    (mbid, title, artist, album, isrc, local_path, dap_path, synced_to_dap,
+     release_mbid, track_number, disc_number, tag_tier, tag_score,
+     album_artist, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(mbid) DO UPDATE SET
+        title = excluded.title,
+        artist = excluded.artist,
+        album = excluded.album,
+        isrc = excluded.isrc,
+        local_path = excluded.local_path,
+        dap_path = excluded.dap_path,
+        synced_to_dap = excluded.synced_to_dap,
+        release_mbid = excluded.release_mbid,
+        track_number = excluded.track_number,
+        disc_number = excluded.disc_number,
+        tag_tier = COALESCE(excluded.tag_tier, tag_tier),
+        tag_score = COALESCE(excluded.tag_score, tag_score),
+        album_artist = COALESCE(excluded.album_artist, album_artist),
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+def track_upsert_params(track: TrackRecord) -> tuple:
+    return (
+        track.mbid,
+        track.title,
+        track.artist,
+        track.album,
+        track.isrc,
+        track.local_path,
+        track.dap_path,
+        int(track.synced_to_dap),
+        track.release_mbid,
+        track.track_number,
+        track.disc_number,
+        track.tag_tier,
+        track.tag_score,
+        track.album_artist,
+    )
+
+
+# One grouped pass answers the whole audit; with idx_tracks_local_release
+# the tracks side is an index-only scan, so no per-album queries follow.
+INCOMPLETE_ALBUMS_SQL = """
+    SELECT
+        t.artist AS artist,
+        a.album_title AS album,
+        a.release_mbid AS mbid,
+        COUNT(DISTINCT t.track_number) AS have,
+        a.total_tracks AS total,
+        a.total_tracks - COUNT(DISTINCT t.track_number) AS missing
+    FROM tracks t
+    JOIN albums a ON t.release_mbid = a.release_mbid
+    WHERE t.local_path IS NOT NULL
+    GROUP BY t.release_mbid
+    HAVING have < a.total_tracks
+    ORDER BY t.artist, a.album_title
+    """
+
+# One statement and one row for the dashboard counters; each scalar
+# subquery is planned independently, exactly as the separate queries were.
+LIBRARY_STATS_KEYS = (
+    "tracks", "artists", "albums", "playlists", "incomplete_albums",
+)
+LIBRARY_STATS_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM tracks),
+        (SELECT COUNT(DISTINCT artist) FROM tracks),
+        (SELECT COUNT(*) FROM albums),
+        (SELECT COUNT(*) FROM playlists),
+        (SELECT COUNT(*) FROM (
+            SELECT t.release_mbid
+            FROM tracks t JOIN albums a ON t.release_mbid = a.release_mbid
+            WHERE t.local_path IS NOT NULL
+            GROUP BY t.release_mbid
+            HAVING COUNT(DISTINCT t.track_number) < a.total_tracks
+        ))
+    """
+
+LOCAL_ALBUM_SNAPSHOT_SQL = """
+    SELECT
+        artist,
+        album,
+        disc_number,
+        track_number,
+        (SELECT total_tracks FROM albums WHERE release_mbid = ?)
+    FROM tracks
+    WHERE release_mbid = ? AND local_path IS NOT NULL
+    """
+
+
 class LibraryRepository(SQLiteRepository):
     def add_or_update_track(
         self,
         track: TrackRecord,
         logger: logging.Logger,
     ) -> None:
-        sql = """
-        INSERT INTO tracks
-        (mbid, title, artist, album, isrc, local_path, dap_path, synced_to_dap,
-         release_mbid, track_number, disc_number, tag_tier, tag_score,
-         album_artist, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        ON CONFLICT(mbid) DO UPDATE SET
-            title = excluded.title,
-            artist = excluded.artist,
-            album = excluded.album,
-            isrc = excluded.isrc,
-            local_path = excluded.local_path,
-            dap_path = excluded.dap_path,
-            synced_to_dap = excluded.synced_to_dap,
-            release_mbid = excluded.release_mbid,
-            track_number = excluded.track_number,
-            disc_number = excluded.disc_number,
-            tag_tier = COALESCE(excluded.tag_tier, tag_tier),
-            tag_score = COALESCE(excluded.tag_score, tag_score),
-            album_artist = COALESCE(excluded.album_artist, album_artist),
-            updated_at = CURRENT_TIMESTAMP
-        """
         try:
             cursor = self.conn.cursor()
-            cursor.execute(
-                sql,
-                (
-                    track.mbid,
-                    track.title,
-                    track.artist,
-                    track.album,
-                    track.isrc,
-                    track.local_path,
-                    track.dap_path,
-                    int(track.synced_to_dap),
-                    track.release_mbid,
-                    track.track_number,
-                    track.disc_number,
-                    track.tag_tier,
-                    track.tag_score,
-                    track.album_artist,
-                ),
-            )
+            cursor.execute(TRACK_UPSERT_SQL, track_upsert_params(track))
             self.conn.commit()
         except sqlite3.Error as error:
             logger.error(f"Error adding track: {error}")
@@ -100,6 +153,34 @@ class LibraryRepository(SQLiteRepository):
             if cursor:
                 cursor.close()
 
+    def add_or_update_tracks(
+        self,
+        tracks: Sequence[TrackRecord],
+        logger: logging.Logger,
+    ) -> None:
+        """Upsert several tracks in one transaction.
+
+        A failing batch is rolled back and retried row by row so one bad
+        record is logged and skipped exactly as in ``add_or_update_track``.
+        """
+        if not tracks:
+            return
+        cursor = self.conn.cursor()
+        try:
+            cursor.executemany(
+                TRACK_UPSERT_SQL,
+                [track_upsert_params(track) for track in tracks],
+            )
+            self.conn.commit()
+            return
+        except sqlite3.Error as error:
+            logger.warning(f"Batch track upsert failed, retrying singly: {error}")
+            self.conn.rollback()
+        finally:
+            cursor.close()
+        for track in tracks:
+            self.add_or_update_track(track, logger)
+
     def set_track_album_artist(
         self,
         mbid: str,
@@ -147,7 +228,7 @@ class LibraryRepository(SQLiteRepository):
             "AND deleted_at IS NULL "
             "ORDER BY artist, album, track_number"
         )
-        tracks = [row_to_track(row) for row in cursor.fetchall()]
+        tracks = [row_to_track(row) for row in cursor]
         cursor.close()
         return tracks
 
@@ -158,7 +239,7 @@ class LibraryRepository(SQLiteRepository):
             "WHERE isrc = ? AND local_path IS NULL AND deleted_at IS NULL",
             (isrc,),
         )
-        rows = [row["mbid"] for row in cursor.fetchall()]
+        rows = [row["mbid"] for row in cursor]
         cursor.close()
         return rows
 
@@ -175,7 +256,7 @@ class LibraryRepository(SQLiteRepository):
             "  AND local_path IS NULL AND deleted_at IS NULL",
             (artist, title),
         )
-        rows = [row["mbid"] for row in cursor.fetchall()]
+        rows = [row["mbid"] for row in cursor]
         cursor.close()
         return rows
 
@@ -194,7 +275,7 @@ class LibraryRepository(SQLiteRepository):
             "  AND local_path IS NULL AND deleted_at IS NULL",
             (artist, title, album),
         )
-        rows = [row["mbid"] for row in cursor.fetchall()]
+        rows = [row["mbid"] for row in cursor]
         cursor.close()
         return rows
 
@@ -234,36 +315,13 @@ class LibraryRepository(SQLiteRepository):
                 cursor.close()
 
     def get_incomplete_albums(self) -> List[Dict[str, object]]:
-        sql = """
-        SELECT
-            t.artist,
-            a.album_title,
-            a.release_mbid,
-            COUNT(DISTINCT t.track_number) as local_count,
-            a.total_tracks
-        FROM tracks t
-        JOIN albums a ON t.release_mbid = a.release_mbid
-        WHERE t.local_path IS NOT NULL
-        GROUP BY t.release_mbid
-        HAVING local_count < a.total_tracks
-        ORDER BY t.artist, a.album_title
-        """
-        results = []
+        cursor = None
         try:
             cursor = self.conn.cursor()
-            cursor.execute(sql)
-            for row in cursor.fetchall():
-                results.append(
-                    {
-                        "artist": row["artist"],
-                        "album": row["album_title"],
-                        "mbid": row["release_mbid"],
-                        "have": row["local_count"],
-                        "total": row["total_tracks"],
-                        "missing": row["total_tracks"] - row["local_count"],
-                    }
-                )
-            return results
+            cursor.execute(INCOMPLETE_ALBUMS_SQL)
+            # Columns are already aliased to the response keys; callers add
+            # fields, so each row still becomes its own dict.
+            return [dict(row) for row in cursor]
         except sqlite3.Error:
             return []
         finally:
@@ -284,7 +342,7 @@ class LibraryRepository(SQLiteRepository):
         try:
             cursor = self.conn.cursor()
             cursor.execute(sql)
-            return [row_to_track(row) for row in cursor.fetchall()]
+            return [row_to_track(row) for row in cursor]
         except sqlite3.Error as error:
             logger.error(f"Error getting orphan tracks: {error}")
             return []
@@ -297,28 +355,22 @@ class LibraryRepository(SQLiteRepository):
         release_mbid: str,
     ) -> Optional[Dict[str, object]]:
         cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT artist, album FROM tracks "
-            "WHERE release_mbid = ? AND local_path IS NOT NULL LIMIT 1",
-            (release_mbid,),
-        )
-        row = cursor.fetchone()
-        cursor.close()
-        if not row:
-            return None
-
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT disc_number, track_number FROM tracks "
-            "WHERE release_mbid = ? AND local_path IS NOT NULL",
-            (release_mbid,),
-        )
-        positions = {(item[0], item[1]) for item in cursor.fetchall()}
-        cursor.close()
+        try:
+            cursor.execute(
+                LOCAL_ALBUM_SNAPSHOT_SQL, (release_mbid, release_mbid)
+            )
+            first = cursor.fetchone()
+            if first is None:
+                return None
+            positions = {(first[2], first[3])}
+            positions.update((row[2], row[3]) for row in cursor)
+        finally:
+            cursor.close()
         return {
-            "artist": row[0],
-            "album": row[1],
+            "artist": first[0],
+            "album": first[1],
             "positions": positions,
+            "total_tracks": first[4],
         }
 
     def update_track_release_mbid(
@@ -358,7 +410,7 @@ class LibraryRepository(SQLiteRepository):
         try:
             cursor = self.conn.cursor()
             cursor.execute(sql)
-            for row in cursor.fetchall():
+            for row in cursor:
                 results.append({
                     "release_mbid": row["release_mbid"],
                     "album": row["album_title"],
@@ -381,14 +433,21 @@ class LibraryRepository(SQLiteRepository):
         target_mbid: str,
         logger: logging.Logger,
     ) -> bool:
+        cursor = self.conn.cursor()
         try:
-            cursor = self.conn.cursor()
+            # Take the write lock before reading the target title so the
+            # read and both writes form one transaction.
+            began = not self.conn.in_transaction
+            if began:
+                cursor.execute("BEGIN IMMEDIATE")
             cursor.execute(
                 "SELECT album_title FROM albums WHERE release_mbid = ?",
                 (target_mbid,),
             )
             row = cursor.fetchone()
             if not row:
+                if began:
+                    self.conn.rollback()
                 return False
             target_title = row[0]
 
@@ -408,8 +467,7 @@ class LibraryRepository(SQLiteRepository):
             self.conn.rollback()
             return False
         finally:
-            if cursor:
-                cursor.close()
+            cursor.close()
 
     def fetch_track_by_mbid(self, mbid: str) -> Optional[sqlite3.Row]:
         cursor = self.conn.cursor()
@@ -419,6 +477,20 @@ class LibraryRepository(SQLiteRepository):
         finally:
             cursor.close()
 
+    def fetch_tracks_by_mbids(self, mbids: List[str]) -> List[sqlite3.Row]:
+        if not mbids:
+            return []
+        placeholders = ",".join("?" * len(mbids))
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                f"SELECT * FROM tracks WHERE mbid IN ({placeholders})",
+                mbids,
+            )
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
     def fetch_track_by_path(self, local_path: str) -> Optional[sqlite3.Row]:
         cursor = self.conn.cursor()
         try:
@@ -453,7 +525,7 @@ class LibraryRepository(SQLiteRepository):
                 ORDER BY artist COLLATE NOCASE, title COLLATE NOCASE
                 """
             )
-            albums = [dict(row) for row in cursor.fetchall()]
+            albums = [dict(row) for row in cursor]
             cursor.execute(
                 """
                 SELECT
@@ -483,7 +555,7 @@ class LibraryRepository(SQLiteRepository):
             )
             credit_counts_by_album: Dict[str, Dict[str, int]] = {}
             album_artist_counts_by_album: Dict[str, Dict[str, int]] = {}
-            for row in cursor.fetchall():
+            for row in cursor:
                 album_id = str(row["album_id"])
                 artist = str(row["artist"])
                 credit_counts = credit_counts_by_album.setdefault(
@@ -545,7 +617,7 @@ class LibraryRepository(SQLiteRepository):
                          title COLLATE NOCASE
                 """
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor]
         finally:
             cursor.close()
 
@@ -619,7 +691,7 @@ class LibraryRepository(SQLiteRepository):
             """,
             (album_id, album_id),
         )
-        rows = [dict(row) for row in cursor.fetchall()]
+        rows = [dict(row) for row in cursor]
         cursor.close()
         return rows
 
@@ -629,6 +701,17 @@ class LibraryRepository(SQLiteRepository):
         include_orphans: bool,
         row_to_track: Callable[[sqlite3.Row], T],
     ) -> List[T]:
+        return [
+            row_to_track(row)
+            for row in self.iter_all_tracks(local_only, include_orphans)
+        ]
+
+    def iter_all_tracks(
+        self,
+        local_only: bool,
+        include_orphans: bool,
+    ) -> Iterator[sqlite3.Row]:
+        """Yield track rows straight off the cursor."""
         sql = "SELECT * FROM tracks"
         clauses = []
         if local_only:
@@ -638,10 +721,11 @@ class LibraryRepository(SQLiteRepository):
         if clauses:
             sql += " WHERE " + " AND ".join(clauses)
         cursor = self.conn.cursor()
-        cursor.execute(sql)
-        tracks = [row_to_track(row) for row in cursor.fetchall()]
-        cursor.close()
-        return tracks
+        try:
+            cursor.execute(sql)
+            yield from cursor
+        finally:
+            cursor.close()
 
     def soft_delete_track(self, mbid: str) -> bool:
         cursor = self.conn.cursor()
@@ -687,7 +771,7 @@ class LibraryRepository(SQLiteRepository):
             "FROM tracks WHERE deleted_at IS NOT NULL "
             "ORDER BY deleted_at DESC"
         )
-        rows = [dict(row) for row in cursor.fetchall()]
+        rows = [dict(row) for row in cursor]
         cursor.close()
         return rows
 
@@ -733,7 +817,7 @@ class LibraryRepository(SQLiteRepository):
                 "AND local_path IS NOT NULL AND local_path != ''",
                 (artist, title),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor]
         finally:
             cursor.close()
 
@@ -793,20 +877,22 @@ class LibraryRepository(SQLiteRepository):
             "ORDER BY updated_at DESC LIMIT ?",
             (int(limit),),
         )
-        preview = [dict(row) for row in cursor.fetchall()]
+        preview = [dict(row) for row in cursor]
         cursor.close()
         return {"total": total, "preview": preview}
 
     def get_mbid_to_track_path_map(self) -> Dict[str, str]:
         cursor = self.conn.cursor()
-        cursor.execute("SELECT mbid, local_path FROM tracks")
-        result = {
-            row[0]: row[1]
-            for row in cursor.fetchall()
-            if row[0] and row[1]
-        }
-        cursor.close()
-        return result
+        # Plain tuples feed dict() directly; NULLs fail "!= ''" as well.
+        cursor.row_factory = None
+        try:
+            cursor.execute(
+                "SELECT mbid, local_path FROM tracks "
+                "WHERE mbid != '' AND local_path != ''"
+            )
+            return dict(cursor)
+        finally:
+            cursor.close()
 
     def clear_missing_local_paths(
         self,
@@ -866,28 +952,8 @@ class LibraryRepository(SQLiteRepository):
         cursor = self.conn.cursor()
         stats: Dict[str, object] = {}
         try:
-            cursor.execute("SELECT COUNT(*) FROM tracks")
-            stats["tracks"] = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(DISTINCT artist) FROM tracks")
-            stats["artists"] = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM albums")
-            stats["albums"] = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM playlists")
-            stats["playlists"] = cursor.fetchone()[0]
-
-            cursor.execute("""
-                SELECT COUNT(*) FROM (
-                    SELECT t.release_mbid
-                    FROM tracks t JOIN albums a ON t.release_mbid = a.release_mbid
-                    WHERE t.local_path IS NOT NULL
-                    GROUP BY t.release_mbid
-                    HAVING COUNT(DISTINCT t.track_number) < a.total_tracks
-                )
-            """)
-            stats["incomplete_albums"] = cursor.fetchone()[0]
+            row = cursor.execute(LIBRARY_STATS_SQL).fetchone()
+            stats.update(zip(LIBRARY_STATS_KEYS, row))
         except sqlite3.Error as error:
             logger.error(f"Error getting stats: {error}")
         finally:
@@ -910,7 +976,7 @@ class LibraryRepository(SQLiteRepository):
         """
         try:
             cursor.execute(sql, (search_term, search_term, search_term))
-            return [row_to_track(row) for row in cursor.fetchall()]
+            return [row_to_track(row) for row in cursor]
         except sqlite3.Error as error:
             logger.error(f"Search failed: {error}")
             return []
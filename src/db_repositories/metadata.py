@@ -120,6 +120,34 @@ class MetadataRepository(SQLiteRepository):
         )
         self.conn.commit()
 
+    def get_cached_tracklists(
+        self, release_mbids: List[str], max_age_days: int
+    ) -> Dict[str, str]:
+        if not release_mbids:
+            return {}
+        placeholders = ",".join("?" * len(release_mbids))
+        cursor = self.conn.execute(
+            "SELECT release_mbid, payload FROM mb_tracklist_cache "
+            f"WHERE release_mbid IN ({placeholders}) "
+            "AND fetched_at > datetime('now', ?)",
+            (*release_mbids, f"-{int(max_age_days)} days"),
+        )
+        try:
+            return {row["release_mbid"]: row["payload"] for row in cursor}
+        finally:
+            cursor.close()
+
+    def store_tracklist(self, release_mbid: str, payload: str) -> None:
+        self.conn.execute(
+            "INSERT INTO mb_tracklist_cache (release_mbid, payload, fetched_at) "
+            "VALUES (?, ?, CURRENT_TIMESTAMP) "
+            "ON CONFLICT(release_mbid) DO UPDATE SET "
+            "  payload = excluded.payload, "
+            "  fetched_at = CURRENT_TIMESTAMP",
+            (release_mbid, payload),
+        )
+        self.conn.commit()
+
     def get_artists_needing_tags(self, max_age_days: int) -> List[str]:
         cursor = self.conn.execute(
             """
@@ -1,9 +1,10 @@
 """Playlist reads kept behind the public database façade."""
 
 import sqlite3
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from .base import SQLiteRepository
+from .library import TRACK_UPSERT_SQL, TrackRecord, track_upsert_params
 
 
 class PlaylistRepository(SQLiteRepository):
@@ -479,6 +480,43 @@ class PlaylistRepository(SQLiteRepository):
         if inserted:
             bump_updated_at(playlist_id)
 
+    def save_linked_tracks(
+        self,
+        playlist_id: str,
+        entries: Sequence[Tuple[TrackRecord, int]],
+    ) -> int:
+        """Upsert tracks and link them at their orders in one transaction."""
+        cursor = self.conn.cursor()
+        try:
+            began = not self.conn.in_transaction
+            if began:
+                cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(
+                TRACK_UPSERT_SQL,
+                [track_upsert_params(track) for track, _order in entries],
+            )
+            cursor.executemany(
+                "INSERT OR IGNORE INTO playlist_tracks "
+                "(playlist_id, track_mbid, track_order) VALUES (?, ?, ?)",
+                [(playlist_id, track.mbid, order) for track, order in entries],
+            )
+            linked = max(cursor.rowcount, 0)
+            if linked:
+                cursor.execute(
+                    "UPDATE playlists SET updated_at = CURRENT_TIMESTAMP "
+                    "WHERE playlist_id = ?",
+                    (playlist_id,),
+                )
+            if began:
+                self.conn.commit()
+            return linked
+        except Exception:
+            if began:
+                self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
     def fetch_playlist(self, playlist_id: str) -> Optional[sqlite3.Row]:
         cursor = self.conn.cursor()
         try:
@@ -504,12 +542,24 @@ class PlaylistRepository(SQLiteRepository):
         finally:
             cursor.close()
 
-    def fetch_playlist_tracks(
-        self,
-        playlist_id: str,
-        local_only: bool,
-        include_orphans: bool,
-    ) -> List[sqlite3.Row]:
+    def fetch_links(self, playlist_id: str) -> List[Dict[str, object]]:
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT pt.track_mbid, pt.track_order, t.isrc, t.local_path, "
+                "EXISTS (SELECT 1 FROM download_queue dq "
+                "WHERE dq.mbid_guess = pt.track_mbid COLLATE NOCASE) AS queued "
+                "FROM playlist_tracks pt "
+                "JOIN tracks t ON t.mbid = pt.track_mbid "
+                "WHERE pt.playlist_id = ?",
+                (playlist_id,),
+            )
+            return [dict(row) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _playlist_tracks_sql(local_only: bool, include_orphans: bool) -> str:
         sql = (
             "SELECT t.* FROM tracks t "
             "JOIN playlist_tracks pt ON t.mbid = pt.track_mbid "
@@ -519,11 +569,37 @@ class PlaylistRepository(SQLiteRepository):
             sql += " AND t.local_path IS NOT NULL"
         if not include_orphans:
             sql += " AND t.deleted_at IS NULL"
-        sql += " ORDER BY pt.track_order"
+        return sql + " ORDER BY pt.track_order"
 
+    def fetch_playlist_tracks(
+        self,
+        playlist_id: str,
+        local_only: bool,
+        include_orphans: bool,
+    ) -> List[sqlite3.Row]:
         cursor = self.conn.cursor()
         try:
-            cursor.execute(sql, (playlist_id,))
+            cursor.execute(
+                self._playlist_tracks_sql(local_only, include_orphans),
+                (playlist_id,),
+            )
             return cursor.fetchall()
         finally:
             cursor.close()
+
+    def iter_playlist_tracks(
+        self,
+        playlist_id: str,
+        local_only: bool,
+        include_orphans: bool,
+    ) -> Iterator[sqlite3.Row]:
+        """Yield rows straight off the cursor instead of materialising them."""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                self._playlist_tracks_sql(local_only, include_orphans),
+                (playlist_id,),
+            )
+            yield from cursor
+        finally:
+            cursor.close()
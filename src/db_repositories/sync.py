@@ -48,6 +48,30 @@ class SyncRepository(SQLiteRepository):
         self.conn.commit()
         cursor.close()
 
+    def get_sync_stats(self) -> Dict[str, int]:
+        cursor = self.conn.cursor()
+        try:
+            # Grouping on the flag lets SQLite answer from the partial
+            # idx_tracks_sync_state index alone instead of visiting rows.
+            state_rows = cursor.execute(
+                "SELECT synced_to_dap, COUNT(*) FROM tracks "
+                "WHERE local_path IS NOT NULL AND deleted_at IS NULL "
+                "GROUP BY synced_to_dap"
+            ).fetchall()
+            playlist_row = cursor.execute(
+                "SELECT COUNT(*) FROM playlists WHERE deleted_at IS NULL"
+            ).fetchone()
+        finally:
+            cursor.close()
+        total = sum(int(row[1]) for row in state_rows)
+        synced = sum(int(row[1]) for row in state_rows if row[0])
+        return {
+            "total_tracks": total,
+            "synced_tracks": synced,
+            "pending_tracks": total - synced,
+            "total_playlists": int(playlist_row[0]),
+        }
+
     def get_catalog_since(
         self, since_iso: Optional[str]
     ) -> List[Dict[str, object]]:
@@ -188,6 +188,13 @@ TABLE_DEFINITIONS: Dict[str, str] = {
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
     """,
+    "mb_tracklist_cache": """
+        CREATE TABLE IF NOT EXISTS mb_tracklist_cache (
+            release_mbid TEXT PRIMARY KEY,
+            payload TEXT NOT NULL,
+            fetched_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+    """,
     "split_album_dismissals": """
         CREATE TABLE IF NOT EXISTS split_album_dismissals (
             incident_key TEXT PRIMARY KEY,
@@ -209,6 +216,19 @@ BASE_INDEX_DEFINITIONS: Tuple[str, ...] = (
     "CREATE INDEX IF NOT EXISTS idx_play_events_track_mbid "
     "ON play_events(track_mbid)",
     "CREATE INDEX IF NOT EXISTS idx_artist_tags_tag ON artist_tags(tag)",
+    # Identity fallbacks match artist/title case-insensitively once per
+    # imported or ingested file; the collation must match for SQLite to
+    # use the index.
+    "CREATE INDEX IF NOT EXISTS idx_tracks_artist_title "
+    "ON tracks(artist COLLATE NOCASE, title COLLATE NOCASE)",
+    # Playlist reads filter by playlist and ORDER BY track_order; the
+    # primary key only covers (playlist_id, track_mbid).
+    "CREATE INDEX IF NOT EXISTS idx_playlist_tracks_order "
+    "ON playlist_tracks(playlist_id, track_order)",
+    # Playlist re-imports and the release watcher probe the queue by MBID
+    # case-insensitively, once per link or release.
+    "CREATE INDEX IF NOT EXISTS idx_download_queue_mbid_guess "
+    "ON download_queue(mbid_guess COLLATE NOCASE)",
 )
 
 
@@ -312,18 +332,22 @@ def _schema_requires_migration(cursor: sqlite3.Cursor) -> bool:
     ).fetchone():
         return True
 
+    expected_indexes = {"idx_tracks_is_liked", "idx_download_queue_claimable"}
+    if "local_path" in track_columns:
+        expected_indexes.add("idx_tracks_sync_state")
+        if "release_mbid" in track_columns:
+            expected_indexes.add("idx_tracks_local_release")
     migration_indexes = {
         row[0]
         for row in cursor.execute(
             "SELECT name FROM sqlite_master "
-            "WHERE type = 'index' AND name IN (?, ?)",
-            ("idx_tracks_is_liked", "idx_download_queue_claimable"),
+            "WHERE type = 'index' AND name IN ({})".format(
+                ",".join("?" for _ in expected_indexes)
+            ),
+            tuple(expected_indexes),
         ).fetchall()
     }
-    return migration_indexes != {
-        "idx_tracks_is_liked",
-        "idx_download_queue_claimable",
-    }
+    return migration_indexes != expected_indexes
 
 
 def migrate_schema(conn: sqlite3.Connection, logger: logging.Logger) -> None:
@@ -401,6 +425,24 @@ def migrate_schema(conn: sqlite3.Connection, logger: logging.Logger) -> None:
             "CREATE INDEX IF NOT EXISTS idx_tracks_is_liked "
             "ON tracks(is_liked) WHERE is_liked = 1"
         )
+        # Partial covering index for the sync-stats counts: only live local
+        # tracks are indexed, so synced/pending totals never touch the table.
+        if "local_path" in columns:
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tracks_sync_state "
+                "ON tracks(synced_to_dap) "
+                "WHERE local_path IS NOT NULL AND deleted_at IS NULL"
+            )
+        # Covers the album completer's per-release reads and the incomplete
+        # album GROUP BY, both restricted to tracks with a local file.
+        # local_path is included because SQLite re-checks the partial
+        # predicate and would otherwise visit the table for every row.
+        if {"local_path", "release_mbid"} <= set(columns):
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tracks_local_release "
+                "ON tracks(release_mbid, disc_number, track_number, artist, "
+                "album, local_path) WHERE local_path IS NOT NULL"
+            )
 
         playlist_columns = _columns(cursor, "playlists")
         if "updated_at" not in playlist_columns:
@@ -9,6 +9,7 @@ instead of db.queue_download so the routing happens in one place.
 """
 
 import logging
+from typing import List
 
 import requests
 
@@ -69,3 +70,17 @@ def queue_or_forward(db: DatabaseManager, item: DownloadItem) -> int:
         return db.queue_download(item)
 
     return int(data.get("item_id") or 0)
+
+
+def queue_or_forward_many(db: DatabaseManager, items: List[DownloadItem]) -> int:
+    """Route a batch of requests; returns how many were accepted.
+
+    The local queue takes the whole batch in one transaction. Satellites
+    still forward item by item because the master endpoint is per-request.
+    """
+    if not items:
+        return 0
+    config = get_config()
+    if config.is_master or not config.master_url:
+        return db.queue_downloads(items)
+    return sum(1 for item in items if queue_or_forward(db, item))
@@ -57,6 +57,9 @@ FEATURE_CREDIT_SEPARATOR = re.compile(
 )
 SLDL_FAILURE_TAIL_LINES = 80
 SLDL_FAILURE_TAIL_CHARS = 12000
+# sldl redraws transfer progress many times a second; each forwarded line
+# can become a progress-row write, so forward at most one per interval.
+SLDL_PROGRESS_INTERVAL_SECONDS = 0.1
 DEFAULT_LIDARR_MUSIC_ROOT = "/music"
 DEFAULT_DOWNLOAD_MIN_FREE_GIB = 20
 DOWNLOAD_CLAIM_LEASE_SECONDS = 5 * 60
@@ -389,14 +392,18 @@ def discover_downloaded_audio(downloads_dir: str) -> List[str]:
     ]
 
 
-def _discover_incomplete_audio(downloads_dir: str) -> List[str]:
-    """Return sldl temporary files that prove an audio attempt was partial."""
-    return [
-        os.path.join(root, filename)
-        for root, _, files in os.walk(downloads_dir)
-        for filename in files
-        if filename.lower().endswith(INCOMPLETE_AUDIO_EXTENSIONS)
-    ]
+def _discover_staged_audio(downloads_dir: str) -> Tuple[List[str], List[str]]:
+    """Return ``(audio, incomplete)`` files from one walk of a staging tree."""
+    audio: List[str] = []
+    incomplete: List[str] = []
+    for root, _, files in os.walk(downloads_dir):
+        for filename in files:
+            lowered = filename.lower()
+            if lowered.endswith(DOWNLOADED_AUDIO_EXTENSIONS):
+                audio.append(os.path.join(root, filename))
+            elif lowered.endswith(INCOMPLETE_AUDIO_EXTENSIONS):
+                incomplete.append(os.path.join(root, filename))
+    return audio, incomplete
 
 
 def cleanup_empty_download_directories(downloads_dir: str) -> None:
@@ -416,19 +423,20 @@ def read_downloaded_metadata(
     file_path: str, tagged_meta: Optional[Mapping[str, Any]]
 ) -> Optional[DownloadedMetadata]:
     """Read the sort-path identity while retaining legacy tag precedence."""
-    import mutagen
-
-    audio = mutagen.File(file_path)
-    if not audio:
-        return None
-
     if tagged_meta:
+        # The tagger just wrote and re-read these values; parsing the file a
+        # second time would only re-read the tag block it came from.
         artist = str(tagged_meta["artist"])
         album = str(tagged_meta["album"])
         title = str(tagged_meta["title"])
         track_number = tagged_meta.get("track_number", 0)
         disc_number = tagged_meta.get("disc_number", 1)
     else:
+        import mutagen
+
+        audio = mutagen.File(file_path)
+        if not audio:
+            return None
         artist = str(audio.get("artist", ["Unknown Artist"])[0])
         album = str(audio.get("album", ["Unknown Album"])[0])
         title = str(audio.get("title", ["Unknown Title"])[0])
@@ -659,10 +667,7 @@ class Downloader:
                 for entry in os.scandir(self.downloads_dir)
                 if entry.is_dir(follow_symlinks=False)
                 and entry.name.startswith(prefix)
-                and (
-                    discover_downloaded_audio(entry.path)
-                    or _discover_incomplete_audio(entry.path)
-                )
+                and any(_discover_staged_audio(entry.path))
             ]
         except OSError:
             logger.warning(
@@ -687,14 +692,14 @@ class Downloader:
                 expected_track_count = 0
 
         def candidate_rank(path: str) -> Tuple[int, int]:
-            audio = discover_downloaded_audio(path)
+            audio, incomplete = _discover_staged_audio(path)
             flac_count = sum(
                 file_path.lower().endswith(".flac") for file_path in audio
             )
             exact_complete_set = int(
                 expected_track_count > 0
                 and flac_count == expected_track_count
-                and not _discover_incomplete_audio(path)
+                and not incomplete
             )
             return exact_complete_set, os.stat(path).st_mtime_ns
 
@@ -1108,15 +1113,10 @@ class Downloader:
             if include_item_ids is not None
             else None
         )
-        snapshot_items = (
-            self.db.get_downloads(status="pending")
-            + self.db.get_downloads(status="failed")
-        )
         snapshot_ids: Set[int] = {
-            int(item.id)
-            for item in snapshot_items
-            if item.id is not None
-            and (requested_ids is None or int(item.id) in requested_ids)
+            item_id
+            for item_id in self.db.get_download_ids(("pending", "failed"))
+            if requested_ids is None or item_id in requested_ids
         }
         if not snapshot_ids:
             summary = DownloadRunSummary()
@@ -1472,8 +1472,7 @@ class Downloader:
             and staging_dir
             and fallback_enabled
             and fallback_query
-            and not discover_downloaded_audio(staging_dir)
-            and not _discover_incomplete_audio(staging_dir)
+            and not any(_discover_staged_audio(staging_dir))
         ):
             fallback_command, _ = build_download_command(
                 self.slsk_cmd_base,
@@ -1617,6 +1616,8 @@ class Downloader:
             idle_timeout = max(60, int(idle_timeout_seconds or 10 * 60))
             deadline = time.monotonic() + total_timeout
             idle_deadline = time.monotonic() + idle_timeout
+            last_progress = float("-inf")
+            held_progress: Optional[str] = None
 
             # Reading a pipe directly can block forever before ``wait`` gets
             # its timeout. A daemon reader plus a bounded queue wait enforces
@@ -1630,6 +1631,11 @@ class Downloader:
                 try:
                     line = output_queue.get(timeout=min(0.25, remaining))
                 except thread_queue.Empty:
+                    # A quiet pipe is the moment to surface the latest line
+                    # the throttle held back.
+                    if held_progress is not None:
+                        item_callback(held_progress)
+                        held_progress = None
                     continue
                 if line is output_finished:
                     break
@@ -1642,8 +1648,16 @@ class Downloader:
                     output_tail.append(safe_line)
                     logger.debug("SLSK: %s", safe_line)
                     if item_callback:
-                        item_callback(safe_line)
-
+                        now = time.monotonic()
+                        if now - last_progress >= SLDL_PROGRESS_INTERVAL_SECONDS:
+                            last_progress = now
+                            held_progress = None
+                            item_callback(safe_line)
+                        else:
+                            held_progress = safe_line
+
+            if held_progress is not None:
+                item_callback(held_progress)
             self._pulse_active_claim(force=True)
             remaining = deadline - time.monotonic()
             if remaining <= 0:
@@ -2322,10 +2336,11 @@ class Downloader:
             self.scanner,
             self.music_library_dir,
             file_path,
+            source_scanned=True,
             **ingest_options,
         )
         dest_path = ingest_result.path
-        logger.debug(f"Moved to: {dest_path}")
+        logger.debug("Moved to: %s", dest_path)
 
         if tag_tier:
             scanned = self.db.get_track_by_path(dest_path)
@@ -2376,8 +2391,9 @@ class Downloader:
             )
 
         active_staging_dir = staging_dir or self.downloads_dir
-        found_files = discover_downloaded_audio(active_staging_dir)
-        incomplete_files = _discover_incomplete_audio(active_staging_dir)
+        found_files, incomplete_files = _discover_staged_audio(
+            active_staging_dir
+        )
         if not found_files:
             logger.warning(
                 "Download reported success but no audio files found in %s",
@@ -798,6 +798,9 @@ def build_exact_album_fallback_plan(
     if not str(api_key or "").strip():
         return _rejected("An AcoustID API key is required for fallback validation")
 
+    tag_service.prefetch_fingerprints(
+        staged.real_path for staged in staged_files
+    )
     for staged in staged_files:
         try:
             coverage = tag_service.probe_acoustid_coverage(
@@ -241,13 +241,28 @@ def _verify_expected_audio_payload(
         raise tag_service.TagSynchronizationRace(detail)
 
 
-def _remove_superseded_source(src_path: str) -> None:
-    """Remove a staging candidate after a canonical file satisfied it."""
+def _remove_superseded_source(src_path: str, *, linked: bool = False) -> None:
+    """Remove a staging candidate after a canonical file satisfied it.
+
+    ``linked`` means the library file was published as a hard link to the
+    candidate, so a leftover source would still share its inode.
+    """
     try:
         os.remove(src_path)
     except FileNotFoundError:
         pass
     except OSError as exc:
+        if linked:
+            # The library file is already published, so the caller must still
+            # record it; but anything later writing through the staging name
+            # would modify that file in place.
+            logger.error(
+                "ingest: could not unlink staging source %s, which is "
+                "hard-linked to the library file: %s",
+                src_path,
+                exc,
+            )
+            return
         # Per-item staging prevents a leftover candidate from contaminating a
         # later queue item, so cleanup failure is safe to leave for inspection.
         logger.warning(
@@ -358,41 +373,76 @@ def _synchronize_better_destination_tags(
     )
 
 
+def _hardlink_candidate(src_path: str, dest_path: str) -> Optional[str]:
+    """Link the candidate beside its destination without copying its bytes.
+
+    Returns None when staging and library sit on different filesystems (or
+    the filesystem refuses hard links) so the caller falls back to a copy.
+    The source keeps its own name, so a rejected candidate stays retryable.
+    A source whose staging directory is not writable could not be unlinked
+    after publication, so it is copied rather than left sharing an inode
+    with the library file.
+    """
+    if not os.access(os.path.dirname(os.path.abspath(src_path)), os.W_OK):
+        return None
+    temp_path = os.path.join(
+        os.path.dirname(dest_path),
+        f".{os.path.basename(dest_path)}.dapingest-{uuid.uuid4().hex}.tmp",
+    )
+    try:
+        os.link(src_path, temp_path)
+    except OSError:
+        return None
+    return temp_path
+
+
 def _atomic_copy_into_place(
     src_path: str,
     dest_path: str,
     music_library_dir: str,
     expected_audio_payload_sha256: Optional[str] = None,
-) -> bool:
-    """Atomically publish a copy unless a concurrent better copy appeared."""
+) -> Tuple[bool, bool]:
+    """Atomically publish a copy unless a concurrent better copy appeared.
+
+    Returns ``(changed, linked)``; ``linked`` is true when the published
+    file is a hard link to the source rather than a copy.
+    """
     destination_dir = os.path.dirname(dest_path)
     temp_fd = -1
     temp_path: Optional[str] = None
     try:
-        temp_fd, temp_path = tempfile.mkstemp(
-            prefix=f".{os.path.basename(dest_path)}.dapingest-",
-            suffix=".tmp",
-            dir=destination_dir,
-        )
-        with open(src_path, "rb") as source_file, os.fdopen(
-            temp_fd, "wb"
-        ) as temp_file:
-            temp_fd = -1
-            shutil.copyfileobj(source_file, temp_file)
-            temp_file.flush()
-            os.fsync(temp_file.fileno())
-
-        source_mode = stat.S_IMODE(os.stat(src_path).st_mode)
-        os.chmod(temp_path, source_mode)
-        try:
-            shutil.copystat(src_path, temp_path)
-        except OSError as exc:
-            logger.debug("ingest: could not copy file timestamps: %s", exc)
-        _verify_expected_audio_payload(
-            temp_path,
-            expected_audio_payload_sha256,
-            "downloaded FLAC changed while being copied into the library",
-        )
+        temp_path = _hardlink_candidate(src_path, dest_path)
+        if temp_path is None:
+            temp_fd, temp_path = tempfile.mkstemp(
+                prefix=f".{os.path.basename(dest_path)}.dapingest-",
+                suffix=".tmp",
+                dir=destination_dir,
+            )
+            with open(src_path, "rb") as source_file, os.fdopen(
+                temp_fd, "wb"
+            ) as temp_file:
+                temp_fd = -1
+                shutil.copyfileobj(source_file, temp_file)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            source_mode = stat.S_IMODE(os.stat(src_path).st_mode)
+            os.chmod(temp_path, source_mode)
+            try:
+                shutil.copystat(src_path, temp_path)
+            except OSError as exc:
+                logger.debug("ingest: could not copy file timestamps: %s", exc)
+            _verify_expected_audio_payload(
+                temp_path,
+                expected_audio_payload_sha256,
+                "downloaded FLAC changed while being copied into the library",
+            )
+            linked = False
+        else:
+            # The link shares the source inode: mode and timestamps already
+            # match, and the payload is the one verified before publication.
+            with open(temp_path, "rb") as linked_file:
+                os.fsync(linked_file.fileno())
+            linked = True
 
         # A different worker may have published a better file while the
         # candidate was being copied. Re-check immediately before replacement.
@@ -422,7 +472,7 @@ def _atomic_copy_into_place(
                 "ingest: retaining concurrently-written equal-or-better file %s",
                 dest_path,
             )
-            return tags_changed
+            return tags_changed, False
 
         # Re-resolve the destination immediately before replacement.  This
         # catches a swapped symlink or directory that appeared while copying.
@@ -435,7 +485,7 @@ def _atomic_copy_into_place(
         os.replace(temp_path, dest_path)
         temp_path = None
         _fsync_directory(destination_dir)
-        return True
+        return True, linked
     finally:
         if temp_fd >= 0:
             os.close(temp_fd)
@@ -466,7 +516,11 @@ def _move_to_library(
         expected_audio_payload_sha256,
         "downloaded FLAC changed before library publication",
     )
-    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    destination_dir = os.path.dirname(dest_path)
+    # One stat covers the common case of later tracks in an album folder;
+    # makedirs(exist_ok=True) would stat the parent and attempt a mkdir too.
+    if not os.path.isdir(destination_dir):
+        os.makedirs(destination_dir, exist_ok=True)
     # Re-check after directory creation in case a pre-existing parent resolved
     # through a symlink or the final component appeared concurrently.
     _validated_library_path(
@@ -510,13 +564,13 @@ def _move_to_library(
             return IngestResult(path=dest_path, changed=tags_changed)
         logger.info("ingest: atomically upgrading existing %s", dest_path)
 
-    changed = _atomic_copy_into_place(
+    changed, linked = _atomic_copy_into_place(
         src_path,
         dest_path,
         music_library_dir,
         expected_audio_payload_sha256,
     )
-    _remove_superseded_source(src_path)
+    _remove_superseded_source(src_path, linked=linked)
     return IngestResult(path=dest_path, changed=changed)
 
 
@@ -535,6 +589,7 @@ def _ingest_audio_file(
     recording_mbid: Optional[str] = None,
     expected_audio_payload_sha256: Optional[str],
     prefer_scanned_identity: bool,
+    source_scanned: bool = False,
 ) -> IngestResult:
     _verify_expected_audio_payload(
         src_path,
@@ -571,10 +626,12 @@ def _ingest_audio_file(
 
     norm_src = _normalized_path(src_path)
     track = db.get_track_by_path(norm_src)
-    if track is None:
+    if track is None and not source_scanned:
         # Scan tags → upserts a track row with local_path = src_path.  A
         # downloader may already have scanned the temporary file; avoid doing
-        # that work twice when its row is present.
+        # that work twice when its row is present, or when the caller says
+        # the scan ran and chose not to add a row (a logged duplicate or an
+        # unidentifiable file).
         try:
             _scan_file(scanner, src_path)
         except Exception as e:
@@ -589,7 +646,12 @@ def _ingest_audio_file(
 
     # The scanner may have tagged the file (for example through Picard), so
     # read the recording identity once more before resolving a duplicate.
-    scanned_embedded_mbid = read_embedded_recording_mbid(src_path)
+    # A caller-side scan ran before normalisation, which already read it.
+    scanned_embedded_mbid = (
+        embedded_mbid
+        if source_scanned
+        else read_embedded_recording_mbid(src_path)
+    )
     if (
         recording_mbid
         and scanned_embedded_mbid
@@ -768,6 +830,7 @@ def ingest_downloaded_audio_file_with_result(
     disc_number: int = 1,
     recording_mbid: Optional[str] = None,
     expected_audio_payload_sha256: Optional[str] = None,
+    source_scanned: bool = False,
 ) -> IngestResult:
     """Downloaded-file ingest including whether canonical audio changed."""
     return _ingest_audio_file(
@@ -783,4 +846,5 @@ def ingest_downloaded_audio_file_with_result(
         recording_mbid=recording_mbid,
         expected_audio_payload_sha256=expected_audio_payload_sha256,
         prefer_scanned_identity=False,
+        source_scanned=source_scanned,
     )
@@ -2,7 +2,7 @@
 import logging
 import os
 from mediafile import MediaFile, UnreadableFileError
-from typing import Any, Iterable, Literal, Mapping, Optional, Protocol, Tuple
+from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Protocol, Tuple
 
 from .db_manager import DatabaseManager, Track
 from .config_manager import get_config
@@ -23,6 +23,9 @@ SUPPORTED_EXTENSIONS = (
 
 ScanResult = Literal["processed", "skipped"]
 
+# Full scans commit new tracks in groups of this size instead of per file.
+SCAN_WRITE_BATCH = 200
+
 
 class MediaTags(Protocol):
     """Tag attributes consumed by the scanner.
@@ -107,6 +110,11 @@ class LibraryScanner:
     def __init__(self, db: DatabaseManager, picard_path: Optional[str] = None):
         self.db = db
         self.resolved_albums = set()
+        # Tracks and duplicate rows identified during scan_library but not
+        # yet written. None outside a scan, so single process_file calls
+        # write through.
+        self._pending_tracks: Optional[Dict[str, Track]] = None
+        self._pending_duplicates: List[Tuple[str, str]] = []
         if picard_path:
             self.picard_path = picard_path
         else:
@@ -118,10 +126,58 @@ class LibraryScanner:
         if not os.path.exists(library_path):
             return
 
-        for root, _, files in os.walk(library_path):
-            for file in files:
-                if file.lower().endswith(SUPPORTED_EXTENSIONS):
-                    self.process_file(os.path.join(root, file))
+        self._pending_tracks = {}
+        try:
+            for root, _, files in os.walk(library_path):
+                for file in files:
+                    if file.lower().endswith(SUPPORTED_EXTENSIONS):
+                        self.process_file(os.path.join(root, file))
+                        pending = (
+                            len(self._pending_tracks)
+                            + len(self._pending_duplicates)
+                        )
+                        if pending >= SCAN_WRITE_BATCH:
+                            self._flush_pending_tracks()
+        except BaseException:
+            # Keep what was already read, but never let a write failure
+            # replace the error that stopped the scan.
+            try:
+                self._flush_pending_tracks()
+            except Exception as e:
+                logger.error(f"Could not save scanned tracks after error: {e}")
+            raise
+        else:
+            self._flush_pending_tracks()
+        finally:
+            self._pending_tracks = None
+
+    def _flush_pending_tracks(self) -> None:
+        if self._pending_tracks:
+            tracks = list(self._pending_tracks.values())
+            self._pending_tracks.clear()
+            try:
+                self.db.add_or_update_tracks(tracks)
+            except Exception as e:
+                # One bad row must cost only its own file, as it did when
+                # every file was written on its own.
+                logger.warning(
+                    f"Batch write of {len(tracks)} tracks failed, "
+                    f"retrying singly: {e}"
+                )
+                for track in tracks:
+                    try:
+                        self.db.add_or_update_track(track)
+                    except Exception as track_error:
+                        logger.error(
+                            f"Could not save {track.local_path}: {track_error}"
+                        )
+        if self._pending_duplicates:
+            rows = list(self._pending_duplicates)
+            self._pending_duplicates.clear()
+            try:
+                self.db.log_duplicate_rows(rows)
+            except Exception as e:
+                logger.error(f"Could not log {len(rows) // 2} duplicates: {e}")
 
     def _fetch_release_info_from_api(
         self, recording_mbid: str, album_name_hint: str
@@ -147,7 +203,7 @@ class LibraryScanner:
         try:
             return MediaFile(file_path)
         except (UnreadableFileError, OSError) as e:
-            logger.debug(f"Skipping unreadable file {file_path}: {e}")
+            logger.debug("Skipping unreadable file %s: %s", file_path, e)
             return None
 
     def _read_identified_media(self, file_path: str) -> Optional[MediaTags]:
@@ -159,7 +215,7 @@ class LibraryScanner:
 
         refreshed = self._read_media_file(file_path)
         if refreshed is None:
-            logger.debug(f"Skipping after picard re-read {file_path}")
+            logger.debug("Skipping after picard re-read %s", file_path)
         return refreshed
 
     def _enrich_release_metadata(
@@ -196,11 +252,20 @@ class LibraryScanner:
         self.resolved_albums.add(media.mb_albumid)
 
     def _is_duplicate(self, track: Track) -> bool:
-        existing = self.db.get_track_by_mbid(track.mbid)
+        existing = None
+        if self._pending_tracks is not None:
+            existing = self._pending_tracks.get(track.mbid)
+        if existing is None:
+            existing = self.db.get_track_by_mbid(track.mbid)
         if not existing or not existing.local_path:
             return False
-        self.db.log_duplicate(track.mbid, existing.local_path)
-        self.db.log_duplicate(track.mbid, track.local_path)
+        if self._pending_tracks is not None:
+            self._pending_duplicates.append((track.mbid, existing.local_path))
+            self._pending_duplicates.append((track.mbid, track.local_path))
+        else:
+            self.db.log_duplicates(
+                track.mbid, [existing.local_path, track.local_path]
+            )
         return True
 
     def process_file(self, file_path: str) -> ScanResult:
@@ -232,7 +297,10 @@ class LibraryScanner:
         if self._is_duplicate(track):
             return "skipped"
 
-        self.db.add_or_update_track(track)
+        if self._pending_tracks is not None:
+            self._pending_tracks[track.mbid] = track
+        else:
+            self.db.add_or_update_track(track)
         return "processed"
 
     def _process_file(self, file_path: str) -> ScanResult:
@@ -11,21 +11,28 @@ from config.
 import logging
 import threading
 import time
+from collections import deque
 
 import musicbrainzngs
 
+from .config_manager import ConfigManager
+
 logger = logging.getLogger(__name__)
 
 _APP_NAME = "DAPManager"
 _APP_VERSION = "0.1.0"
 _FALLBACK_CONTACT = "https://github.com/vigneshmohan2002/DAPManager"
 _MIN_INTERVAL_SEC = 1.1
+# Sliding window: up to _BURST calls per _BURST * _MIN_INTERVAL_SEC seconds.
+# The long-run rate is unchanged, but a short run of lookups (a handful of
+# albums) goes out back-to-back instead of idling between every request.
+_BURST = 10
 
 _useragent_lock = threading.Lock()
 _useragent_set = False
 
 _rate_lock = threading.Lock()
-_last_call = 0.0
+_recent_calls = deque()  # monotonic start times of recent calls, oldest first
 
 
 def configure(contact: str = "") -> None:
@@ -35,34 +42,31 @@ def configure(contact: str = "") -> None:
         if _useragent_set:
             return
         contact = contact.strip() if contact else _FALLBACK_CONTACT
-        try:
-            musicbrainzngs.set_useragent(_APP_NAME, _APP_VERSION, contact)
-            _useragent_set = True
-        except Exception as e:
-            logger.warning(f"Failed to set MusicBrainz user-agent: {e}")
+        musicbrainzngs.set_useragent(_APP_NAME, _APP_VERSION, contact)
+        # musicbrainzngs spaces every request one second apart on its own,
+        # which would flatten the burst window below; _wait_for_slot is the
+        # only limiter.
+        musicbrainzngs.set_rate_limit(False)
+        _useragent_set = True
 
 
 def _ensure_configured() -> None:
     if _useragent_set:
         return
-    contact = ""
-    try:
-        from .config_manager import ConfigManager
-        if ConfigManager._instance is not None:
-            contact = ConfigManager._instance.contact_email
-    except Exception:
-        pass
-    configure(contact)
+    config = ConfigManager._instance
+    configure(config.contact_email if config is not None else "")
 
 
 def _wait_for_slot() -> None:
-    global _last_call
     with _rate_lock:
+        window = _BURST * _MIN_INTERVAL_SEC
         now = time.monotonic()
-        delta = now - _last_call
-        if delta < _MIN_INTERVAL_SEC:
-            time.sleep(_MIN_INTERVAL_SEC - delta)
-        _last_call = time.monotonic()
+        while _recent_calls and now - _recent_calls[0] >= window:
+            _recent_calls.popleft()
+        if len(_recent_calls) >= _BURST:
+            time.sleep(_recent_calls[0] + window - now)
+            _recent_calls.popleft()
+        _recent_calls.append(time.monotonic())
 
 
 def get_release_by_id(release_mbid: str, includes=None):
@@ -116,8 +120,8 @@ def get_artist_tags(artist_mbid: str):
 
 def reset_for_tests() -> None:
     """Reset module state. Tests only."""
-    global _useragent_set, _last_call
+    global _useragent_set
     with _useragent_lock:
         _useragent_set = False
     with _rate_lock:
-        _last_call = 0.0
+        _recent_calls.clear()
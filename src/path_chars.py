@@ -0,0 +1,9 @@
+"""
+Filename character rules shared by the library, DAP and quality modules.
+
+Kept free of imports so the database layer can use it without loading the
+tagging stack.
+"""
+
+# Characters illegal in Windows/macOS filenames, mapped to "_".
+UNSAFE_PATH_CHARS = str.maketrans(dict.fromkeys('\\/*?:"<>|', "_"))
@@ -10,6 +10,7 @@ testable.
 from __future__ import annotations
 
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import logging
@@ -20,6 +21,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Mapping,
     Optional,
@@ -42,6 +44,7 @@ MAX_SEARCH_RESULTS = 8
 MAX_TRACKED_REQUESTS = 30
 LIDARR_IMPORT_STALE_SECONDS = 6 * 60 * 60
 EXACT_RELEASE_PRIMARY_TYPES = frozenset({"album", "ep", "single"})
+_TAG_READ_WORKERS = 8
 _SEARCH_SPLIT_RE = re.compile(r"\s+(?:-|\N{EN DASH}|\N{EM DASH})\s+", re.UNICODE)
 
 
@@ -895,6 +898,27 @@ def _path_is_safe_library_flac(
     return True
 
 
+def _read_release_track_identities(
+    paths: Iterable[str],
+) -> Dict[str, Optional[FlacReleaseTrackIdentity]]:
+    """Read embedded identities for a release's files on a small pool.
+
+    The downloader re-inspects the release after every imported file, so a
+    serial loop re-opened each FLAC one after another per import.
+    """
+    unique_paths = list(dict.fromkeys(paths))
+    if len(unique_paths) <= 1:
+        return {
+            path: read_flac_release_track_identity(path)
+            for path in unique_paths
+        }
+    with ThreadPoolExecutor(max_workers=_TAG_READ_WORKERS) as pool:
+        return dict(zip(
+            unique_paths,
+            pool.map(read_flac_release_track_identity, unique_paths),
+        ))
+
+
 def inspect_release_inventory(
     db: AlbumRequestStore,
     release_mbid: str,
@@ -991,6 +1015,7 @@ def inspect_release_inventory(
     accessible_ids = set()
     invalid_actual: List[str] = []
     metadata_mismatches = set()
+    readable_rows: List[Tuple[str, str, Mapping[str, Any]]] = []
     for row in db.get_local_release_recordings(release_mbid):
         actual = canonical_release_mbid(row.get("mbid"))
         if not actual:
@@ -1003,7 +1028,12 @@ def inspect_release_inventory(
             music_library_dir,
         ):
             continue
-        embedded = read_flac_release_track_identity(path)
+        readable_rows.append((actual, path, row))
+    embedded_by_path = _read_release_track_identities(
+        path for _, path, _ in readable_rows
+    )
+    for actual, path, row in readable_rows:
+        embedded = embedded_by_path[path]
         if (
             embedded is None
             or embedded.recording_mbid != actual
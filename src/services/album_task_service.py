@@ -130,6 +130,7 @@ def run_album_completion_pipeline(
     db_path: str,
     config_values: Mapping[str, Any],
     run_downloads: bool = False,
+    refresh_tracklists: bool = False,
     progress_callback: Optional[ProgressCallback] = None,
     database_factory: DatabaseContextFactory,
     complete_albums: CompleteAlbumsOperation,
@@ -146,6 +147,7 @@ def run_album_completion_pipeline(
         summary = complete_albums(
             db,
             progress_callback=progress_callback,
+            refresh_tracklists=refresh_tracklists,
         )
 
     should_download = (
@@ -116,10 +116,18 @@ def reload_runtime_config(
     start_sync_scheduler: StartupAwareRestart,
     start_release_watcher: Callable[[], Any],
     start_library_maintenance_scheduler: StartupAwareRestart,
+    values: Mapping[str, Any] | None = None,
 ) -> None:
-    """Reload process state and restart only schedulers affected by a write."""
+    """Reload process state and restart only schedulers affected by a write.
+
+    ``values`` is the config just written; when given, it is adopted
+    directly instead of reading config.json back.
+    """
     if runtime_config is not None:
-        runtime_config._load_config()
+        if values is not None and isinstance(runtime_config, ConfigManager):
+            runtime_config.load_values(values)
+        else:
+            runtime_config._load_config()
         if isinstance(runtime_config, ConfigManager):
             ConfigManager._instance = runtime_config
 
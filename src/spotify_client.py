@@ -1,18 +1,55 @@
 import os
+import re
 import sys
 import spotipy
 from spotipy.oauth2 import SpotifyClientCredentials
 import musicbrainzngs
+import requests
+from requests.adapters import HTTPAdapter
 from .db_manager import DatabaseManager, Track, Playlist, DownloadItem
 from .config_manager import get_config
-from .download_request import queue_or_forward
+from .download_request import queue_or_forward_many
 from . import musicbrainz_client as mb
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logger = logging.getLogger(__name__)
 
+_HTTP_POOL_SIZE = 10
+# Resolved tracks are persisted in batches of this size, so a long
+# MusicBrainz pass does not hold every DB write until the very end.
+_STORE_BATCH_SIZE = 100
+
+# Share links (optionally localised or in the legacy /user/<name>/ form)
+# and bare 22-character playlist IDs.
+_PLAYLIST_URL_RE = re.compile(
+    r"^(?:https?://open\.spotify\.com/(?:intl-[a-z-]+/)?"
+    r"(?:user/[^/?#]+/)?playlist/(?P<url_id>[A-Za-z0-9]{22})/?(?:\?.*)?"
+    r"|(?P<id>[A-Za-z0-9]{22}))$"
+)
+
+
+def parse_playlist_id(playlist_url: str) -> Optional[str]:
+    """Return the playlist ID from a Spotify playlist URL or bare ID, or None."""
+    match = _PLAYLIST_URL_RE.match(playlist_url.strip())
+    if not match:
+        return None
+    return match.group("url_id") or match.group("id")
+
+
+def _pooled_session() -> requests.Session:
+    """One keep-alive pool shared by the token fetch and every API call."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_HTTP_POOL_SIZE,
+        pool_maxsize=_HTTP_POOL_SIZE,
+    )
+    session.mount("https://", adapter)
+    return session
+
 
 class SpotifyClient:
     """
@@ -27,6 +64,10 @@ class SpotifyClient:
         """
         self.db = db
         self.sp = None
+        self._token_prefetch: Optional[threading.Thread] = None
+        # ISRC -> MBID answers from MusicBrainz (None = no recording), kept
+        # for this client's lifetime so repeated ISRCs cost one lookup.
+        self._isrc_mbids: Dict[str, Optional[str]] = {}
         self._setup_clients()
 
     def _setup_clients(self):
@@ -35,14 +76,19 @@ class SpotifyClient:
         # Setup Spotify (Spotipy)
         # Relies on SPOTIPY_CLIENT_ID and SPOTIPY_CLIENT_SECRET env variables
         try:
-            auth_manager = SpotifyClientCredentials()
-            self.sp = spotipy.Spotify(auth_manager=auth_manager)
+            session = _pooled_session()
+            auth_manager = SpotifyClientCredentials(requests_session=session)
+            self.sp = spotipy.Spotify(
+                auth_manager=auth_manager,
+                requests_session=session,
+            )
         except spotipy.oauth2.SpotifyOauthError as e:
             logger.error(
                 "Spotify authentication failed. Set SPOTIPY_CLIENT_ID and "
                 "SPOTIPY_CLIENT_SECRET env vars. Error: %s", e
             )
             raise
+        self._start_token_prefetch(auth_manager)
 
         # MusicBrainz user-agent setup is centralized in musicbrainz_client.
         try:
@@ -53,15 +99,36 @@ class SpotifyClient:
 
         logger.info("Spotify and MusicBrainz clients initialized.")
 
+    def _start_token_prefetch(self, auth_manager) -> None:
+        """Fetch the client-credentials token off the main thread so its
+        HTTPS round-trip overlaps the rest of setup instead of stalling the
+        first playlist request."""
+
+        def prefetch():
+            try:
+                auth_manager.get_access_token(as_dict=False)
+            except Exception as e:
+                # The first API call retries and reports the real error.
+                logger.debug(f"Spotify token prefetch failed: {e}")
+
+        self._token_prefetch = threading.Thread(
+            target=prefetch, name="spotify-token", daemon=True
+        )
+        self._token_prefetch.start()
+
+    def _await_token(self) -> None:
+        if self._token_prefetch is not None:
+            self._token_prefetch.join()
+            self._token_prefetch = None
+
     def process_playlist(self, playlist_url: str):
         """
         Main function to process a Spotify playlist.
         Fetches tracks, finds MBIDs, and updates the database.
         :param playlist_url: The full URL of the Spotify playlist.
         """
-        try:
-            playlist_id = playlist_url.split("/")[-1].split("?")[0]
-        except (AttributeError, IndexError):
+        playlist_id = parse_playlist_id(playlist_url)
+        if playlist_id is None:
             logger.error(f"Invalid Spotify playlist URL: {playlist_url}")
             return
 
@@ -69,11 +136,59 @@ class SpotifyClient:
 
         # Fetch playlist details and all tracks (handles pagination)
         playlist_name, spotify_tracks = self._fetch_playlist_details(playlist_id)
+        self._import_playlist(
+            playlist_url, playlist_id, playlist_name, spotify_tracks
+        )
+
+    def process_playlists(self, playlist_urls: List[str]) -> int:
+        """
+        Process several playlists with one client, returning how many were
+        valid. Spotify fetches for later playlists run on a background
+        worker while the current one is matched against MusicBrainz, which
+        is rate-limited and dominates the runtime. Database work stays on
+        the calling thread.
+        """
+        targets = []
+        for playlist_url in playlist_urls:
+            if not playlist_url.strip():
+                continue
+            playlist_id = parse_playlist_id(playlist_url)
+            if playlist_id is None:
+                logger.error(f"Invalid Spotify playlist URL: {playlist_url}")
+                continue
+            targets.append((playlist_url, playlist_id))
 
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="spotify-fetch")
+        try:
+            fetches = [
+                pool.submit(self._fetch_playlist_details, playlist_id)
+                for _, playlist_id in targets
+            ]
+            for (playlist_url, playlist_id), fetch in zip(targets, fetches):
+                logger.info(f"Processing playlist ID: {playlist_id}")
+                playlist_name, spotify_tracks = fetch.result()
+                self._import_playlist(
+                    playlist_url, playlist_id, playlist_name, spotify_tracks
+                )
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        return len(targets)
+
+    def _import_playlist(
+        self,
+        playlist_url: str,
+        playlist_id: str,
+        playlist_name: Optional[str],
+        spotify_tracks: Optional[List[dict]],
+    ):
+        """Persist a fetched playlist and resolve its tracks."""
         if not playlist_name or not spotify_tracks:
             logger.error("Could not fetch playlist details. Exiting.")
             return
 
+        if playlist_url.strip() == playlist_id:
+            # A bare ID was given; store a link that can be opened.
+            playlist_url = f"https://open.spotify.com/playlist/{playlist_id}"
         # Add/Update the playlist in our database
         playlist_data = Playlist(
             playlist_id=playlist_id, name=playlist_name, spotify_url=playlist_url
@@ -82,13 +197,42 @@ class SpotifyClient:
         logger.info(f"Playlist '{playlist_name}' saved to database.")
 
         logger.info(f"Found {len(spotify_tracks)} tracks. Processing each...")
+        # On a re-run most items are already linked at the same position;
+        # recognising them by ISRC avoids a MusicBrainz round-trip each.
+        linked_by_isrc = {
+            link["isrc"]: link
+            for link in self.db.get_playlist_links(playlist_id)
+            if link["isrc"]
+        }
+        resolved = []
+        unchanged = 0
         for i, item in enumerate(spotify_tracks):
             if not item or not item.get("track"):
                 logger.warning(f"Skipping empty track item at position {i}")
                 continue
-            # MB rate limiting is handled by musicbrainz_client.
-            self._process_track(item["track"], playlist_id, i)
-
+            isrc = (item["track"].get("external_ids") or {}).get("isrc")
+            link = linked_by_isrc.get(isrc) if isrc else None
+            if link and link["track_order"] == i:
+                if link["local_path"] or link["queued"]:
+                    unchanged += 1
+                    continue
+                # Linked but neither on disk nor queued: reuse the catalog
+                # row so it still reaches the download queue.
+                track_data = self.db.get_track_by_mbid(link["track_mbid"])
+            else:
+                # MB rate limiting is handled by musicbrainz_client.
+                track_data = self._resolve_track(item["track"])
+            if track_data:
+                resolved.append((track_data, i))
+            if len(resolved) >= _STORE_BATCH_SIZE:
+                self._store_playlist_tracks(playlist_id, resolved)
+                resolved = []
+
+        if unchanged:
+            logger.info(f"{unchanged} tracks already linked; skipped lookups.")
+
+        if resolved:
+            self._store_playlist_tracks(playlist_id, resolved)
         logger.info("Playlist processing complete.")
 
     def _fetch_playlist_details(
@@ -98,6 +242,7 @@ class SpotifyClient:
         Fetches the playlist name and a *full* list of all its tracks,
         handling Spotify's API pagination automatically.
         """
+        self._await_token()
         try:
             logger.info("Fetching playlist info...")
             playlist_info = self.sp.playlist(playlist_id, fields="name")
@@ -129,12 +274,17 @@ class SpotifyClient:
         :param isrc: The ISRC string.
         :return: A MusicBrainz Recording ID (MBID) or None.
         """
+        if isrc in self._isrc_mbids:
+            return self._isrc_mbids[isrc]
         try:
             logger.debug(f"Looking up MBID for ISRC {isrc}")
             result = mb.get_recordings_by_isrc(isrc)
 
+            mbid = None
             if result.get("isrc") and result["isrc"].get("recording-list"):
-                return result["isrc"]["recording-list"][0]["id"].strip().lower()
+                mbid = result["isrc"]["recording-list"][0]["id"].strip().lower()
+            self._isrc_mbids[isrc] = mbid
+            return mbid
 
         except musicbrainzngs.WebServiceError as e:
             logger.warning(f"MusicBrainz API error for ISRC {isrc}: {e}")
@@ -145,7 +295,7 @@ class SpotifyClient:
                 return self._get_mbid_from_isrc(isrc)
         except (KeyError, IndexError, TypeError):
             # No match found - common, not worth logging.
-            pass
+            self._isrc_mbids[isrc] = None
         except Exception as e:
             logger.error(f"Unexpected error querying MusicBrainz: {e}", exc_info=True)
 
@@ -156,6 +306,15 @@ class SpotifyClient:
         Processes a single track from the playlist.
         Finds MBID, checks DB, and adds to queue if needed.
         """
+        track_data = self._resolve_track(spotify_track)
+        if track_data:
+            self._store_playlist_tracks(playlist_id, [(track_data, track_order)])
+
+    def _resolve_track(self, spotify_track: dict) -> Optional[Track]:
+        """
+        Matches a Spotify track to an MBID and merges it with any existing
+        catalog row. Performs lookups only; nothing is written.
+        """
         try:
             isrc = spotify_track["external_ids"].get("isrc")
             title = spotify_track["name"]
@@ -165,26 +324,23 @@ class SpotifyClient:
 
             if not isrc:
                 logger.warning(f"No ISRC for '{title}'. Cannot match to MBID. Skipping.")
-                return
+                return None
 
         except KeyError:
             logger.error("Track data is malformed. Skipping.")
-            return
+            return None
 
         mbid = self._get_mbid_from_isrc(isrc)
 
         if not mbid:
             logger.warning(f"No MBID found for ISRC {isrc} ('{title}'). Skipping.")
-            return
+            return None
         logger.info(f"  Matched: ISRC {isrc} -> MBID {mbid}")
 
         # Check our database
         existing_track = self.db.get_track_by_mbid(mbid)
 
-        # Create/Update the master track data
-
-        # === START BUG FIX ===
-        # Check if track exists. If so, update it but PRESERVE
+        # If the track exists, update its metadata but PRESERVE
         # local_path and sync status.
         if existing_track:
             logger.debug(f"Track {mbid} exists. Merging metadata.")
@@ -200,25 +356,34 @@ class SpotifyClient:
             track_data = Track(
                 mbid=mbid, title=title, artist=artist, album=album, isrc=isrc
             )
+        return track_data
 
-        # Save the merged or new data
-        self.db.add_or_update_track(track_data)
-        # === END BUG FIX ===
-
-        # Link this track to the playlist
-        self.db.link_track_to_playlist(playlist_id, mbid, track_order)
-
-        # Decide if download is needed
-        if track_data.local_path:
-            logger.info(f"  Found locally: {os.path.basename(track_data.local_path)}")
-        else:
-            logger.info("  Queuing for download.")
-            download_item = DownloadItem(
-                search_query=f"{artist} - {title}",
-                playlist_id=playlist_id,
-                mbid_guess=mbid,
-            )
-            queue_or_forward(self.db, download_item)
+    def _store_playlist_tracks(
+        self, playlist_id: str, resolved: List[Tuple[Track, int]]
+    ):
+        """
+        Saves resolved tracks, links them to the playlist, and queues the
+        ones that aren't available locally.
+        """
+        self.db.save_playlist_tracks(playlist_id, resolved)
+
+        to_download = []
+        for track_data, _order in resolved:
+            if track_data.local_path:
+                logger.info(
+                    f"  Found locally: {os.path.basename(track_data.local_path)}"
+                )
+            else:
+                to_download.append(
+                    DownloadItem(
+                        search_query=f"{track_data.artist} - {track_data.title}",
+                        playlist_id=playlist_id,
+                        mbid_guess=track_data.mbid,
+                    )
+                )
+        if to_download:
+            logger.info(f"  Queuing {len(to_download)} tracks for download.")
+            queue_or_forward_many(self.db, to_download)
 
 
 # --- Main execution block ---
@@ -240,16 +405,17 @@ if __name__ == "__main__":
     # Check for command-line argument
     if len(sys.argv) < 2:
         print("=" * 80)
-        print("Usage: python spotify_client.py <full_spotify_playlist_url>")
+        print("Usage: python spotify_client.py <playlist_url> [<playlist_url> ...]")
         print("=" * 80)
         sys.exit(1)
 
-    playlist_url = sys.argv[1]
+    playlist_urls = sys.argv[1:]
     DB_FILE = "dap_library.db"
 
     try:
         with DatabaseManager(DB_FILE) as db:
-            client = SpotifyClient(db)
-            client.process_playlist(playlist_url)
+            # One client for every URL: the token and pooled HTTPS
+            # connections are reused instead of re-established per playlist.
+            SpotifyClient(db).process_playlists(playlist_urls)
     except Exception as e:
         print(f"\nAn overall error occurred: {e}", file=sys.stderr)
@@ -206,21 +206,22 @@ class EnhancedDapSyncer:
             return list(tracks_dict.values())
 
         elif mode == SyncMode.FULL_LIBRARY:
-            # Sync entire library
-            all_tracks = self.db.get_all_tracks(local_only=True)
-            return [t for t in all_tracks if not t.synced_to_dap]
+            # Sync entire library; only pending tracks are kept in memory.
+            return [
+                t
+                for t in self.db.iter_all_tracks(local_only=True)
+                if not t.synced_to_dap
+            ]
 
         elif mode == SyncMode.SELECTIVE:
             # Sync specific artist or filtered tracks
-            all_tracks = self.db.get_all_tracks(local_only=True)
-            tracks = [t for t in all_tracks if not t.synced_to_dap]
-
-            if artist_filter:
-                tracks = [
-                    t for t in tracks if artist_filter.lower() in t.artist.lower()
-                ]
-
-            return tracks
+            needle = artist_filter.lower() if artist_filter else None
+            return [
+                t
+                for t in self.db.iter_all_tracks(local_only=True)
+                if not t.synced_to_dap
+                and (needle is None or needle in t.artist.lower())
+            ]
 
         return []
 
@@ -586,26 +587,7 @@ class EnhancedDapSyncer:
 
     def get_sync_stats(self) -> dict:
         """Get statistics about what needs syncing."""
-        stats = {
-            "total_tracks": len(self.db.get_all_tracks(local_only=True)),
-            "synced_tracks": len(
-                [t for t in self.db.get_all_tracks(local_only=True) if t.synced_to_dap]
-            ),
-            "pending_tracks": len(
-                [
-                    t
-                    for t in self.db.get_all_tracks(local_only=True)
-                    if not t.synced_to_dap
-                ]
-            ),
-            "total_playlists": len(self.db.get_all_playlists()),
-        }
-        stats["sync_percentage"] = (
-            stats["synced_tracks"] / stats["total_tracks"] * 100
-            if stats["total_tracks"] > 0
-            else 0
-        )
-        return stats
+        return self.db.get_sync_stats()
 
 
 def sync_mode_from_value(value: str) -> SyncMode:
@@ -22,9 +22,22 @@ import os
 import shutil
 import stat
 import tempfile
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Literal, Mapping, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import acoustid
 import musicbrainzngs
@@ -44,6 +57,26 @@ logger = logging.getLogger(__name__)
 # one as an error on every run.
 TAGGABLE_EXTENSIONS = {".flac", ".mp3", ".ogg", ".m4a", ".mp4"}
 
+# Fingerprinting runs fpcalc and decodes the whole file (seconds per track),
+# and one file is often fingerprinted more than once per session (identify,
+# then a coverage probe or a release check). Results are reused while the
+# file's size and mtime are unchanged.
+_FINGERPRINT_CACHE_SIZE = 512
+_fingerprint_cache: "OrderedDict[Tuple[str, int, int], Tuple[float, Any]]" = (
+    OrderedDict()
+)
+_fingerprint_lock = threading.Lock()
+
+# Every track of an album resolves to the same MusicBrainz release, so a
+# batch of downloads or retags would otherwise fetch that release once per
+# file under the 1 req/s limit. Releases are reused for a short window only,
+# long enough to span one album but not to go stale across sessions.
+_RELEASE_INCLUDES = ("artists", "recordings", "release-groups")
+_RELEASE_CACHE_SIZE = 64
+_RELEASE_CACHE_TTL_SEC = 600.0
+_release_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_release_lock = threading.Lock()
+
 CONFIDENCE_GREEN = 0.90
 CONFIDENCE_YELLOW = 0.50
 ACOUSTID_AMBIGUITY_MARGIN = 0.05
@@ -429,6 +462,113 @@ def is_safe_auto_candidate(
     )
 
 
+def _fingerprint_file(filepath: str) -> Tuple[float, Any]:
+    """``acoustid.fingerprint_file`` memoized on (path, mtime, size)."""
+    key = _fingerprint_key(filepath)
+    if key is None:
+        return acoustid.fingerprint_file(filepath)
+    with _fingerprint_lock:
+        cached = _fingerprint_cache.get(key)
+        if cached is not None:
+            _fingerprint_cache.move_to_end(key)
+            return cached
+    result = acoustid.fingerprint_file(filepath)
+    with _fingerprint_lock:
+        _fingerprint_cache[key] = result
+        while len(_fingerprint_cache) > _FINGERPRINT_CACHE_SIZE:
+            _fingerprint_cache.popitem(last=False)
+    return result
+
+
+def _fingerprint_key(filepath: str) -> Optional[Tuple[str, int, int]]:
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return (os.path.realpath(filepath), st.st_mtime_ns, st.st_size)
+
+
+def prefetch_fingerprints(
+    filepaths: Iterable[str], max_workers: Optional[int] = None
+) -> int:
+    """Fingerprint many files in parallel and seed the fingerprint cache.
+
+    Uncached files are spread over a thread pool: the shipped image has no
+    chromaprint library, so each fingerprint is an ``fpcalc`` subprocess
+    and threads only wait on it. Threads also keep this safe to call from
+    the downloader's background threads, where forking is not. The
+    AcoustID/MusicBrainz lookups that follow stay in the caller, under the
+    shared rate limiter, and hit the cache per file.
+    Failures are left for the per-file call to report. Returns the number
+    of files newly fingerprinted.
+    """
+    pending: Dict[Tuple[str, int, int], str] = {}
+    for filepath in filepaths:
+        key = _fingerprint_key(filepath)
+        if key is None:
+            continue
+        with _fingerprint_lock:
+            if key in _fingerprint_cache:
+                continue
+        pending.setdefault(key, filepath)
+    if len(pending) < 2:
+        return 0
+
+    workers = min(len(pending), max_workers or os.cpu_count() or 1)
+    fetched = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            key: pool.submit(acoustid.fingerprint_file, filepath)
+            for key, filepath in pending.items()
+        }
+        for key, future in futures.items():
+            try:
+                result = future.result()
+            except Exception as exc:
+                logger.debug(
+                    "prefetch_fingerprints: %s failed: %s",
+                    os.path.basename(pending[key]),
+                    exc,
+                )
+                continue
+            with _fingerprint_lock:
+                _fingerprint_cache[key] = result
+                while len(_fingerprint_cache) > _FINGERPRINT_CACHE_SIZE:
+                    _fingerprint_cache.popitem(last=False)
+            fetched += 1
+    return fetched
+
+
+def _get_release(release_id: str) -> Dict[str, Any]:
+    """``mb.get_release_by_id`` for tagging, reused across one album."""
+    now = time.monotonic()
+    with _release_lock:
+        cached = _release_cache.get(release_id)
+        if cached is not None and now - cached[0] < _RELEASE_CACHE_TTL_SEC:
+            _release_cache.move_to_end(release_id)
+            return cached[1]
+    mb_data = mb.get_release_by_id(release_id, includes=list(_RELEASE_INCLUDES))
+    with _release_lock:
+        _release_cache[release_id] = (now, mb_data)
+        _release_cache.move_to_end(release_id)
+        while len(_release_cache) > _RELEASE_CACHE_SIZE:
+            _release_cache.popitem(last=False)
+    return mb_data
+
+
+def clear_release_cache() -> None:
+    """Drop reused MusicBrainz releases, e.g. after editing one upstream."""
+    with _release_lock:
+        _release_cache.clear()
+
+
+def reset_for_tests() -> None:
+    """Reset module state. Tests only."""
+    with _fingerprint_lock:
+        _fingerprint_cache.clear()
+    clear_release_cache()
+
+
 def probe_acoustid_coverage(
     filepath: str,
     api_key: str,
@@ -447,7 +587,7 @@ def probe_acoustid_coverage(
         return AcoustIDCoverage("unavailable")
 
     try:
-        duration, fingerprint = acoustid.fingerprint_file(filepath)
+        duration, fingerprint = _fingerprint_file(filepath)
     except Exception as exc:
         logger.warning(
             "probe_acoustid_coverage: fingerprint failed on %s: %s",
@@ -519,7 +659,7 @@ def identify_file(
     mb.configure(contact)
 
     try:
-        duration, fingerprint = acoustid.fingerprint_file(filepath)
+        duration, fingerprint = _fingerprint_file(filepath)
     except Exception as e:
         logger.warning(f"identify_file: fingerprint failed on {filepath}: {e}")
         return None
@@ -558,9 +698,7 @@ def identify_file(
     recording_id, release_id = recording_identity
 
     try:
-        mb_data = mb.get_release_by_id(
-            release_id, includes=["artists", "recordings", "release-groups"]
-        )
+        mb_data = _get_release(release_id)
     except musicbrainzngs.WebServiceError as e:
         logger.error(f"identify_file: MusicBrainz error: {e}")
         return None
@@ -624,7 +762,7 @@ def identify_file_for_release(
 
     mb.configure(contact)
     try:
-        duration, fingerprint = acoustid.fingerprint_file(filepath)
+        duration, fingerprint = _fingerprint_file(filepath)
     except Exception as exc:
         logger.warning(
             "identify_file_for_release: fingerprint failed on %s: %s",
@@ -713,10 +851,7 @@ def identify_file_for_release(
         return None
 
     try:
-        mb_data = mb.get_release_by_id(
-            expected_release,
-            includes=["artists", "recordings", "release-groups"],
-        )
+        mb_data = _get_release(expected_release)
     except musicbrainzngs.WebServiceError as exc:
         logger.error("identify_file_for_release: MusicBrainz error: %s", exc)
         return None
@@ -1,12 +1,12 @@
 
 import time
 import os
-import re
 import logging
 from functools import wraps
 import acoustid
 from mediafile import MediaFile, UnreadableFileError
 from .config_manager import get_config
+from .path_chars import UNSAFE_PATH_CHARS
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +46,7 @@ def sanitize_path_component(name: str) -> str:
     """Strip characters that are illegal in Windows/macOS filenames."""
     if not name:
         return "Unknown"
-    return re.sub(r'[\\/*?:"<>|]', "_", name)
+    return name.translate(UNSAFE_PATH_CHARS)
 
 
 def get_mbid_from_tags(file_path: str):
@@ -66,6 +66,15 @@ def get_release_mbid_from_tags(file_path: str):
         return None
 
 
+def get_mbids_from_tags(file_path: str):
+    """Return ``(recording_mbid, release_mbid)`` from one tag read."""
+    try:
+        f = MediaFile(file_path)
+        return f.mb_trackid, f.mb_albumid
+    except (UnreadableFileError, OSError):
+        return None, None
+
+
 def write_mbid_to_file(file_path: str, mbid: str):
     try:
         f = MediaFile(file_path)
@@ -64,6 +64,15 @@ def _disable_mb_rate_limit():
     musicbrainz_client.reset_for_tests()
 
 
+@pytest.fixture(autouse=True)
+def _reset_tag_service_caches():
+    """Fingerprints and MB releases are memoized; keep tests independent."""
+    from src import tag_service
+    tag_service.reset_for_tests()
+    yield
+    tag_service.reset_for_tests()
+
+
 @pytest.fixture
 def db():
     """Returns an in-memory database manager."""
@@ -8,7 +8,9 @@ from src.album_completer import (
     _build_album_queue_plan,
     _build_missing_album_details,
     _execute_album_discovery_plan,
+    _prefetch_album_tracklists,
     _select_release,
+    cached_album_tracklist,
     fetch_album_tracklist,
     get_missing_tracks_for_album,
     queue_missing_tracks_for_album,
@@ -99,6 +101,22 @@ def test_fetch_album_tracklist_api_error():
         assert fetch_album_tracklist("bad_mbid") == {}
 
 
+def test_malformed_tracklist_entries_are_skipped_not_fatal():
+    with patch("src.musicbrainz_client.musicbrainzngs") as mock_mb:
+        mock_mb.get_release_by_id.return_value = {
+            "release": {
+                "medium-list": [
+                    {"position": "x", "track-list": [
+                        {"number": "1", "recording": {"title": "One"}},
+                        {"number": "A2", "recording": {"title": "Vinyl"}},
+                        {"number": "3"},
+                    ]},
+                ]
+            }
+        }
+        assert fetch_album_tracklist("mbid") == {(1, 1): "One"}
+
+
 def test_discovery_plan_is_pure_until_executed():
     db = MagicMock()
     plan = _build_album_discovery_plan(
@@ -174,6 +192,25 @@ def test_get_missing_album_complete(db):
     assert result["missing_count"] == 0
 
 
+def test_album_recorded_complete_skips_musicbrainz(db):
+    for i in (1, 2):
+        _add_track(db, mbid=f"t{i}", title=f"Track {i}", track_number=i,
+                   release_mbid="r1", local_path=f"/music/track{i}.flac")
+    db.update_album_metadata("r1", "Album", 2)
+
+    with patch("src.album_completer.fetch_album_tracklist") as mock_fetch:
+        result = queue_missing_tracks_for_album(db, "r1")
+
+    mock_fetch.assert_not_called()
+    assert result["queued"] == 0
+    assert result["skipped_existing"] == 0
+
+    db.update_album_metadata("r1", "Album", 3)
+    with patch("src.album_completer.fetch_album_tracklist") as mock_fetch:
+        mock_fetch.return_value = {(1, i): f"Track {i}" for i in (1, 2, 3)}
+        assert get_missing_tracks_for_album(db, "r1")["missing_count"] == 1
+
+
 def test_missing_details_plan_is_sorted_and_side_effect_free():
     official = {(1, 3): "Three", (1, 1): "One", (1, 2): "Two"}
     local = {(1, 1)}
@@ -295,6 +332,43 @@ def test_queue_skips_already_queued(db):
     assert result["skipped_existing"] == 1  # Track 7 already queued
 
 
+def test_queue_scans_existing_queue_once_and_dedups_within_album(db):
+    for i in range(1, 7):
+        _add_track(db, mbid=f"t{i}", title=f"Track {i}", track_number=i,
+                   release_mbid="r1", local_path=f"/music/track{i}.flac")
+    tracklist = {(1, i): f"Track {i}" for i in range(1, 7)}
+    tracklist.update({(1, 7): "Intro", (2, 1): "intro"})
+
+    with patch("src.album_completer.fetch_album_tracklist", return_value=tracklist), \
+         patch.object(db, "is_download_queued") as per_query_check, \
+         patch.object(
+             db, "get_queued_query_keys", wraps=db.get_queued_query_keys
+         ) as queue_scan:
+        result = queue_missing_tracks_for_album(db, "r1")
+
+    per_query_check.assert_not_called()
+    queue_scan.assert_called_once_with()
+    assert result["queued"] == 1
+    assert result["skipped_existing"] == 1
+
+
+def test_queue_individual_tracks_in_one_batch(db):
+    for i in range(1, 8):
+        _add_track(db, mbid=f"t{i}", title=f"Track {i}", track_number=i,
+                   release_mbid="r1", local_path=f"/music/track{i}.flac")
+    tracklist = {(1, i): f"Track {i}" for i in range(1, 11)}
+
+    with patch("src.album_completer.fetch_album_tracklist", return_value=tracklist), \
+         patch.object(db, "queue_downloads", wraps=db.queue_downloads) as batch:
+        result = queue_missing_tracks_for_album(db, "r1")
+
+    batch.assert_called_once()
+    assert [item.search_query for item in batch.call_args.args[0]] == [
+        "Artist - Track 8", "Artist - Track 9", "Artist - Track 10",
+    ]
+    assert result["queued"] == 3
+
+
 # ---------------------------------------------------------------------------
 # discover_album_for_track
 # ---------------------------------------------------------------------------
@@ -398,6 +472,39 @@ def test_discover_album_success(db):
         assert result == "rel_1"
 
 
+def test_discovered_release_seeds_the_tracklist_cache(db):
+    with patch("src.musicbrainz_client.musicbrainzngs") as mock_mb:
+        mock_mb.get_recording_by_id.return_value = {
+            "recording": {
+                "release-list": [
+                    {"id": "rel_1", "title": "My Album", "status": "Official"}
+                ]
+            }
+        }
+        mock_mb.get_release_by_id.return_value = {
+            "release": {
+                "medium-list": [{
+                    "position": "1",
+                    "track-count": "2",
+                    "track-list": [
+                        {"number": "1", "recording": {"title": "One"}},
+                        {"number": "2", "recording": {"title": "Two"}},
+                    ],
+                }]
+            }
+        }
+
+        assert discover_album_for_track(db, "rec_1", "My Album") == "rel_1"
+        assert cached_album_tracklist(db, "rel_1") == {
+            (1, 1): "One",
+            (1, 2): "Two",
+        }
+
+    mock_mb.get_release_by_id.assert_called_once_with(
+        "rel_1", includes=["media", "recordings"]
+    )
+
+
 def test_discover_album_no_releases(db):
     with patch("src.musicbrainz_client.musicbrainzngs") as mock_mb:
         mock_mb.get_recording_by_id.return_value = {
@@ -469,6 +576,116 @@ def test_complete_albums_discovers_and_queues(db):
     assert summary["tracks_queued"] >= 1
 
 
+def test_prefetch_album_tracklists_yields_in_order_off_the_caller_thread():
+    import threading
+
+    fetch_threads = []
+
+    def fake_fetch(release_mbid):
+        fetch_threads.append(threading.current_thread())
+        return {(1, 1): release_mbid}
+
+    db = MagicMock()
+    db.get_cached_tracklists.return_value = {}
+    with patch("src.album_completer.fetch_album_tracklist", side_effect=fake_fetch):
+        tracklists = list(_prefetch_album_tracklists(db, ["r1", "r2", "r3"]))
+
+    assert tracklists == [{(1, 1): "r1"}, {(1, 1): "r2"}, {(1, 1): "r3"}]
+    assert threading.current_thread() not in fetch_threads
+
+
+def test_prefetch_album_tracklists_stays_a_bounded_distance_ahead(monkeypatch):
+    monkeypatch.setattr("src.album_completer.TRACKLIST_LOOKAHEAD", 2)
+    db = MagicMock()
+    db.get_cached_tracklists.return_value = {"r2": '[[1, 1, "cached"]]'}
+    fetched = []
+
+    def fake_fetch(release_mbid):
+        fetched.append(release_mbid)
+        return {(1, 1): release_mbid}
+
+    with patch("src.album_completer.fetch_album_tracklist", side_effect=fake_fetch):
+        tracklists = _prefetch_album_tracklists(db, ["r1", "r2", "r3", "r4", "r1"])
+        assert next(tracklists) == {(1, 1): "r1"}
+        tracklists.close()
+
+    # r3 may or may not start before close() cancels it; r4 never does.
+    assert fetched in (["r1"], ["r1", "r3"])
+
+    with patch("src.album_completer.fetch_album_tracklist", side_effect=fake_fetch):
+        assert list(
+            _prefetch_album_tracklists(db, ["r1", "r2", "r3", "r4", "r1"])
+        ) == [
+            {(1, 1): "r1"},
+            {(1, 1): "cached"},
+            {(1, 1): "r3"},
+            {(1, 1): "r4"},
+            {(1, 1): "r1"},
+        ]
+
+
+def test_tracklists_are_served_from_cache_until_refreshed(db):
+    _add_track(db, mbid="t1", track_number=1)
+    tracklist = {(1, 1): "T1", (2, 1): "T2"}
+
+    with patch(
+        "src.album_completer.fetch_album_tracklist", return_value=tracklist
+    ) as mock_fetch:
+        assert cached_album_tracklist(db, "r1") == tracklist
+        assert list(_prefetch_album_tracklists(db, ["r1"])) == [tracklist]
+        assert get_missing_tracks_for_album(db, "r1")["missing_count"] == 1
+        assert mock_fetch.call_count == 1
+
+        list(_prefetch_album_tracklists(db, ["r1"], refresh=True))
+        assert mock_fetch.call_count == 2
+
+        result = get_missing_tracks_for_album(db, "r1", refresh=True)
+        assert result["missing_count"] == 1
+        assert mock_fetch.call_count == 3
+
+
+def test_refresh_bypasses_the_recorded_complete_shortcut(db):
+    _add_track(db, mbid="t1", track_number=1, release_mbid="r1",
+               local_path="/music/track1.flac")
+    db.update_album_metadata("r1", "Album", 1)
+
+    with patch(
+        "src.album_completer.fetch_album_tracklist",
+        return_value={(1, 1): "Song", (1, 2): "Bonus"},
+    ) as mock_fetch:
+        assert get_missing_tracks_for_album(db, "r1")["missing_count"] == 0
+        mock_fetch.assert_not_called()
+
+        result = get_missing_tracks_for_album(db, "r1", refresh=True)
+
+    mock_fetch.assert_called_once_with("r1")
+    assert result["missing_count"] == 1
+
+
+def test_failed_tracklist_fetches_are_not_cached(db):
+    with patch(
+        "src.album_completer.fetch_album_tracklist", return_value={}
+    ) as mock_fetch:
+        cached_album_tracklist(db, "r1")
+        cached_album_tracklist(db, "r1")
+
+    assert mock_fetch.call_count == 2
+
+
+def test_get_missing_uses_prefetched_tracklist(db):
+    _add_track(db, mbid="t1", track_number=1)
+
+    with patch("src.album_completer.fetch_album_tracklist") as mock_fetch:
+        result = get_missing_tracks_for_album(
+            db, "r1", official_tracks={(1, 1): "T1", (1, 2): "T2"}
+        )
+        failed = get_missing_tracks_for_album(db, "r1", official_tracks={})
+
+    mock_fetch.assert_not_called()
+    assert result["missing_count"] == 1
+    assert "error" in failed
+
+
 # ---------------------------------------------------------------------------
 # audit_library
 # ---------------------------------------------------------------------------
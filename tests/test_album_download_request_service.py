@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import requests
 from mutagen.flac import FLAC
@@ -724,6 +724,42 @@ def test_exact_inventory_verifies_flac_tags_paths_and_repeated_recordings(tmp_pa
     assert outside_library.exact is False
 
 
+def test_inventory_reads_each_safe_flac_once_and_skips_unsafe_paths(tmp_path):
+    from src.services import album_download_request_service as service
+
+    root = tmp_path / "library"
+    root.mkdir()
+    first = root / "one.flac"
+    second = root / "two.flac"
+    outside = tmp_path / "outside.flac"
+    for path, mbid in ((first, MANIFEST[0]), (second, MANIFEST[1])):
+        _write_tagged_flac(path, mbid)
+    _write_tagged_flac(outside, MANIFEST[1])
+    db = MagicMock()
+    db.get_local_release_recordings.return_value = [
+        {"mbid": MANIFEST[0], "local_path": str(first)},
+        {"mbid": MANIFEST[1], "local_path": str(second)},
+        {"mbid": MANIFEST[1], "local_path": str(outside)},
+    ]
+
+    with patch.object(
+        service,
+        "read_flac_release_track_identity",
+        wraps=service.read_flac_release_track_identity,
+    ) as read_identity:
+        inventory = inspect_release_inventory(
+            db,
+            CANONICAL_ID,
+            (MANIFEST[0], MANIFEST[1]),
+            str(root),
+        )
+
+    assert inventory.completed_tracks == 2
+    assert sorted(call.args[0] for call in read_identity.call_args_list) == [
+        str(first), str(second),
+    ]
+
+
 def test_status_fails_closed_for_failed_or_disappeared_active_queue_row():
     base = {
         "id": 8,
@@ -41,7 +41,7 @@ def test_album_completion_runs_three_fresh_contexts_and_phase_events():
     def progress(event):
         events.append(("progress", event))
 
-    def complete(db, progress_callback=None):
+    def complete(db, progress_callback=None, refresh_tracklists=False):
         events.append(("complete", db, progress_callback))
         return {"tracks_queued": 2, "errors": 0, "details": []}
 
@@ -104,7 +104,7 @@ def test_album_completion_skips_download_and_rescan_unless_both_conditions_hold(
         run_downloads=run_downloads,
         progress_callback=progress,
         database_factory=database_factory(events),
-        complete_albums=lambda db, progress_callback=None: {
+        complete_albums=lambda db, progress_callback=None, refresh_tracklists=False: {
             "tracks_queued": tracks_queued
         },
         run_downloader=download,
@@ -137,7 +137,7 @@ def test_album_completion_propagates_download_error_without_rescan():
             config_values={},
             run_downloads=True,
             database_factory=database_factory(events),
-            complete_albums=lambda db, progress_callback=None: {
+            complete_albums=lambda db, progress_callback=None, refresh_tracklists=False: {
                 "tracks_queued": 1
             },
             run_downloader=download,
@@ -165,7 +165,7 @@ def test_album_completion_propagates_structured_download_task_message():
         config_values={},
         run_downloads=True,
         database_factory=database_factory(events),
-        complete_albums=lambda db, progress_callback=None: {
+        complete_albums=lambda db, progress_callback=None, refresh_tracklists=False: {
             "tracks_queued": 2
         },
         run_downloader=lambda db, config, progress_callback=None: summary,
@@ -190,7 +190,7 @@ def test_album_completion_keeps_successful_download_message_scoped_to_outer_task
         config_values={},
         run_downloads=True,
         database_factory=database_factory(events),
-        complete_albums=lambda db, progress_callback=None: {
+        complete_albums=lambda db, progress_callback=None, refresh_tracklists=False: {
             "tracks_queued": 1
         },
         run_downloader=lambda db, config, progress_callback=None: (
@@ -209,7 +209,7 @@ def test_album_completion_keeps_none_returning_downloader_compatible():
         config_values={},
         run_downloads=True,
         database_factory=database_factory(events),
-        complete_albums=lambda db, progress_callback=None: {
+        complete_albums=lambda db, progress_callback=None, refresh_tracklists=False: {
             "tracks_queued": 1
         },
         run_downloader=lambda db, config, progress_callback=None: None,
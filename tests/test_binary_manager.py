@@ -61,4 +61,39 @@ def test_install_from_local_file_not_found():
 
         # Test with non-existent zip file
         with pytest.raises(FileNotFoundError):
-            install_from_local(releases_dir, bin_dir)
\ No newline at end of file
+            install_from_local(releases_dir, bin_dir)
+
+def test_detect_platform_mapping_is_computed_once_per_host():
+    from src import binary_manager
+
+    binary_manager._release_platform.cache_clear()
+    with patch('platform.system', return_value='Linux'), \
+         patch('platform.machine', return_value='aarch64'):
+        assert detect_platform() == ('linux', 'arm')
+        assert detect_platform() == ('linux', 'arm')
+
+    assert binary_manager._release_platform.cache_info().misses == 1
+
+
+def test_install_from_local_streams_only_the_binary(tmp_path):
+    import stat
+    import zipfile
+
+    releases_dir = tmp_path / "releases"
+    bin_dir = tmp_path / "bin"
+    releases_dir.mkdir()
+    bin_dir.mkdir()
+    (bin_dir / "slsk-batchdl").write_bytes(b"old")
+    with zipfile.ZipFile(releases_dir / "sldl_linux-x64.zip", "w") as archive:
+        archive.writestr("README.md", "docs")
+        archive.writestr("nested/tools/sldl", b"deeper copy")
+        archive.writestr("sldl_linux-x64/sldl", b"\x7fELF binary")
+
+    with patch('platform.system', return_value='Linux'), \
+         patch('platform.machine', return_value='x86_64'):
+        final_path = install_from_local(str(releases_dir), str(bin_dir))
+
+    assert final_path == str(bin_dir / "slsk-batchdl")
+    assert (bin_dir / "slsk-batchdl").read_bytes() == b"\x7fELF binary"
+    assert os.stat(final_path).st_mode & stat.S_IEXEC
+    assert sorted(os.listdir(bin_dir)) == ["slsk-batchdl"]
@@ -55,6 +55,14 @@ def test_get_file_score_track_number():
     assert score == 100  # Base 100 - 10 for track number pattern + 10 for .flac
 
 
+def test_get_file_score_applies_only_the_highest_priority_penalty():
+    """Only the first matching filename penalty counts, in copy/track/feat order."""
+    assert get_file_score("/test/Song (feat. Guest).m4a") == 100
+    assert get_file_score("/test/01 - Song (1).flac") == 90
+    assert get_file_score("C:\\Music\\01 - Song (feat. Guest).MP3") == 91
+    assert get_file_score("/test/Song.ogg") == 100
+
+
 def test_get_duplicates_for_ui_empty(db):
     """Test getting duplicates UI data when no duplicates exist."""
     duplicates = get_duplicates_for_ui(db)
@@ -85,6 +93,35 @@ def test_get_duplicates_for_ui_with_data(db):
         assert len(duplicates[0]["candidates"]) == 2
 
 
+def test_duplicates_for_ui_batches_track_lookup_and_reads_tags_once(db, temp_dir):
+    paths = []
+    for name in ("a.flac", "b.flac", "c.flac"):
+        path = os.path.join(temp_dir, name)
+        with open(path, "w") as f:
+            f.write(name)
+        paths.append(path)
+    db.add_or_update_track(Track(mbid="m1", title="One", artist="Artist"))
+    groups = {"m1": paths[:2], "m2": paths[1:]}
+
+    with patch.object(db, "get_all_duplicates", return_value=groups), \
+         patch.object(db, "get_track_by_mbid") as single_lookup, \
+         patch(
+             "src.clear_dupes.get_mbids_from_tags",
+             side_effect=lambda path: ("m1", "r1"),
+         ) as read_tags:
+        duplicates = get_duplicates_for_ui(db)
+
+    single_lookup.assert_not_called()
+    assert read_tags.call_count == 3
+    assert [group["title"] for group in duplicates] == ["One", "Unknown Title"]
+    assert [c["identity_status"] for c in duplicates[0]["candidates"]] == [
+        "match", "match",
+    ]
+    assert [c["identity_status"] for c in duplicates[1]["candidates"]] == [
+        "mismatch", "mismatch",
+    ]
+
+
 def test_resolve_duplicates_success(db, temp_dir):
     """Test resolving duplicates successfully."""
     # Create test files
@@ -146,7 +183,7 @@ def test_resolve_duplicates_file_not_found(db, temp_dir):
     assert db.get_all_duplicates() == {}
 
 
-def _duplicate_group(db, keep_path, delete_path):
+def _duplicate_group(db, keep_path, *delete_paths):
     db.add_or_update_track(Track(
         mbid="test_mbid",
         title="Track",
@@ -154,7 +191,8 @@ def _duplicate_group(db, keep_path, delete_path):
         local_path=keep_path,
     ))
     db.log_duplicate("test_mbid", keep_path)
-    db.log_duplicate("test_mbid", delete_path)
+    for delete_path in delete_paths:
+        db.log_duplicate("test_mbid", delete_path)
 
 
 def test_resolve_rejects_delete_path_outside_group_before_mutation(db, temp_dir):
@@ -288,6 +326,33 @@ def test_partial_delete_failure_keeps_group_for_retry(db, temp_dir):
     assert set(db.get_all_duplicates()["test_mbid"]) == {keep, duplicate}
 
 
+def test_concurrent_deletes_report_each_outcome_in_request_order(db, temp_dir):
+    keep = os.path.join(temp_dir, "keep.flac")
+    copies = [os.path.join(temp_dir, f"copy{i}.flac") for i in range(3)]
+    for path in (keep, *copies):
+        with open(path, "w") as handle:
+            handle.write("audio")
+    _duplicate_group(db, keep, *copies)
+    real_remove = os.remove
+
+    def remove(path):
+        if path == copies[1]:
+            raise PermissionError("denied")
+        if path == copies[2]:
+            real_remove(path)
+            raise FileNotFoundError(path)
+        real_remove(path)
+
+    with patch("src.clear_dupes.get_mbid_from_tags", return_value="test_mbid"), \
+         patch("src.clear_dupes.os.remove", side_effect=remove):
+        result = resolve_duplicates(db, "test_mbid", keep, copies)
+
+    assert result["deleted"] == [copies[0]]
+    assert result["missing"] == [copies[2]]
+    assert result["remaining"] == [keep, copies[1]]
+    assert len(result["errors"]) == 1
+
+
 def test_unselected_duplicate_path_remains_visible(db, temp_dir):
     keep = os.path.join(temp_dir, "keep.flac")
     delete = os.path.join(temp_dir, "delete.flac")
@@ -612,3 +612,83 @@ def test_device_identity_preserved_between_loads():
         finally:
             ConfigManager.CONFIG_FILE = original_file
             ConfigManager._instance = None
+
+
+def test_load_values_adopts_written_config_without_rereading(tmp_path):
+    ConfigManager._instance = None
+    config_file = tmp_path / "config.json"
+    base = {
+        "database_file": "test.db",
+        "music_library_path": str(tmp_path / "music"),
+        "downloads_path": str(tmp_path / "downloads"),
+        "ffmpeg_path": "ffmpeg",
+        "dap_mount_point": str(tmp_path / "dap"),
+        "dap_music_dir_name": "Music",
+        "dap_playlist_dir_name": "Playlists",
+        "device_id": "dev-1",
+        "device_role": "master",
+        "is_master": True,
+    }
+    config_file.write_text(json.dumps(base))
+    original_file = ConfigManager.CONFIG_FILE
+    ConfigManager.CONFIG_FILE = str(config_file)
+    try:
+        config = get_config()
+        updated = {**base, "contact_email": "me@example.com"}
+        with patch("builtins.open", side_effect=AssertionError("re-read")):
+            config.load_values(updated)
+        updated["contact_email"] = "mutated@example.com"
+
+        assert config.contact_email == "me@example.com"
+    finally:
+        ConfigManager.CONFIG_FILE = original_file
+        ConfigManager._instance = None
+
+
+def test_reload_skips_only_the_path_walk_for_a_found_ffmpeg(tmp_path, caplog):
+    ConfigManager._instance = None
+    config_file = tmp_path / "config.json"
+    base = {
+        "database_file": "test.db",
+        "music_library_path": str(tmp_path / "music"),
+        "downloads_path": str(tmp_path / "downloads"),
+        "ffmpeg_path": "ffmpeg",
+        "dap_mount_point": str(tmp_path / "dap"),
+        "dap_music_dir_name": "Music",
+        "dap_playlist_dir_name": "Playlists",
+        "device_id": "dev-1",
+        "device_role": "master",
+        "is_master": True,
+    }
+    config_file.write_text(json.dumps(base))
+    original_file = ConfigManager.CONFIG_FILE
+    ConfigManager.CONFIG_FILE = str(config_file)
+    try:
+        with patch("src.config_manager.which", return_value="/usr/bin/ffmpeg"):
+            config = get_config()
+        assert (tmp_path / "music").is_dir()
+
+        with patch("src.config_manager.which") as which:
+            config.load_values({**base, "contact_email": "me@example.com"})
+            which.assert_not_called()
+
+            # The library check still runs when the paths are unchanged.
+            (tmp_path / "music").rmdir()
+            config.load_values(base)
+            assert (tmp_path / "music").is_dir()
+
+            moved = str(tmp_path / "library")
+            config.load_values({**base, "music_library_path": moved})
+        assert os.path.isdir(moved)
+
+        missing = {**base, "ffmpeg_path": "no-such-ffmpeg"}
+        with patch("src.config_manager.which", return_value=None):
+            with caplog.at_level("WARNING", logger="src.config_manager"):
+                config.load_values(missing)
+                config.load_values(missing)
+        assert [
+            r.getMessage() for r in caplog.records if "ffmpeg" in r.getMessage()
+        ] == ["ffmpeg not found at: no-such-ffmpeg"] * 2
+    finally:
+        ConfigManager.CONFIG_FILE = original_file
+        ConfigManager._instance = None
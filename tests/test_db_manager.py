@@ -1,5 +1,7 @@
 import os
 import sqlite3
+import subprocess
+import sys
 import tempfile
 
 import pytest
@@ -34,6 +36,7 @@ EXPECTED_SCHEMA_COLUMNS = {
     ),
     "duplicates": ("id", "mbid", "file_path"),
     "lyrics": ("track_mbid", "lrc", "synced", "source", "fetched_at"),
+    "mb_tracklist_cache": ("release_mbid", "payload", "fetched_at"),
     "play_events": ("id", "track_mbid", "played_at", "source", "listened_ms"),
     "playlist_tracks": ("playlist_id", "track_mbid", "track_order"),
     "playlists": (
@@ -103,11 +106,78 @@ def test_database_schema_table_column_and_index_contract(db):
             ),
             False,
         ),
+        "idx_download_queue_mbid_guess": (
+            "download_queue", ("mbid_guess",), False,
+        ),
         "idx_play_events_played_at": ("play_events", ("played_at",), False),
         "idx_play_events_track_mbid": ("play_events", ("track_mbid",), False),
+        "idx_playlist_tracks_order": (
+            "playlist_tracks", ("playlist_id", "track_order"), False,
+        ),
+        "idx_tracks_artist_title": ("tracks", ("artist", "title"), False),
         "idx_tracks_is_liked": ("tracks", ("is_liked",), True),
+        "idx_tracks_local_release": (
+            "tracks",
+            (
+                "release_mbid", "disc_number", "track_number", "artist",
+                "album", "local_path",
+            ),
+            True,
+        ),
+        "idx_tracks_sync_state": ("tracks", ("synced_to_dap",), True),
     }
 
+
+def test_connection_tunes_memory_but_keeps_default_journal(db):
+    assert db.conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+    assert db.conn.execute("PRAGMA cache_size").fetchone()[0] == -32000
+    assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] != "wal"
+
+
+def test_identity_and_playlist_lookups_use_indexes(db):
+    def plan(sql, params):
+        return " ".join(
+            row["detail"]
+            for row in db.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        )
+
+    assert "idx_tracks_artist_title" in plan(
+        "SELECT mbid, local_path FROM tracks WHERE artist = ? COLLATE NOCASE "
+        "AND title = ? COLLATE NOCASE AND local_path IS NOT NULL",
+        ("Artist", "Title"),
+    )
+    ordered = plan(
+        "SELECT track_mbid FROM playlist_tracks "
+        "WHERE playlist_id = ? ORDER BY track_order",
+        ("playlist",),
+    )
+    assert "idx_playlist_tracks_order" in ordered
+    assert "TEMP B-TREE" not in ordered
+    assert "idx_download_queue_mbid_guess" in plan(
+        "SELECT 1 FROM download_queue "
+        "WHERE mbid_guess = ? COLLATE NOCASE LIMIT 1",
+        ("mbid",),
+    )
+
+
+def test_active_download_count_is_an_index_only_scan(db):
+    detail = " ".join(
+        row["detail"]
+        for row in db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM download_queue "
+            "WHERE status IN ('pending', 'failed')"
+        )
+    )
+    assert "COVERING INDEX idx_download_queue_claimable" in detail
+
+
+def test_track_safe_names_replace_filesystem_unsafe_characters():
+    track = Track(mbid="m", title='What? "Live"', artist="AC/DC")
+    assert track.safe_artist == "AC_DC"
+    assert track.safe_title == "What_ _Live_"
+    assert Track(mbid="m", title="", artist="").safe_artist == "Unknown Artist"
+
+
 def test_add_and_get_track(db):
     t = Track(
         mbid="12345",
@@ -156,6 +226,91 @@ def test_library_stats(db):
     assert stats['artists'] == 1
     assert stats['albums'] == 1
     assert stats['incomplete_albums'] == 1 # We have 2 tracks, but total is 10
+    assert stats['playlists'] == 0
+
+
+def test_library_stats_runs_one_statement(db):
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    db.get_library_stats()
+    db.conn.set_trace_callback(None)
+    assert len(statements) == 1
+
+def test_sync_stats_counts_live_local_tracks_and_playlists(db):
+    db.add_or_update_track(Track(mbid="1", title="A", artist="X", local_path="/a", synced_to_dap=True))
+    db.add_or_update_track(Track(mbid="2", title="B", artist="X", local_path="/b"))
+    db.add_or_update_track(Track(mbid="3", title="C", artist="X", local_path="/c"))
+    db.add_or_update_track(Track(mbid="4", title="D", artist="X"))
+    db.soft_delete_track("3")
+    db.create_playlist("Kept")
+    db.soft_delete_playlist(db.create_playlist("Gone"))
+
+    stats = db.get_sync_stats()
+
+    assert stats == {
+        "total_tracks": 2,
+        "synced_tracks": 1,
+        "pending_tracks": 1,
+        "total_playlists": 1,
+        "sync_percentage": 50.0,
+    }
+
+def test_save_playlist_tracks_upserts_and_links_in_one_batch(db):
+    db.add_or_update_playlist(Playlist(playlist_id="p1", name="Mix", spotify_url=""))
+    db.add_or_update_track(Track(mbid="a", title="Old", artist="X", local_path="/keep.flac"))
+    entries = [
+        (Track(mbid="a", title="New", artist="X", local_path="/keep.flac"), 0),
+        (Track(mbid="b", title="B", artist="Y", local_path="C:\\music\\b.flac"), 1),
+    ]
+
+    assert db.save_playlist_tracks("p1", entries) == 2
+    assert db.save_playlist_tracks("p1", entries) == 0
+
+    assert db.get_track_by_mbid("a").title == "New"
+    assert db.get_track_by_mbid("b").local_path == "C:/music/b.flac"
+    assert [t.mbid for t in db.get_playlist_tracks("p1")] == ["a", "b"]
+
+
+def test_iter_playlist_tracks_streams_in_playlist_order(db):
+    db.add_or_update_playlist(Playlist(playlist_id="p1", name="Mix", spotify_url=""))
+    db.save_playlist_tracks("p1", [
+        (Track(mbid="b", title="B", artist="X"), 1),
+        (Track(mbid="a", title="A", artist="X"), 0),
+    ])
+
+    tracks = db.iter_playlist_tracks("p1")
+
+    assert not isinstance(tracks, list)
+    assert [t.mbid for t in tracks] == ["a", "b"]
+    assert list(db.iter_playlist_tracks("missing")) == []
+
+
+def test_queue_downloads_inserts_batch(db):
+    items = [
+        DownloadItem(search_query="X - A", playlist_id="p1", mbid_guess="a"),
+        DownloadItem(search_query="Y - B", playlist_id="p1", mbid_guess="b"),
+    ]
+
+    assert db.queue_downloads(items) == 2
+    assert db.queue_downloads([]) == 0
+    assert {d.search_query for d in db.get_downloads("pending")} == {"X - A", "Y - B"}
+
+
+def test_download_ids_cover_several_statuses_in_one_query(db):
+    for query in ("a - x", "a - y", "a - z"):
+        db.queue_download(DownloadItem(query, "", "", status="pending"))
+    by_query = {d.search_query: d.id for d in db.get_all_downloads()}
+    db.update_download_status(by_query["a - y"], "failed")
+    db.update_download_status(by_query["a - z"], "success")
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+
+    ids = db.get_download_ids(("pending", "failed"))
+
+    db.conn.set_trace_callback(None)
+    assert sorted(ids) == sorted([by_query["a - x"], by_query["a - y"]])
+    assert len(statements) == 1
+
 
 def test_download_queue(db):
     item = DownloadItem(
@@ -179,6 +334,42 @@ def test_download_queue(db):
     assert queue[0].status == "success"
 
 
+def test_download_rows_parse_timestamps_and_tolerate_bad_values(db):
+    db.queue_download(DownloadItem("a - x", "", "m1", status="pending"))
+    item_id = db.get_all_downloads()[0].id
+    db.conn.execute(
+        "UPDATE download_queue SET last_attempt = ?, next_attempt_at = ? "
+        "WHERE id = ?",
+        ("2026-01-02T03:04:05", "not a timestamp", item_id),
+    )
+
+    item = db.get_download(item_id)
+    assert item.last_attempt.isoformat() == "2026-01-02T03:04:05"
+    assert item.next_attempt_at is None
+    assert item.claim_expires_at is None
+
+
+def test_download_listing_reads_the_column_set_once_per_query(db, monkeypatch):
+    for i in range(3):
+        db.queue_download(DownloadItem(f"a - {i}", "", f"m{i}", status="pending"))
+    rows = db._download_repository.fetch_all()
+    key_reads = []
+
+    class CountingRow(dict):
+        def keys(self):
+            key_reads.append(1)
+            return super().keys()
+
+    monkeypatch.setattr(
+        db._download_repository,
+        "fetch_all",
+        lambda: [CountingRow(zip(row.keys(), tuple(row))) for row in rows],
+    )
+
+    assert [item.mbid_guess for item in db.get_all_downloads()] == ["m2", "m1", "m0"]
+    assert len(key_reads) == 1
+
+
 def test_retry_download_only_flips_failed_rows(db):
     db.queue_download(DownloadItem("a - x", "", "m1", status="pending"))
     db.queue_download(DownloadItem("a - y", "", "m2", status="pending"))
@@ -1133,6 +1324,18 @@ def test_restore_track_clears_deleted_at(db):
     assert db.restore_track("t1") is False
 
 
+def test_iter_all_tracks_streams_the_same_filtered_tracks(db):
+    db.add_or_update_track(Track(mbid="local", title="T", artist="A",
+                                 local_path="/music/a.flac"))
+    db.add_or_update_track(Track(mbid="remote", title="T", artist="A"))
+
+    tracks = db.iter_all_tracks(local_only=True)
+
+    assert not isinstance(tracks, list)
+    assert [t.mbid for t in tracks] == ["local"]
+    assert sorted(t.mbid for t in db.iter_all_tracks()) == ["local", "remote"]
+
+
 def test_catalog_delta_carries_deletion(db):
     db.add_or_update_track(Track(mbid="t1", title="T", artist="A"))
     first_cursor = db.get_catalog_since()[-1]["updated_at"]
@@ -2575,3 +2778,61 @@ def test_album_identity_replacement_is_transactionally_blocked_while_active(db):
     assert db.get_album_download_request_recording_mbids(request_id) == [
         second_recording
     ]
+
+
+def test_is_download_queued_matches_normalized_open_items_only(db):
+    db.queue_download(DownloadItem(
+        search_query="Artist  -  Song", playlist_id="p1", mbid_guess="",
+    ))
+    done = db.queue_download(DownloadItem(
+        search_query="Other - Done", playlist_id="p1", mbid_guess="",
+    ))
+    db.update_download_status(done, "success")
+
+    assert db.is_download_queued("artist - song")
+    assert not db.is_download_queued("Other - Done")
+    assert not db.is_download_queued("   ")
+
+
+def test_queue_dedup_function_is_registered_once_per_connection(db):
+    from unittest.mock import MagicMock
+
+    from src.db_repositories.downloads import DownloadRepository
+
+    db.queue_download(DownloadItem(
+        search_query="Artist - Song", playlist_id="p1", mbid_guess="",
+    ))
+    conn = MagicMock(wraps=db.conn)
+    repository = DownloadRepository(conn)
+
+    for _ in range(3):
+        assert repository.is_queued("artist - song", db.normalize_search_query)
+
+    conn.create_function.assert_called_once()
+
+
+def test_incomplete_album_audit_is_an_index_only_scan(db):
+    from src.db_repositories.library import INCOMPLETE_ALBUMS_SQL
+
+    plan = " | ".join(
+        row["detail"]
+        for row in db.conn.execute("EXPLAIN QUERY PLAN " + INCOMPLETE_ALBUMS_SQL)
+    )
+
+    assert "COVERING INDEX idx_tracks_local_release" in plan
+
+
+def test_importing_db_manager_does_not_load_the_tagging_stack():
+    probe = (
+        "import sys, src.db_manager; "
+        "print(sorted(m for m in ('acoustid', 'mediafile', 'requests') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
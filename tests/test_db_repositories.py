@@ -9,7 +9,7 @@ from src.contribution_sync import (
     CONTRIBUTE_STATE_KEY,
     _stamp_cursor as stamp_contribution,
 )
-from src.db_manager import Track
+from src.db_manager import DownloadItem, Playlist, Track
 from src.db_repositories.downloads import DownloadRepository
 from src.db_repositories.library import LibraryRepository
 from src.inventory_sync import (
@@ -49,6 +49,23 @@ def test_download_repository_active_lookup_prefers_mbid_then_normalized_query(db
     ) == normalized_match
 
 
+def test_batch_writes_join_an_open_transaction(db):
+    db.add_or_update_playlist(Playlist(playlist_id="pl", name="Mix", spotify_url=""))
+    db.conn.execute("BEGIN IMMEDIATE")
+
+    assert db.queue_downloads(
+        [DownloadItem(search_query="A - B", playlist_id="pl", mbid_guess="m1")]
+    ) == 1
+    assert db.save_playlist_tracks(
+        "pl", [(Track(mbid="m1", title="B", artist="A"), 0)]
+    ) == 1
+    assert db.conn.in_transaction
+    db.conn.rollback()
+
+    assert db.get_downloads("pending") == []
+    assert db.get_playlist_tracks("pl") == []
+
+
 def test_playlist_membership_uses_facade_timestamp_hook(db, monkeypatch):
     playlist_id = db.create_playlist("Hooked playlist")
     db.conn.execute(
@@ -319,6 +336,46 @@ def test_duplicate_repository_round_trip_and_clear(db, tmp_path):
     assert db.get_all_duplicates() == {}
 
 
+def test_all_duplicates_keep_logging_order_and_commas(db):
+    db.log_duplicate("z-recording", "/music/Song, Live.flac")
+    db.log_duplicate("a-recording", "/music/b.flac")
+    db.log_duplicate("z-recording", "/music/Song.flac")
+    db.log_duplicate("a-recording", "/music/a.flac")
+
+    duplicates = db.get_all_duplicates()
+
+    assert list(duplicates) == ["z-recording", "a-recording"]
+    assert duplicates["z-recording"] == [
+        "/music/Song, Live.flac", "/music/Song.flac",
+    ]
+    assert duplicates["a-recording"] == ["/music/b.flac", "/music/a.flac"]
+
+
+def test_grouped_duplicate_paths_are_sorted_by_row_id_not_concat_order():
+    from src.db_repositories.album_maintenance import _paths_in_logging_order
+
+    grouped = "\x1f".join(["10\x1e/music/c.flac", "2\x1e/music/a.flac", "7\x1e/music/b.flac"])
+
+    assert _paths_in_logging_order(grouped) == [
+        "/music/a.flac", "/music/b.flac", "/music/c.flac",
+    ]
+
+
+def test_duplicate_group_is_logged_in_one_transaction(db, tmp_path):
+    first = str(tmp_path / "folder" / ".." / "first.flac")
+    second = str(tmp_path / "second.flac")
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+
+    db.log_duplicates("recording", [first, second, first])
+
+    db.conn.set_trace_callback(None)
+    assert statements.count("COMMIT") == 1
+    assert db.get_all_duplicates() == {
+        "recording": [str(tmp_path / "first.flac"), second]
+    }
+
+
 def test_missing_path_cleanup_preserves_dry_run_then_applies(db, tmp_path):
     existing = tmp_path / "existing.flac"
     existing.write_bytes(b"audio")
@@ -378,6 +435,11 @@ def test_update_local_path_releases_previous_owner_and_map_keeps_orphans(
     assert db.get_track_by_mbid("old-owner").local_path is None
     assert db.get_mbid_to_track_path_map() == {"new-owner": shared}
 
+    db.add_or_update_track(Track(
+        mbid="blank-path", title="Blank", artist="Artist", local_path="",
+    ))
+    assert db.get_mbid_to_track_path_map() == {"new-owner": shared}
+
 
 def test_album_merge_counts_and_split_dismissal_round_trip(db):
     db.update_album_metadata("source-release", "Source Album", 2)
@@ -400,7 +462,12 @@ def test_album_merge_counts_and_split_dismissal_round_trip(db):
         "total": 2,
         "missing": 1,
     }]
+    statements = []
+    db.conn.set_trace_callback(statements.append)
     assert db.merge_albums("source-release", "target-release") is True
+    db.conn.set_trace_callback(None)
+    assert statements[0] == "BEGIN IMMEDIATE"
+    assert statements.count("COMMIT") == 1
     merged = db.get_track_by_mbid("source-track")
     assert merged.release_mbid == "target-release"
     assert merged.album == "Target Album"
@@ -47,9 +47,14 @@ def test_schema_functions_are_idempotent_and_preserve_existing_rows():
         "idx_album_download_requests_stage_updated",
         "idx_artist_tags_tag",
         "idx_download_queue_claimable",
+        "idx_download_queue_mbid_guess",
         "idx_play_events_played_at",
         "idx_play_events_track_mbid",
+        "idx_playlist_tracks_order",
+        "idx_tracks_artist_title",
         "idx_tracks_is_liked",
+        "idx_tracks_local_release",
+        "idx_tracks_sync_state",
     }
     conn.close()
 
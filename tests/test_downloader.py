@@ -15,6 +15,7 @@ from src.downloader import (
     ProcessedQueueItem,
     build_download_command,
     cleanup_empty_download_directories,
+    _discover_staged_audio,
     discover_downloaded_audio,
     exact_manifest_tag_metadata,
     main_run_downloader,
@@ -119,6 +120,23 @@ def test_downloaded_metadata_accepts_composite_flac_track_number(tmp_path):
     assert metadata.disc_number == 2
 
 
+def test_downloaded_metadata_uses_tagger_values_without_reparsing():
+    tagged = {
+        "artist": "Artist",
+        "album": "Album",
+        "title": "Song",
+        "track_number": "3/10",
+        "disc_number": 1,
+    }
+
+    with patch("mutagen.File", side_effect=AssertionError("re-parsed")):
+        metadata = read_downloaded_metadata("/downloads/song.flac", tagged)
+
+    assert (metadata.artist, metadata.title, metadata.track_number) == (
+        "Artist", "Song", 3,
+    )
+
+
 def test_build_download_command_preserves_single_track_flags():
     command, album_mode = build_download_command(
         ["sldl"],
@@ -273,6 +291,12 @@ def test_download_file_discovery_and_empty_cleanup(tmp_path):
     assert discover_downloaded_audio(str(tmp_path)) == [
         str(nested / "song.FLAC")
     ]
+    (nested / "next.mp3.incomplete").write_bytes(b"partial")
+    assert _discover_staged_audio(str(tmp_path)) == (
+        [str(nested / "song.FLAC")],
+        [str(nested / "next.mp3.incomplete")],
+    )
+    (nested / "next.mp3.incomplete").unlink()
 
     (nested / "song.FLAC").unlink()
     (nested / "cover.jpg").unlink()
@@ -587,6 +611,26 @@ def test_sldl_command_uses_argv_and_redacts_password_from_logs(
     )
 
 
+@patch("subprocess.Popen")
+def test_sldl_progress_burst_forwards_first_and_latest_line(
+    mock_popen,
+    downloader,
+):
+    process = MagicMock(
+        stdout=[f"progress {percent}%\n" for percent in range(100)],
+        returncode=0,
+    )
+    mock_popen.return_value = process
+    callback = MagicMock()
+
+    downloader._run_sldl_command(["sldl"], callback)
+
+    forwarded = [call.args[0] for call in callback.call_args_list]
+    assert forwarded[0] == "progress 0%"
+    assert forwarded[-1] == "progress 99%"
+    assert len(forwarded) < 100
+
+
 @pytest.mark.skipif(os.name != "posix", reason="POSIX pseudo-terminal workaround")
 @patch("subprocess.Popen")
 def test_sldl_command_receives_private_tty_stdin(mock_popen, downloader):
@@ -1039,8 +1083,8 @@ def test_process_success_counts_only_completed_imports(db, mock_scanner, temp_di
     )
 
     with patch(
-        "src.downloader.discover_downloaded_audio",
-        return_value=["one.mp3", "two.mp3", "three.mp3"],
+        "src.downloader._discover_staged_audio",
+        return_value=(["one.mp3", "two.mp3", "three.mp3"], []),
     ), patch.object(
         dl,
         "_process_downloaded_file",
@@ -1066,8 +1110,8 @@ def test_rejected_album_audio_preserves_queue_identity_as_failed(
     item = db.get_downloads(status="pending")[0]
 
     with patch(
-        "src.downloader.discover_downloaded_audio",
-        return_value=["accepted.flac", "rejected.mp3"],
+        "src.downloader._discover_staged_audio",
+        return_value=(["accepted.flac", "rejected.mp3"], []),
     ), patch.object(
         downloader,
         "_process_downloaded_file",
@@ -1244,6 +1288,7 @@ def test_album_processing_passes_embedded_recording_mbid_not_release_mbid(
     assert events == ["scan", "recording"]
     read_mbid.assert_called_once_with(staged)
     assert ingest.call_args.kwargs["recording_mbid"] == "recording-mbid"
+    assert ingest.call_args.kwargs["source_scanned"] is True
     assert "release-mbid" not in repr(ingest.call_args.kwargs)
     assert result == ProcessedDownload(ingest_result.path, False)
 
@@ -1841,8 +1886,8 @@ def test_run_queue_mirrors_each_import_before_single_jellyfin_refresh(
     events = []
 
     with patch.object(dl, "_attempt_download", return_value=True), patch(
-        "src.downloader.discover_downloaded_audio",
-        return_value=[os.path.join(temp_dirs["downloads"], "song.flac")],
+        "src.downloader._discover_staged_audio",
+        return_value=([os.path.join(temp_dirs["downloads"], "song.flac")], []),
     ), patch.object(
         dl,
         "_process_downloaded_file",
@@ -1887,8 +1932,8 @@ def test_mirror_failure_does_not_undo_import_or_suppress_refresh(
         raise OSError("mirror unavailable")
 
     with patch.object(dl, "_attempt_download", return_value=True), patch(
-        "src.downloader.discover_downloaded_audio",
-        return_value=[os.path.join(temp_dirs["downloads"], "song.flac")],
+        "src.downloader._discover_staged_audio",
+        return_value=([os.path.join(temp_dirs["downloads"], "song.flac")], []),
     ), patch.object(
         dl,
         "_process_downloaded_file",
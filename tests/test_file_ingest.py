@@ -1,3 +1,4 @@
+import errno
 import hashlib
 import os
 import shutil
@@ -341,8 +342,14 @@ def _encoded_flac_frame_digest(path: Path) -> str:
 
 
 def test_download_ingest_verifies_the_payload_copied_to_publication(
-    tmp_path,
+    tmp_path, monkeypatch
 ):
+    # Only a byte copy can diverge from the verified source; a hard link
+    # publishes the same inode.
+    def refuse_link(_source, _destination):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr("src.file_ingest.os.link", refuse_link)
     db = DatabaseManager(":memory:")
     source = tmp_path / "downloads" / "guarded.flac"
     source.parent.mkdir()
@@ -586,6 +593,32 @@ def test_better_primary_flac_with_canonical_tags_is_byte_exact_noop(tmp_path):
     db.close()
 
 
+def test_download_ingest_does_not_rescan_a_source_the_caller_scanned(tmp_path):
+    db = DatabaseManager(":memory:")
+    source = tmp_path / "raw.flac"
+    source.write_bytes(b"audio")
+    scanner = DuplicateSkippingScanner()
+
+    result = ingest_downloaded_audio_file_with_result(
+        db,
+        scanner,
+        str(tmp_path / "music"),
+        str(source),
+        artist="Artist",
+        album="Album",
+        title="Track",
+        track_number=1,
+        recording_mbid=RECORDING_MBID,
+        source_scanned=True,
+    )
+
+    assert scanner.processed == []
+    assert result.path.endswith("Artist/Album/01 Track.flac")
+    assert not source.exists()
+    assert db.get_track_local_path(RECORDING_MBID) == result.path
+    db.close()
+
+
 def test_better_primary_tag_sync_failure_preserves_staged_source(
     tmp_path,
     monkeypatch,
@@ -702,6 +735,139 @@ def test_download_ingest_atomically_upgrades_lower_quality_existing_file(
     db.close()
 
 
+def test_download_ingest_links_candidate_on_the_same_filesystem(
+    tmp_path, monkeypatch
+):
+    real_link = os.link
+    linked = []
+
+    def link_spy(source_path, temp_path):
+        linked.append(os.stat(source_path).st_ino)
+        real_link(source_path, temp_path)
+
+    monkeypatch.setattr("src.file_ingest.os.link", link_spy)
+    monkeypatch.setattr(
+        "src.file_ingest.shutil.copyfileobj",
+        lambda *_args: pytest.fail("same-filesystem ingest copied bytes"),
+    )
+    monkeypatch.setattr(
+        "src.file_ingest.shutil.copystat",
+        lambda *_args: pytest.fail("linked candidate re-stamped its source"),
+    )
+
+    db, source, destination, result = _collision_ingest(
+        tmp_path,
+        monkeypatch,
+        _quality(24, 96000, 3000000),
+        _quality(16, 44100, 800000),
+    )
+
+    assert result.changed is True
+    assert destination.read_bytes() == b"candidate-audio"
+    assert linked == [destination.stat().st_ino]
+    assert not source.exists()
+    assert not list(destination.parent.glob(".*.dapingest-*.tmp"))
+    db.close()
+
+
+def test_download_ingest_records_a_linked_publish_when_source_removal_fails(
+    tmp_path, monkeypatch, caplog
+):
+    real_remove = os.remove
+
+    def refuse_source_removal(path):
+        if os.path.basename(path) == "candidate.flac":
+            raise PermissionError(errno.EACCES, "Permission denied", path)
+        real_remove(path)
+
+    monkeypatch.setattr("src.file_ingest.os.remove", refuse_source_removal)
+
+    with caplog.at_level("ERROR", logger="src.file_ingest"):
+        db, source, destination, result = _collision_ingest(
+            tmp_path,
+            monkeypatch,
+            _quality(24, 96000, 3000000),
+            _quality(16, 44100, 800000),
+        )
+
+    assert result.changed is True
+    assert destination.read_bytes() == b"candidate-audio"
+    assert db.get_track_by_mbid("collision-mbid").local_path == str(destination)
+    assert source.exists()
+    assert any("hard-linked" in r.getMessage() for r in caplog.records)
+    db.close()
+
+
+def test_download_ingest_copies_when_the_source_cannot_be_unlinked(
+    tmp_path, monkeypatch
+):
+    real_access = os.access
+    staging = str(tmp_path / "downloads")
+
+    def read_only_staging(path, mode):
+        if path == staging and mode == os.W_OK:
+            return False
+        return real_access(path, mode)
+
+    monkeypatch.setattr("src.file_ingest.os.access", read_only_staging)
+    monkeypatch.setattr(
+        "src.file_ingest.os.link",
+        lambda *_args: pytest.fail("linked a source that cannot be removed"),
+    )
+
+    db, _source, destination, result = _collision_ingest(
+        tmp_path,
+        monkeypatch,
+        _quality(24, 96000, 3000000),
+        _quality(16, 44100, 800000),
+    )
+
+    assert result.changed is True
+    assert destination.read_bytes() == b"candidate-audio"
+    db.close()
+
+
+def test_download_ingest_skips_makedirs_for_an_existing_album_folder(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(
+        "src.file_ingest.os.makedirs",
+        lambda *_args, **_kwargs: pytest.fail("existing folder re-created"),
+    )
+
+    db, _source, destination, result = _collision_ingest(
+        tmp_path,
+        monkeypatch,
+        _quality(24, 96000, 3000000),
+        _quality(16, 44100, 800000),
+    )
+
+    assert result.changed is True
+    assert destination.read_bytes() == b"candidate-audio"
+    db.close()
+
+
+def test_download_ingest_copies_when_hard_links_are_refused(
+    tmp_path, monkeypatch
+):
+    def refuse_link(_source, _destination):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr("src.file_ingest.os.link", refuse_link)
+    db, source, destination, result = _collision_ingest(
+        tmp_path,
+        monkeypatch,
+        _quality(24, 96000, 3000000),
+        _quality(16, 44100, 800000),
+    )
+
+    assert result.changed is True
+    assert destination.read_bytes() == b"candidate-audio"
+    assert not source.exists()
+    assert not list(destination.parent.glob(".*.dapingest-*.tmp"))
+    db.close()
+
+
 def _mbid_duplicate_ingest(
     tmp_path,
     monkeypatch,
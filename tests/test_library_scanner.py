@@ -221,6 +221,123 @@ def test_process_file_skipped_no_mbid(mock_mediafile, scanner):
         assert result == "skipped"
 
 
+def _tagged_media(path):
+    media = MagicMock()
+    media.mb_trackid = os.path.splitext(os.path.basename(path))[0]
+    media.title = os.path.basename(path)
+    media.artist = "Artist"
+    media.albumartist = None
+    media.album = "Album"
+    media.track = 1
+    media.disc = 1
+    media.mb_albumid = "release"
+    media.tracktotal = 3
+    return media
+
+
+@patch('src.library_scanner.MediaFile')
+def test_scan_library_bad_row_costs_only_its_own_file(
+    mock_mediafile,
+    scanner,
+    db,
+    temp_dirs,
+):
+    library = temp_dirs["music_library"]
+    os.makedirs(library)
+    for name in ("good1.flac", "bad.flac", "good2.flac"):
+        open(os.path.join(library, name), "w").close()
+    mock_mediafile.side_effect = _tagged_media
+    real_single = db.add_or_update_track
+
+    def failing_batch(tracks):
+        raise ValueError("unstorable row")
+
+    def failing_single(track):
+        if track.mbid == "bad":
+            raise ValueError("unstorable row")
+        real_single(track)
+
+    with patch.object(db, "add_or_update_tracks", side_effect=failing_batch), \
+         patch.object(db, "add_or_update_track", side_effect=failing_single):
+        scanner.scan_library(library)
+
+    assert db.get_track_by_mbid("good1") is not None
+    assert db.get_track_by_mbid("good2") is not None
+    assert db.get_track_by_mbid("bad") is None
+
+
+@patch('src.library_scanner.MediaFile')
+def test_scan_library_write_error_does_not_mask_the_scan_error(
+    mock_mediafile,
+    scanner,
+    db,
+    temp_dirs,
+):
+    library = temp_dirs["music_library"]
+    os.makedirs(library)
+    for name in ("a.flac", "b.flac"):
+        open(os.path.join(library, name), "w").close()
+    mock_mediafile.side_effect = _tagged_media
+
+    # The first file is buffered; the second stops the scan.
+    with patch.object(
+        scanner,
+        "_cache_album_metadata",
+        side_effect=[None, RuntimeError("scan broke")],
+    ), patch.object(
+        db, "add_or_update_tracks", side_effect=ValueError("write broke")
+    ):
+        with pytest.raises(RuntimeError, match="scan broke"):
+            scanner.scan_library(library)
+
+
+@patch('src.library_scanner.MediaFile')
+def test_scan_library_batches_new_tracks_and_still_logs_duplicates(
+    mock_mediafile,
+    scanner,
+    db,
+    temp_dirs,
+):
+    library = temp_dirs["music_library"]
+    os.makedirs(library)
+    for name in ("a.flac", "b.flac", "c.mp3"):
+        open(os.path.join(library, name), "w").close()
+
+    def media_for(path):
+        media = MagicMock()
+        media.mb_trackid = "dup" if path.endswith(".flac") else "solo"
+        media.title = os.path.basename(path)
+        media.artist = "Artist"
+        media.albumartist = None
+        media.album = "Album"
+        media.track = 1
+        media.disc = 1
+        media.mb_albumid = "release"
+        media.tracktotal = 3
+        return media
+
+    mock_mediafile.side_effect = media_for
+    with patch.object(db, "add_or_update_track") as single, \
+         patch.object(db, "log_duplicates") as group, \
+         patch.object(
+             db, "add_or_update_tracks", wraps=db.add_or_update_tracks
+         ) as batch, \
+         patch.object(
+             db, "log_duplicate_rows", wraps=db.log_duplicate_rows
+         ) as duplicate_rows:
+        scanner.scan_library(library)
+
+    single.assert_not_called()
+    group.assert_not_called()
+    batch.assert_called_once()
+    duplicate_rows.assert_called_once()
+    assert db.get_track_by_mbid("solo") is not None
+    assert db.get_track_by_mbid("dup") is not None
+    assert len(db.get_all_duplicates()["dup"]) == 2
+    assert scanner._pending_tracks is None
+    assert scanner._pending_duplicates == []
+
+
 def test_private_process_file_wrapper_delegates_to_public(scanner):
     with patch.object(scanner, "process_file", return_value="processed") as process:
         assert scanner._process_file("/test/song.flac") == "processed"
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+from src import musicbrainz_client
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_rate_limiter_allows_a_burst_then_holds_the_window_rate(monkeypatch):
+    monkeypatch.setattr(musicbrainz_client, "_MIN_INTERVAL_SEC", 1.0)
+    monkeypatch.setattr(musicbrainz_client, "_BURST", 3)
+    musicbrainz_client.reset_for_tests()
+    clock = _Clock()
+
+    with patch.object(musicbrainz_client.time, "monotonic", clock.monotonic), \
+         patch.object(musicbrainz_client.time, "sleep", clock.sleep):
+        for _ in range(3):
+            musicbrainz_client._wait_for_slot()
+        assert clock.sleeps == []
+
+        clock.now += 1.0
+        musicbrainz_client._wait_for_slot()
+        assert clock.sleeps == [2.0]
+
+        clock.now += 10.0
+        musicbrainz_client._wait_for_slot()
+        assert clock.sleeps == [2.0]
+
+
+def test_user_agent_is_set_once_from_the_loaded_config(monkeypatch):
+    from types import SimpleNamespace
+
+    musicbrainz_client.reset_for_tests()
+    monkeypatch.setattr(
+        musicbrainz_client.ConfigManager,
+        "_instance",
+        SimpleNamespace(contact_email="me@example.com"),
+    )
+
+    with patch.object(
+        musicbrainz_client.musicbrainzngs, "set_useragent"
+    ) as set_useragent:
+        musicbrainz_client._ensure_configured()
+        musicbrainz_client._ensure_configured()
+        musicbrainz_client.configure("other@example.com")
+
+    set_useragent.assert_called_once_with(
+        "DAPManager", "0.1.0", "me@example.com"
+    )
+
+
+def test_burst_of_client_calls_is_not_spaced_by_the_library_limiter():
+    response = (
+        b'<metadata xmlns="http://musicbrainz.org/ns/mmd-2.0#">'
+        b'<recording id="rec"><title>Song</title></recording></metadata>'
+    )
+    sleeps = []
+    musicbrainz_client.reset_for_tests()
+
+    with patch.object(
+        musicbrainz_client.musicbrainzngs.musicbrainz,
+        "_safe_read",
+        return_value=response,
+    ), patch("time.sleep", side_effect=sleeps.append):
+        for _ in range(5):
+            result = musicbrainz_client.get_recording_by_id("rec")
+
+    assert result["recording"]["title"] == "Song"
+    assert sleeps == []
@@ -46,6 +46,19 @@ def test_spotify_client_initialization(mock_musicbrainz, mock_spotify, mock_cred
     assert client.sp is not None
 
 
+@patch('src.spotify_client.get_config')
+@patch('src.spotify_client.SpotifyClientCredentials')
+@patch('src.spotify_client.spotipy.Spotify')
+@patch('src.musicbrainz_client.musicbrainzngs')
+def test_spotify_auth_and_api_share_one_http_session(mock_musicbrainz, mock_spotify, mock_credentials, mock_get_config, db):
+    """Token fetch and API calls reuse the same keep-alive pool."""
+    SpotifyClient(db)
+
+    session = mock_credentials.call_args.kwargs["requests_session"]
+    assert mock_spotify.call_args.kwargs["requests_session"] is session
+    assert session.get_adapter("https://api.spotify.com")._pool_maxsize == 10
+
+
 @patch('src.spotify_client.get_config')
 @patch('src.spotify_client.SpotifyClientCredentials')
 @patch('src.spotify_client.spotipy.Spotify')
@@ -65,7 +78,8 @@ def test_process_playlist_invalid_url(mock_musicbrainz, mock_spotify, mock_crede
 
     client = SpotifyClient(db)
     client.process_playlist("invalid_url")
-    # Should handle invalid URL gracefully without crashing
+    # Malformed URLs are rejected before any Spotify request
+    mock_sp_instance.playlist.assert_not_called()
 
 
 @patch('src.spotify_client.get_config')
@@ -240,3 +254,188 @@ def test_process_track_existing_track(mock_musicbrainz, mock_spotify, mock_crede
     assert updated_track is not None
     assert updated_track.local_path == "/test/path.flac"
     assert updated_track.title == "New Song Name"
+
+
+@patch('src.spotify_client.get_config')
+@patch('src.spotify_client.SpotifyClientCredentials')
+@patch('src.spotify_client.spotipy.Spotify')
+@patch('src.musicbrainz_client.musicbrainzngs')
+def test_process_playlist_skips_tracks_already_linked_at_same_order(mock_musicbrainz, mock_spotify, mock_credentials, mock_get_config, db):
+    """Re-importing an unchanged playlist must not hit MusicBrainz again."""
+    playlist_id = "37i9dQZF1DXcBWIGoYBM5M"
+    db.add_or_update_playlist(Playlist(playlist_id=playlist_id, name="Mix", spotify_url=""))
+    db.save_playlist_tracks(playlist_id, [
+        (Track(mbid="m1", title="A", artist="X", isrc="ISRC1", local_path="/a.flac"), 0),
+    ])
+    client = SpotifyClient(db)
+    client._fetch_playlist_details = MagicMock(return_value=("Mix", [
+        {'track': {'name': 'A', 'artists': [{'name': 'X'}], 'album': {'name': ''},
+                   'external_ids': {'isrc': 'ISRC1'}}},
+    ]))
+
+    client.process_playlist(f"https://open.spotify.com/playlist/{playlist_id}")
+
+    mock_musicbrainz.get_recordings_by_isrc.assert_not_called()
+    assert [t.mbid for t in db.get_playlist_tracks(playlist_id)] == ["m1"]
+
+
+@patch('src.spotify_client.get_config')
+@patch('src.spotify_client.SpotifyClientCredentials')
+@patch('src.spotify_client.spotipy.Spotify')
+@patch('src.musicbrainz_client.musicbrainzngs')
+def test_process_playlist_queues_linked_tracks_missing_locally(mock_musicbrainz, mock_spotify, mock_credentials, mock_get_config, db):
+    """A linked track that is neither on disk nor queued is queued without a lookup."""
+    playlist_id = "37i9dQZF1DXcBWIGoYBM5M"
+    db.add_or_update_playlist(Playlist(playlist_id=playlist_id, name="Mix", spotify_url=""))
+    db.save_playlist_tracks(playlist_id, [
+        (Track(mbid="m1", title="A", artist="X", isrc="ISRC1"), 0),
+    ])
+    client = SpotifyClient(db)
+    client._fetch_playlist_details = MagicMock(return_value=("Mix", [
+        {'track': {'name': 'A', 'artists': [{'name': 'X'}], 'album': {'name': ''},
+                   'external_ids': {'isrc': 'ISRC1'}}},
+    ]))
+    url = f"https://open.spotify.com/playlist/{playlist_id}"
+
+    with patch(
+        "src.download_request.get_config",
+        return_value=SimpleNamespace(is_master=True, master_url=""),
+    ):
+        client.process_playlist(url)
+        client.process_playlist(url)
+
+    mock_musicbrainz.get_recordings_by_isrc.assert_not_called()
+    queued = db.get_downloads("pending")
+    assert [(d.search_query, d.mbid_guess) for d in queued] == [("X - A", "m1")]
+
+
+@patch('src.spotify_client.get_config')
+@patch('src.spotify_client.SpotifyClientCredentials')
+@patch('src.spotify_client.spotipy.Spotify')
+@patch('src.musicbrainz_client.musicbrainzngs')
+def test_import_playlist_stores_tracks_in_bounded_batches(mock_musicbrainz, mock_spotify, mock_credentials, mock_get_config, db, monkeypatch):
+    """Writes are flushed as lookups progress, not after the last one."""
+    monkeypatch.setattr("src.spotify_client._STORE_BATCH_SIZE", 2)
+    client = SpotifyClient(db)
+    client._resolve_track = MagicMock(
+        side_effect=lambda t: Track(mbid=t['name'], title=t['name'], artist="X")
+    )
+    client._store_playlist_tracks = MagicMock()
+    items = [
+        {'track': {'name': f"m{i}", 'external_ids': {'isrc': f"ISRC{i}"}}}
+        for i in range(5)
+    ]
+
+    client._import_playlist("url", "pl1", "Mix", items)
+
+    batches = [
+        [(track.mbid, order) for track, order in c.args[1]]
+        for c in client._store_playlist_tracks.call_args_list
+    ]
+    assert batches == [
+        [("m0", 0), ("m1", 1)],
+        [("m2", 2), ("m3", 3)],
+        [("m4", 4)],
+    ]
+
+
+@patch('src.spotify_client.get_config')
+@patch('src.spotify_client.SpotifyClientCredentials')
+@patch('src.spotify_client.spotipy.Spotify')
+@patch('src.musicbrainz_client.musicbrainzngs')
+def test_spotify_token_is_prefetched_before_first_playlist_call(mock_musicbrainz, mock_spotify, mock_credentials, mock_get_config, db):
+    client = SpotifyClient(db)
+    mock_spotify.return_value.playlist.return_value = {"name": "Mix"}
+    mock_spotify.return_value.playlist_tracks.return_value = {"items": [], "next": None}
+
+    client._fetch_playlist_details("pl1")
+
+    mock_credentials.return_value.get_access_token.assert_called_once_with(as_dict=False)
+    assert client._token_prefetch is None
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://open.spotify.com/playlist/37i9dQZF1DXcBWIGoYBM5M", "37i9dQZF1DXcBWIGoYBM5M"),
+    ("https://open.spotify.com/playlist/37i9dQZF1DXcBWIGoYBM5M?si=abc", "37i9dQZF1DXcBWIGoYBM5M"),
+    ("https://open.spotify.com/intl-de/playlist/37i9dQZF1DXcBWIGoYBM5M", "37i9dQZF1DXcBWIGoYBM5M"),
+    ("https://open.spotify.com/album/37i9dQZF1DXcBWIGoYBM5M", None),
+    ("https://open.spotify.com/playlist/short", None),
+    ("https://open.spotify.com/user/spotify/playlist/37i9dQZF1DXcBWIGoYBM5M", "37i9dQZF1DXcBWIGoYBM5M"),
+    ("https://open.spotify.com/user/spotify/playlist/37i9dQZF1DXcBWIGoYBM5M?si=abc", "37i9dQZF1DXcBWIGoYBM5M"),
+    ("37i9dQZF1DXcBWIGoYBM5M", "37i9dQZF1DXcBWIGoYBM5M"),
+    ("  37i9dQZF1DXcBWIGoYBM5M  ", "37i9dQZF1DXcBWIGoYBM5M"),
+    ("37i9dQZF1DXcBWIGoYBM5M?si=abc", None),
+    ("37i9dQZF1DXcBWIGoYBM5", None),
+    ("https://open.spotify.com/user/spotify/album/37i9dQZF1DXcBWIGoYBM5M", None),
+])
+def test_parse_playlist_id(url, expected):
+    from src.spotify_client import parse_playlist_id
+
+    assert parse_playlist_id(url) == expected
+
+
+@patch('src.spotify_client.get_config')
+@patch('src.spotify_client.SpotifyClientCredentials')
+@patch('src.spotify_client.spotipy.Spotify')
+@patch('src.musicbrainz_client.musicbrainzngs')
+def test_process_playlist_accepts_bare_id_and_stores_share_link(mock_musicbrainz, mock_spotify, mock_credentials, mock_get_config, db):
+    playlist_id = "37i9dQZF1DXcBWIGoYBM5M"
+    client = SpotifyClient(db)
+    client._fetch_playlist_details = MagicMock(return_value=("Mix", [{}]))
+
+    client.process_playlist(playlist_id)
+
+    client._fetch_playlist_details.assert_called_once_with(playlist_id)
+    playlist = db.get_playlist(playlist_id)
+    assert playlist.spotify_url == f"https://open.spotify.com/playlist/{playlist_id}"
+
+
+@patch('src.spotify_client.get_config')
+@patch('src.spotify_client.SpotifyClientCredentials')
+@patch('src.spotify_client.spotipy.Spotify')
+@patch('src.musicbrainz_client.musicbrainzngs')
+def test_get_mbid_from_isrc_memoizes_answers_but_not_errors(mock_musicbrainz, mock_spotify, mock_credentials, mock_get_config, db):
+    import musicbrainzngs as real_mb
+    mock_musicbrainz.WebServiceError = real_mb.WebServiceError
+    mock_musicbrainz.get_recordings_by_isrc.side_effect = [
+        real_mb.WebServiceError("API Error"),
+        {'isrc': {'recording-list': [{'id': 'MBID-1'}]}},
+        {'isrc': {}},
+    ]
+    client = SpotifyClient(db)
+
+    assert client._get_mbid_from_isrc("ISRC1") is None
+    assert client._get_mbid_from_isrc("ISRC1") == "mbid-1"
+    assert client._get_mbid_from_isrc("ISRC1") == "mbid-1"
+    assert client._get_mbid_from_isrc("ISRC2") is None
+    assert client._get_mbid_from_isrc("ISRC2") is None
+
+    assert mock_musicbrainz.get_recordings_by_isrc.call_count == 3
+
+
+@patch('src.spotify_client.get_config')
+@patch('src.spotify_client.SpotifyClientCredentials')
+@patch('src.spotify_client.spotipy.Spotify')
+@patch('src.musicbrainz_client.musicbrainzngs')
+def test_process_playlists_prefetches_details_and_imports_in_order(mock_musicbrainz, mock_spotify, mock_credentials, mock_get_config, db):
+    import threading
+
+    client = SpotifyClient(db)
+    fetch_threads = []
+
+    def fake_fetch(playlist_id):
+        fetch_threads.append(threading.current_thread())
+        return f"Mix {playlist_id[:1]}", []
+
+    client._fetch_playlist_details = MagicMock(side_effect=fake_fetch)
+    client._import_playlist = MagicMock()
+    first = "https://open.spotify.com/playlist/" + "A" * 22
+    second = "https://open.spotify.com/playlist/" + "B" * 22
+
+    assert client.process_playlists([first, " ", "not a url", second]) == 2
+
+    assert [c.args[:3] for c in client._import_playlist.call_args_list] == [
+        (first, "A" * 22, "Mix A"),
+        (second, "B" * 22, "Mix B"),
+    ]
+    assert threading.current_thread() not in fetch_threads
@@ -29,7 +29,9 @@ def _pending_tracks(count: int) -> list[Track]:
 def _syncer_with_tracks(count: int) -> EnhancedDapSyncer:
     syncer = EnhancedDapSyncer.__new__(EnhancedDapSyncer)
     syncer.db = MagicMock()
-    syncer.db.get_all_tracks.return_value = _pending_tracks(count)
+    syncer.db.iter_all_tracks.side_effect = (
+        lambda **_: iter(_pending_tracks(count))
+    )
     syncer._convert_and_copy = MagicMock()
     return syncer
 
@@ -248,3 +250,159 @@ def test_manager_registry_covers_the_stable_menu_and_selective_prompt():
         "flac",
         artist_filter="Massive Attack",
     )
+
+
+def test_fast_rmtree_removes_nested_tree_and_counts_files(tmp_path):
+    import manager
+
+    root = tmp_path / "Music"
+    (root / "F00").mkdir(parents=True)
+    (root / "F01" / "deep").mkdir(parents=True)
+    (root / "F00" / "a.flac").write_bytes(b"a")
+    (root / "F01" / "b.flac").write_bytes(b"b")
+    (root / "F01" / "deep" / "c.flac").write_bytes(b"c")
+    (root / "top.m3u").write_text("")
+
+    assert manager._fast_rmtree(str(root)) == 4
+    assert not root.exists()
+
+
+def test_menu_choice_reads_one_line_and_reports_eof(monkeypatch, capsys):
+    import io
+
+    import manager
+
+    monkeypatch.setattr("sys.stdin", io.StringIO(" 7 \n"))
+    assert manager.read_menu_choice() == "7"
+    assert manager.read_menu_choice() is None
+    assert capsys.readouterr().out.count("Enter your choice (1-14): ") == 2
+
+
+def test_conversion_format_accepts_digits_and_names_with_flac_default():
+    import manager
+
+    answers = ["3", " AAC ", "", "5", "wav", "²"]
+    with patch("builtins.input", side_effect=answers), patch("builtins.print"):
+        chosen = [manager.get_conversion_format() for _ in answers]
+
+    assert chosen == ["opus", "aac", "flac", "flac", "flac", "flac"]
+
+
+def test_clean_dap_music_confirms_before_deleting_and_reports_count(tmp_path, capsys):
+    import manager
+
+    music = tmp_path / "Music" / "F00"
+    music.mkdir(parents=True)
+    (music / "a.flac").write_bytes(b"a")
+    (music / "b.flac").write_bytes(b"b")
+    config = {"dap_mount_point": str(tmp_path), "dap_music_dir_name": "Music"}
+
+    with patch("builtins.input", return_value="no"):
+        manager.clean_dap_music(None, config)
+    assert (music / "a.flac").exists()
+
+    with patch("builtins.input", return_value="DELETE"):
+        manager.clean_dap_music(None, config)
+
+    assert "Deleted 2 files from DAP" in capsys.readouterr().out
+    assert list((tmp_path / "Music").iterdir()) == []
+
+
+def test_sync_stats_prints_size_estimates_per_format(capsys):
+    import manager
+
+    db = MagicMock()
+    db.get_sync_stats.return_value = {
+        "total_tracks": 4,
+        "synced_tracks": 0,
+        "pending_tracks": 4,
+        "sync_percentage": 0.0,
+        "total_playlists": 1,
+    }
+
+    manager.show_sync_stats(db)
+
+    out = capsys.readouterr().out
+    assert "  FLAC:  ~140 MB (0.1 GB)\n" in out
+    assert "  MP3:   ~40 MB (0.0 GB)\n" in out
+    assert "  Opus:  ~20 MB (0.0 GB)\n" in out
+
+
+def test_fast_rmtree_unlinks_serially_off_posix(tmp_path, monkeypatch):
+    import manager
+
+    root = tmp_path / "Music"
+    (root / "F00").mkdir(parents=True)
+    (root / "F00" / "a.flac").write_bytes(b"a")
+    (root / "b.flac").write_bytes(b"b")
+    monkeypatch.setattr(manager.os, "name", "nt")
+    monkeypatch.setattr(
+        manager, "ThreadPoolExecutor", MagicMock(side_effect=AssertionError)
+    )
+
+    assert manager._fast_rmtree(str(root)) == 2
+    assert not root.exists()
+
+
+def test_log_section_emits_one_banner_record(caplog):
+    import manager
+
+    with caplog.at_level("INFO", logger=manager.logger.name):
+        manager._log_section("Selective Sync")
+
+    assert [r.getMessage() for r in caplog.records] == [
+        f"{manager._RULE}\nSelective Sync\n{manager._RULE}"
+    ]
+
+
+def test_maintenance_handlers_log_their_banner(monkeypatch):
+    import manager
+
+    sections = []
+    monkeypatch.setattr(manager, "_log_section", sections.append)
+    monkeypatch.setattr(manager, "DatabaseManager", MagicMock())
+    monkeypatch.setattr(manager, "clean_dap_music", MagicMock())
+    monkeypatch.setattr(manager, "reconcile_dap", MagicMock())
+    monkeypatch.setattr(
+        "src.clear_dupes.find_and_resolve_duplicates", MagicMock()
+    )
+    monkeypatch.setattr("builtins.print", lambda *_args, **_kwargs: None)
+    context = SimpleNamespace(db_path=":memory:", config=SimpleNamespace(_config={}))
+
+    for choice in ("7", "8", "9", "14"):
+        manager.COMMAND_HANDLERS[choice](context)
+
+    assert sections == [
+        "Cleaning DAP Music Directory",
+        "Reconciling DAP Files",
+        "Clearing Duplicates",
+        "Exiting DAP Manager",
+    ]
+
+
+def test_menu_error_banner_is_one_error_record(monkeypatch, caplog):
+    import manager
+
+    def failing_handler(_context):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(
+        manager,
+        "get_config",
+        lambda: SimpleNamespace(contact_email="", db_path=":memory:", music_library="/music"),
+    )
+    monkeypatch.setattr("src.musicbrainz_client.configure", lambda _email: None)
+    monkeypatch.setitem(manager.COMMAND_HANDLERS, "1", failing_handler)
+    monkeypatch.setattr(manager, "print_menu", lambda: None)
+    choices = iter(["1", None])
+    monkeypatch.setattr(manager, "read_menu_choice", lambda: next(choices))
+    monkeypatch.setattr("builtins.input", lambda _prompt="": "")
+    monkeypatch.setattr("builtins.print", lambda *_args, **_kwargs: None)
+
+    with caplog.at_level("ERROR", logger=manager.logger.name):
+        manager.main()
+
+    assert [r.getMessage() for r in caplog.records][:2] == [
+        f"{manager._RULE}\nAN ERROR OCCURRED\n{manager._RULE}",
+        "Error: boom",
+    ]
@@ -1226,3 +1226,66 @@ def test_read_current_tags_returns_values_after_write(tmp_path):
     assert tags["artist"] == "A"
     assert tags["album"] == "B"
     assert tags["mbid"] == "m1"
+
+
+def test_fingerprint_is_reused_until_the_file_changes(tmp_path):
+    import os
+
+    path = tmp_path / "song.flac"
+    path.write_bytes(b"audio")
+
+    with patch(
+        "src.tag_service.acoustid.fingerprint_file",
+        side_effect=[(1.0, "FP1"), (2.0, "FP2")],
+    ) as fingerprint:
+        assert tag_service._fingerprint_file(str(path)) == (1.0, "FP1")
+        assert tag_service._fingerprint_file(str(path)) == (1.0, "FP1")
+        path.write_bytes(b"re-encoded audio")
+        os.utime(path, ns=(1, 1))
+        assert tag_service._fingerprint_file(str(path)) == (2.0, "FP2")
+
+    assert fingerprint.call_count == 2
+
+
+def test_prefetch_fingerprints_seeds_the_cache_in_one_batch(tmp_path):
+    paths = []
+    for name in ("a.flac", "b.flac", "c.flac"):
+        path = tmp_path / name
+        path.write_bytes(name.encode())
+        paths.append(str(path))
+
+    def fingerprint(path):
+        if path.endswith("c.flac"):
+            raise RuntimeError("decode failed")
+        return (1.0, os.path.basename(path))
+
+    with patch(
+        "src.tag_service.acoustid.fingerprint_file",
+        side_effect=fingerprint,
+    ) as fingerprint_file:
+        assert tag_service.prefetch_fingerprints(paths + paths[:1]) == 2
+        assert fingerprint_file.call_count == 3
+        assert tag_service._fingerprint_file(paths[1]) == (1.0, "b.flac")
+        assert fingerprint_file.call_count == 3
+        assert tag_service.prefetch_fingerprints(paths[:2]) == 0
+
+
+def test_release_lookups_are_reused_across_an_album():
+    release = {"release": {"id": "rel-1"}}
+
+    with patch(
+        "src.tag_service.mb.get_release_by_id",
+        side_effect=[RuntimeError("mb down"), release, {"release": {}}],
+    ) as get_release:
+        with pytest.raises(RuntimeError):
+            tag_service._get_release("rel-1")
+        assert tag_service._get_release("rel-1") is release
+        assert tag_service._get_release("rel-1") is release
+        assert get_release.call_count == 2
+
+        tag_service.clear_release_cache()
+        assert tag_service._get_release("rel-1") == {"release": {}}
+
+    get_release.assert_called_with(
+        "rel-1", includes=["artists", "recordings", "release-groups"]
+    )
@@ -217,6 +217,29 @@ def test_reload_runtime_config_owns_scheduler_dependency_policy(monkeypatch):
     maintenance_restart.assert_called_once_with(run_on_startup=False)
 
 
+def test_reload_runtime_config_adopts_written_values_when_supported(
+    monkeypatch,
+):
+    monkeypatch.setattr(config_service.ConfigManager, "_instance", None)
+    runtime = object.__new__(config_service.ConfigManager)
+    runtime.load_values = Mock()
+    runtime._load_config = Mock()
+
+    reload_runtime_config(
+        runtime,
+        (),
+        start_sync_scheduler=Mock(),
+        start_release_watcher=Mock(),
+        start_library_maintenance_scheduler=Mock(),
+        values={"contact_email": "me@example.com"},
+    )
+
+    runtime.load_values.assert_called_once_with(
+        {"contact_email": "me@example.com"}
+    )
+    runtime._load_config.assert_not_called()
+
+
 def test_media_proxy_headers_forward_only_allowed_values_and_authenticate():
     assert build_upstream_headers(
         {
@@ -333,10 +356,12 @@ def test_web_album_completion_wrapper_returns_pipeline_outcome(monkeypatch):
         "library.db",
         config,
         run_downloads=True,
+        refresh_tracklists=True,
     )
 
     assert result is outcome
     assert pipeline.call_args.kwargs["run_downloads"] is True
+    assert pipeline.call_args.kwargs["refresh_tracklists"] is True
 
 
 def test_task_manager_rejects_overlapping_work():
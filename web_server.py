@@ -318,10 +318,7 @@ def run_queue_playlists(db_path, conf, urls):
     """Queue multiple Spotify playlists for download."""
     from src.spotify_client import SpotifyClient
     with DatabaseManager(db_path) as db:
-        spot_client = SpotifyClient(db)
-        for url in urls:
-            if url.strip():
-                spot_client.process_playlist(url)
+        SpotifyClient(db).process_playlists(urls)
 
 
 def run_audit(db_path):
@@ -367,12 +364,19 @@ def build_suggestion_items(raw_items):
     return download_discovery_service.build_suggestion_items(raw_items)
 
 
-def run_complete_albums(db_path, conf, run_downloads=False, progress_callback=None):
+def run_complete_albums(
+    db_path,
+    conf,
+    run_downloads=False,
+    refresh_tracklists=False,
+    progress_callback=None,
+):
     """Run the full album completion pipeline, optionally followed by downloads."""
     return album_task_service.run_album_completion_pipeline(
         db_path=db_path,
         config_values=conf._config,
         run_downloads=run_downloads,
+        refresh_tracklists=refresh_tracklists,
         progress_callback=progress_callback,
         database_factory=DatabaseManager,
         complete_albums=complete_albums_logic,
@@ -760,6 +764,7 @@ def update_config():
             start_library_maintenance_scheduler=(
                 _start_library_maintenance_scheduler
             ),
+            values=current,
         )
     except Exception as e:
         logger.warning(f"Config written but in-process reload failed: {e}")
@@ -3058,12 +3063,13 @@ def audit_details():
     mbid = request.args.get("mbid")
     if not mbid:
         return jsonify({"success": False, "message": "MBID required"})
+    refresh = request.args.get("refresh", "").lower() in ("1", "true", "yes")
 
     try:
         from src.album_completer import get_missing_tracks_for_album
 
         with DatabaseManager(config.db_path) as db:
-            result = get_missing_tracks_for_album(db, mbid)
+            result = get_missing_tracks_for_album(db, mbid, refresh=refresh)
 
         return jsonify({"success": True, "data": result})
     except Exception as e:
@@ -3100,17 +3106,18 @@ def complete_albums():
     """
     Full album completion pipeline: discover albums, find gaps, queue missing tracks.
     Optional: run the downloader afterward.
-    POST body: { "run_downloads": bool }
+    POST body: { "run_downloads": bool, "refresh_tracklists": bool }
     """
     if not task_manager:
         return jsonify({"success": False, "message": "Not initialized"})
 
     data = request.json or {}
     run_downloads = data.get("run_downloads", False)
+    refresh_tracklists = bool(data.get("refresh_tracklists", False))
 
     success, msg = task_manager.start_task(
         run_complete_albums,
-        (config.db_path, config, run_downloads),
+        (config.db_path, config, run_downloads, refresh_tracklists),
         "Album Completion",
     )
     return jsonify({"success": success, "message": msg})